@@ -51,6 +51,14 @@ from pybinbot.shared.enums import (
 from pybinbot.shared.indicators import Indicators
 from pybinbot.shared.candles import Candles
 from pybinbot.shared.heikin_ashi import HeikinAshi
+from pybinbot.shared.incremental import IncrementalIndicators
+from pybinbot.shared.panel import IndicatorPanel
+from pybinbot.shared.pipeline import IndicatorPipeline
+from pybinbot.shared.candle_store import CandleBuffer, CandleStore
+from pybinbot.shared.resampler import MultiTimeframeResampler
+from pybinbot.shared.history_store import HistoricalCandleStore
+from pybinbot.shared.validation import ValidationMode, ValidationPolicy
+from pybinbot.shared.scheduler import Priority, RequestScheduler
 from pybinbot.shared.logging_config import configure_logging
 from pybinbot.shared.types import Amount, CombinedApis
 from pybinbot.shared.cache import cache
@@ -127,6 +135,7 @@ from pybinbot.models.derivatives import (
     OpenInterestHistoryResponse,
 )
 from pybinbot.apis.binance.base import BinanceApi
+from pybinbot.apis.binance.async_base import AsyncBinanceApi
 from pybinbot.apis.binbot.base import BinbotApi
 from pybinbot.apis.binbot.exceptions import (
     BinbotErrors,
@@ -151,6 +160,7 @@ from pybinbot.apis.binance.exceptions import (
     BinanceErrors,
     InvalidSymbol,
     NotEnoughFunds,
+    RateLimited,
 )
 from pybinbot.streaming.binance.async_socket_client import (
     AsyncSpotWebsocketStreamClient,
@@ -257,6 +267,17 @@ __all__ = [
     "Indicators",
     "Candles",
     "HeikinAshi",
+    "IncrementalIndicators",
+    "IndicatorPanel",
+    "IndicatorPipeline",
+    "CandleBuffer",
+    "CandleStore",
+    "MultiTimeframeResampler",
+    "HistoricalCandleStore",
+    "ValidationMode",
+    "ValidationPolicy",
+    "Priority",
+    "RequestScheduler",
     # enums
     "CloseConditions",
     "DealType",
@@ -283,6 +304,7 @@ __all__ = [
     "CoinGecko",
     "BinbotApi",
     "BinanceApi",
+    "AsyncBinanceApi",
     "KucoinApi",
     "KucoinErrors",
     "KucoinRest",
@@ -293,6 +315,7 @@ __all__ = [
     "BinanceErrors",
     "InvalidSymbol",
     "NotEnoughFunds",
+    "RateLimited",
     "BinbotErrors",
     "QuantityTooLow",
     "IsolateBalanceError",
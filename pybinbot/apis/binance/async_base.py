@@ -0,0 +1,591 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from decimal import Decimal
+from time import monotonic
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from requests import HTTPError
+from yarl import URL
+from pybinbot.shared.handlers import aio_handle_binance_errors
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.pagination import (
+    fetch_klines_range_async,
+    interval_to_ms,
+    klines_frame,
+)
+from pybinbot.shared.rate_limit import request_cost
+from pybinbot.shared.scheduler import binance_lane, current_lane
+from pybinbot.apis.binbot.exceptions import IsolateBalanceError
+from pybinbot.apis.binance.base import (
+    TIMESTAMP_OUTSIDE_RECV_WINDOW,
+    BinanceEndpoints,
+)
+from pybinbot.apis.binance.exceptions import BinanceErrors
+from pybinbot.models.derivatives import (
+    BinanceFundingRate,
+    BinanceFundingRatesResponse,
+)
+
+
+class AsyncBinanceApi(BinanceEndpoints):
+    """
+    asyncio Binance client on aiohttp, with the same methods as
+    ``BinanceApi`` as coroutines.
+
+    All requests go through one ``ClientSession`` (keep-alive connection
+    pool, DNS cache), created on first use or passed in to share it between
+    clients. Close it with ``aclose`` or use the client as an async context
+    manager::
+
+        async with AsyncBinanceApi(key, secret) as api:
+            prices = await asyncio.gather(
+                *(api.get_ticker_price(symbol) for symbol in symbols)
+            )
+
+    Errors are mapped like ``handle_binance_errors``, and the weight budget
+    and server clock are the same as the sync client's.
+    """
+
+    connection_limit = 64
+    connection_limit_per_host = 32
+    dns_cache_ttl = 300
+    timeout = ClientTimeout(sock_connect=5, sock_read=30)
+
+    def __init__(self, key, secret, session: ClientSession | None = None) -> None:
+        super().__init__(key, secret)
+        self._session = session
+        self._owns_session = session is None
+        self._ticker_cache: tuple[float, float] | None = None
+
+    @property
+    def session(self) -> ClientSession:
+        """Shared ``aiohttp.ClientSession``, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit_per_host,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                ),
+                timeout=self.timeout,
+            )
+            self._owns_session = True
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the session, unless it was passed in by the caller."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncBinanceApi":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        url,
+        method="GET",
+        session: ClientSession | None = None,
+        payload: dict | None = None,
+        **kwargs,
+    ):
+        """
+        Standard request
+        - No signed
+        - No authorization
+        """
+        weight, orders = request_cost(method, url, kwargs.get("params"))
+        if self.scheduler is None:
+            return await self._send(
+                url, method, session, payload, weight, orders, **kwargs
+            )
+        return await self.scheduler.run_async(
+            current_lane(binance_lane(method, url)),
+            weight,
+            self._send,
+            url,
+            method,
+            session,
+            payload,
+            weight,
+            orders,
+            **kwargs,
+        )
+
+    async def _send(self, url, method, session, payload, weight, orders, **kwargs):
+        self.weight_budget.check(weight, orders)
+        if payload is not None:
+            kwargs["json"] = payload
+        async with (session or self.session).request(
+            method=method, url=url, **kwargs
+        ) as res:
+            self.weight_budget.observe(res.headers, res.status)
+            return await aio_handle_binance_errors(res)
+
+    async def get_server_time(self):
+        data = await self.request(url=self.server_time_url)
+        return data["serverTime"]
+
+    async def signed_request(self, url, method="GET", payload: dict = {}) -> dict:
+        """
+        USER_DATA, TRADE signed requests, see ``BinanceApi.signed_request``
+        """
+        try:
+            return await self._signed_request(url, method, payload)
+        except BinanceErrors as error:
+            if error.code != TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                raise
+            self.server_clock.invalidate()
+            return await self._signed_request(url, method, payload)
+
+    async def _signed_request(self, url, method, payload: dict) -> dict:
+        timestamp = await self.server_clock.now_ms_async(self.get_server_time)
+        # Already encoded and signed: aiohttp must not requote the query
+        signed_url = URL(self.sign_url(url, payload, timestamp), encoded=True)
+        return await self.request(signed_url, method, headers=self.api_key_headers())
+
+    async def get_listen_key(self):
+        """
+        Get user data websocket stream
+        """
+        response = await self.request(
+            self.user_data_stream, method="POST", headers=self.api_key_headers()
+        )
+        return response["listenKey"]
+
+    """
+    No security endpoints
+    """
+
+    async def exchange_info(self, symbol=None):
+        """
+        High weight endpoint, see ``BinanceApi.exchange_info``
+        """
+        params = {}
+        if symbol:
+            params["symbol"] = symbol
+        return await self.request(url=f"{self.exchangeinfo_url}", params=params)
+
+    async def _symbol_filter(self, symbol, filter_type: str) -> dict:
+        symbols = await self.exchange_info(symbol)
+        market = symbols["symbols"][0]
+        return next(m for m in market["filters"] if m["filterType"] == filter_type)
+
+    async def price_filter_by_symbol(self, symbol, filter_limit):
+        """
+        PRICE_FILTER restrictions from /exchangeinfo
+        """
+        price_filter = await self._symbol_filter(symbol, "PRICE_FILTER")
+        return price_filter[filter_limit].rstrip(".0")
+
+    async def lot_size_by_symbol(self, symbol, lot_size_limit):
+        """
+        LOT_SIZE (quantity) restrictions from /exchangeinfo
+        """
+        quantity_filter = await self._symbol_filter(symbol, "LOT_SIZE")
+        return quantity_filter[lot_size_limit].rstrip(".0")
+
+    async def min_notional_by_symbol(self, symbol, min_notional_limit="minNotional"):
+        """
+        MIN_NOTIONAL (price x quantity) restrictions from /exchangeinfo
+        @deprecated
+        """
+        min_notional_filter = await self._symbol_filter(symbol, "NOTIONAL")
+        return min_notional_filter[min_notional_limit]
+
+    async def _calculate_price_precision(self, symbol) -> int:
+        """
+        Decimals needed for Binance price
+        @deprecated - use calculate_price_precision
+        """
+        tick_size = await self.price_filter_by_symbol(symbol, "tickSize")
+        return int(-1 * Decimal(str(tick_size)).as_tuple().exponent)
+
+    async def _calculate_qty_precision(self, symbol) -> int:
+        """
+        Decimals needed for Binance quantity
+        @deprecated - use calculate_qty_precision
+        """
+        step_size = await self.lot_size_by_symbol(symbol, "stepSize")
+        return int(-1 * Decimal(str(step_size)).as_tuple().exponent)
+
+    async def ticker_24(self, type: str = "FULL", symbol: str | None = None):
+        """
+        Weight 40 without symbol
+        """
+        params = {"type": type}
+        if symbol:
+            params["symbol"] = symbol
+        return await self.request(url=self.ticker24_url, params=params)
+
+    async def get_ticker_price(self, symbol: str) -> float:
+        data = await self.request(
+            url=f"{self.ticker_price_url}", params={"symbol": symbol}
+        )
+        return float(data["price"])
+
+    async def get_futures_funding_rates(self) -> list[BinanceFundingRate]:
+        data = await self.request(url=self.futures_premium_index_url)
+        response = BinanceFundingRatesResponse.model_validate(data)
+        return response.root
+
+    async def get_ui_klines(
+        self, symbol, interval, limit=500, start_time=None, end_time=None
+    ):
+        """
+        Get raw klines
+        """
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "limit": limit,
+        }
+        if start_time:
+            params["startTime"] = start_time
+        if end_time:
+            params["endTime"] = end_time
+        return await self.request(url=self.candlestick_url, params=params)
+
+    async def get_klines_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        max_workers: int = 4,
+    ):
+        """
+        Klines with open times in ``[start_ms, end_ms)`` of any length, see
+        ``BinanceApi.get_klines_range``. *max_workers* bounds the pages
+        requested at once.
+        """
+
+        async def fetch_page(start: int, end: int) -> list:
+            await self.weight_budget.acquire_async(self.klines_weight)
+            try:
+                return await self.get_ui_klines(
+                    symbol,
+                    interval,
+                    limit=self.klines_page_size,
+                    start_time=start,
+                    # endTime is inclusive
+                    end_time=end - 1,
+                )
+            finally:
+                self.weight_budget.release(self.klines_weight)
+
+        rows = await fetch_klines_range_async(
+            fetch_page,
+            start_ms,
+            end_ms,
+            interval_to_ms(interval),
+            self.klines_page_size,
+            max_workers,
+        )
+        return klines_frame(ExchangeId.BINANCE, rows)
+
+    async def fetch_klines_many(
+        self,
+        symbols: Iterable[str],
+        interval: str,
+        limit: int = 500,
+        start_time=None,
+        end_time=None,
+        max_workers: int = 16,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[str, list | Exception]]:
+        """
+        Fetch raw klines for many symbols concurrently, see
+        ``BinanceApi.fetch_klines_many``. Iterate with ``async for``.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(symbol: str) -> tuple[str, list | Exception]:
+            async with semaphore:
+                await self.weight_budget.acquire_async(self.klines_weight)
+                try:
+                    klines = await self.get_ui_klines(
+                        symbol,
+                        interval,
+                        limit,
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
+                    return symbol, klines
+                except Exception as error:
+                    return symbol, error
+                finally:
+                    self.weight_budget.release(self.klines_weight)
+
+        tasks = [asyncio.ensure_future(fetch(symbol)) for symbol in symbols]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                symbol, result = await next_done
+                if isinstance(result, Exception) and not return_exceptions:
+                    raise result
+                yield symbol, result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    """
+    USER_DATA endpoints
+    """
+
+    async def get_account_balance(self):
+        """
+        Get account balance
+        """
+        payload = {"omitZeroBalances": "true"}
+        return await self.signed_request(self.account_url, payload=payload)
+
+    async def get_wallet_balance(self):
+        """
+        Balance by wallet (SPOT, FUNDING, CROSS MARGIN...)
+        """
+        return await self.signed_request(self.wallet_balance_url)
+
+    async def cancel_margin_order(self, symbol: str, order_id: int):
+        return await self.signed_request(
+            self.margin_order,
+            method="DELETE",
+            payload={"symbol": symbol, "orderId": str(order_id)},
+        )
+
+    async def enable_isolated_margin_account(self, symbol):
+        return await self.signed_request(
+            self.isolated_account_url, method="POST", payload={"symbol": symbol}
+        )
+
+    async def disable_isolated_margin_account(self, symbol):
+        """
+        Very high weight, use as little as possible
+        """
+        return await self.signed_request(
+            self.isolated_account_url, method="DELETE", payload={"symbol": symbol}
+        )
+
+    async def get_isolated_account(self, symbol):
+        """
+        Request weight: 10(IP)
+        """
+        return await self.signed_request(
+            self.isolated_account_url, payload={"symbol": symbol}
+        )
+
+    async def transfer_isolated_margin_to_spot(self, asset, symbol, amount):
+        return await self.signed_request(
+            self.margin_isolated_transfer_url,
+            method="POST",
+            payload={
+                "transFrom": "ISOLATED_MARGIN",
+                "transTo": "SPOT",
+                "asset": asset,
+                "symbol": symbol,
+                "amount": amount,
+            },
+        )
+
+    async def transfer_spot_to_isolated_margin(
+        self, asset: str, symbol: str, amount: float
+    ):
+        return await self.signed_request(
+            self.margin_isolated_transfer_url,
+            method="POST",
+            payload={
+                "transFrom": "SPOT",
+                "transTo": "ISOLATED_MARGIN",
+                "asset": asset,
+                "symbol": symbol,
+                "amount": str(amount),
+            },
+        )
+
+    async def create_margin_loan(self, asset, symbol, amount, isIsolated=True):
+        return await self.signed_request(
+            self.loan_record_url,
+            method="POST",
+            payload={
+                "asset": asset,
+                "symbol": symbol,
+                "amount": amount,
+                "isIsolated": "TRUE" if isIsolated else "FALSE",
+                "type": "BORROW",
+            },
+        )
+
+    async def get_max_borrow(self, asset, isolated_symbol: str | None = None):
+        return await self.signed_request(
+            self.max_borrow_url,
+            payload={"asset": asset, "isolatedSymbol": isolated_symbol},
+        )
+
+    async def get_margin_loan_details(self, loan_id: int, symbol: str):
+        return await self.signed_request(
+            self.loan_record_url,
+            payload={
+                "txId": loan_id,
+                "type": "BORROW",
+                "isolatedSymbol": symbol,
+            },
+        )
+
+    async def get_repay_details(self, loan_id: int, symbol: str):
+        return await self.signed_request(
+            self.loan_record_url,
+            payload={
+                "txId": loan_id,
+                "type": "REPAY",
+                "isolatedSymbol": symbol,
+            },
+        )
+
+    async def repay_margin_loan(
+        self, asset: str, symbol: str, amount: float | int, isIsolated: str = "TRUE"
+    ):
+        return await self.signed_request(
+            self.loan_record_url,
+            method="POST",
+            payload={
+                "asset": asset,
+                "isIsolated": isIsolated,
+                "symbol": symbol,
+                "amount": amount,
+                "type": "REPAY",
+            },
+        )
+
+    async def manual_liquidation(self, symbol: str):
+        """
+        Not supported in region
+        """
+        return await self.signed_request(
+            self.manual_liquidation_url,
+            method="POST",
+            payload={
+                "symbol": symbol,
+                "type": "ISOLATED",
+            },
+        )
+
+    async def get_interest_history(self, asset: str, symbol: str):
+        return await self.signed_request(
+            self.interest_history_url,
+            payload={"asset": asset, "isolatedSymbol": symbol},
+        )
+
+    async def get_isolated_balance(self, symbol=None) -> list:
+        """
+        Get balance of Isolated Margin account
+        """
+        payload = {}
+        if symbol:
+            payload["symbols"] = [symbol]
+        info = await self.signed_request(url=self.isolated_account_url, payload=payload)
+        return info["assets"]
+
+    async def get_isolated_balance_total(self):
+        """
+        Get total net asset of the Isolated Margin account in BTC
+        """
+        info = await self.signed_request(url=self.isolated_account_url, payload={})
+        assets = info["totalNetAssetOfBtc"]
+        if len(assets) == 0:
+            raise IsolateBalanceError(
+                "Hit symbol 24hr restriction or not available (requires transfer in)"
+            )
+        return assets
+
+    async def transfer_dust(self, assets: list[str]):
+        """
+        Transform small balances to BNB
+        """
+        return await self.signed_request(
+            url=self.dust_transfer_url,
+            method="POST",
+            payload={"asset": ",".join(assets)},
+        )
+
+    async def query_open_orders(self, symbol):
+        """
+        Get current open orders, IP Weight: 20
+        """
+        return await self.signed_request(self.open_orders, payload={"symbol": symbol})
+
+    async def get_all_orders(
+        self, symbol, order_id: str | None = None, start_time=None
+    ):
+        """
+        Get all orders given symbol and order_id or start_time, IP Weight: 20
+        """
+        if order_id:
+            return await self.signed_request(
+                self.all_orders_url, payload={"symbol": symbol, "orderId": order_id}
+            )
+
+        elif start_time:
+            return await self.signed_request(
+                self.all_orders_url, payload={"symbol": symbol, "startTime": start_time}
+            )
+
+        else:
+            raise ValueError(
+                "At least one of order_id or (start_time and end_time) must be sent"
+            )
+
+    async def delete_opened_order(self, symbol, order_id):
+        """
+        Cancel single order
+        """
+        return await self.signed_request(
+            self.order_url,
+            method="DELETE",
+            payload={"symbol": symbol, "orderId": order_id},
+        )
+
+    async def get_book_depth(self, symbol: str) -> dict:
+        """
+        Get order book for a given symbol
+        """
+        return await self.request(url=f"{self.order_book_url}?symbol={symbol}")
+
+    async def get_user_asset(self, asset: str, need_btc_valuation: bool = False):
+        """
+        Get user asset
+        """
+        return await self.signed_request(
+            url=self.user_asset_url,
+            method="POST",
+            payload={"asset": asset, "needBtcValuation": need_btc_valuation},
+        )
+
+    async def ticker_24_pct_change(
+        self, symbol: str = "BTCUSDC", type: str = "FULL"
+    ) -> float:
+        """24h price change percentage of *symbol*."""
+        data = await self.ticker_24(type=type, symbol=symbol)
+        try:
+            return float(data["priceChangePercent"])
+        except Exception as e:
+            raise RuntimeError(f"Failed to get last price for {symbol}: {e}")
+
+    async def ticker_24_last_price_cached(self, ttl_seconds: int = 3600) -> float:
+        """``ticker_24_pct_change`` of BTCUSDC cached for *ttl_seconds*."""
+        now = monotonic()
+        if self._ticker_cache is not None and now < self._ticker_cache[0]:
+            return self._ticker_cache[1]
+        value = await self.ticker_24_pct_change(symbol="BTCUSDC", type="FULL")
+        self._ticker_cache = (now + max(0, int(ttl_seconds)), value)
+        return value
+
+    async def get_tags(self, symbol: str) -> dict:
+        """
+        Get tags for a specific symbol.
+        """
+        response = await self.request(self.tags_url, params={"symbol": symbol})
+        if response["success"]:
+            return response["data"]
+        raise HTTPError(response["message"], response=response)
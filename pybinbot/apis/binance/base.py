@@ -1,22 +1,44 @@
 import hashlib
 import hmac
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from decimal import Decimal
 from random import randrange
+from threading import Lock
 from urllib.parse import urlencode
-from requests import Session, request, HTTPError
+from requests import Session, HTTPError
+from requests.adapters import HTTPAdapter
 from pybinbot.shared.handlers import handle_binance_errors
 from pybinbot.shared.cache import cache
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.pagination import (
+    fetch_klines_range,
+    interval_to_ms,
+    klines_frame,
+)
+from pybinbot.shared.rate_limit import WeightBudget, request_cost
+from pybinbot.shared.scheduler import RequestScheduler, binance_lane, current_lane
 from pybinbot.apis.binbot.exceptions import IsolateBalanceError
+from pybinbot.apis.binance.clock import ServerClock
+from pybinbot.apis.binance.exceptions import BinanceErrors
 from pybinbot.models.derivatives import (
     BinanceFundingRate,
     BinanceFundingRatesResponse,
 )
 
 
-class BinanceApi:
+# Binance "Timestamp for this request is outside of the recvWindow"
+TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+
+
+class BinanceEndpoints:
     """
     Binance API URLs
     https://binance.github.io/binance-api-swagger/
+
+    Shared by ``BinanceApi`` and ``AsyncBinanceApi``, together with the
+    weight budget and request signing.
     """
 
     api_servers = [
@@ -73,10 +95,93 @@ class BinanceApi:
     interest_history_url = f"{BASE}/sapi/v1/margin/interestHistory"
     manual_liquidation_url = f"{BASE}/sapi/v1/margin/manual-liquidation"
 
+    # Request weight is counted per IP, so the budget is shared by instances
+    weight_budget = WeightBudget()
+    klines_weight = 2
+    klines_page_size = 1000
+    # Optional priority lanes in front of every request, e.g.
+    # BinanceApi.scheduler = RequestScheduler(BinanceApi.weight_budget)
+    scheduler: RequestScheduler | None = None
+    # The clock offset is a property of the host, so one clock per server
+    # time URL is shared by instances; an instance may set its own instead
+    _server_clocks: dict[str, ServerClock] = {}
+    _server_clocks_lock = Lock()
+    _server_clock: ServerClock | None = None
+
     def __init__(self, key, secret) -> None:
         self.secret: str = secret
         self.key: str = key
-        pass
+
+    @property
+    def server_clock(self) -> ServerClock:
+        """Server clock offset used to timestamp signed requests."""
+        if self._server_clock is not None:
+            return self._server_clock
+        with self._server_clocks_lock:
+            clock = self._server_clocks.get(self.server_time_url)
+            if clock is None:
+                clock = self._server_clocks[self.server_time_url] = ServerClock()
+            return clock
+
+    def api_key_headers(self) -> dict[str, str]:
+        return {"Content-Type": "application/json", "X-MBX-APIKEY": self.key}
+
+    def sign_url(self, url: str, payload: dict, timestamp: int) -> str:
+        """*url* with the HMAC SHA256 signed query of *payload* at *timestamp*."""
+        query_string = urlencode(payload, True)
+        if query_string:
+            query_string = (
+                f"{query_string}&recvWindow={self.recvWindow}&timestamp={timestamp}"
+            )
+        else:
+            query_string = f"recvWindow={self.recvWindow}&timestamp={timestamp}"
+
+        signature = hmac.new(
+            self.secret.encode("utf-8"),
+            query_string.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"{url}?{query_string}&signature={signature}"
+
+
+class BinanceApi(BinanceEndpoints):
+    """
+    Blocking Binance client on a pooled ``requests.Session``
+    """
+
+    # Keep-alive connection pool shared by all instances: one pool per host
+    # (up to pool_connections hosts) of pool_maxsize connections each
+    pool_connections = 8
+    pool_maxsize = 32
+    # (connect, read) seconds
+    timeout: float | tuple[float, float] = (5, 30)
+    _session: Session | None = None
+    _session_lock = Lock()
+
+    @property
+    def session(self) -> Session:
+        """Pooled ``requests.Session`` used by every request of this API."""
+        cls = type(self)
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """Close the pooled connections (a new pool is created on next use)."""
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
 
     def request(
         self,
@@ -90,17 +195,39 @@ class BinanceApi:
         Standard request
         - No signed
         - No authorization
-        """
-        if session:
-            res = session.request(method=method, url=url, **kwargs)
-        else:
-            res = request(method=method, url=url, json=payload, **kwargs)
+
+        Raises ``RateLimited`` without sending if the request would exceed
+        the weight or order limits (see ``WeightBudget.check``). With a
+        ``scheduler`` the request first waits for a slot in its lane.
+        """
+        weight, orders = request_cost(method, url, kwargs.get("params"))
+        if self.scheduler is None:
+            return self._send(url, method, session, payload, weight, orders, **kwargs)
+        return self.scheduler.run(
+            current_lane(binance_lane(method, url)),
+            weight,
+            self._send,
+            url,
+            method,
+            session,
+            payload,
+            weight,
+            orders,
+            **kwargs,
+        )
+
+    def _send(self, url, method, session, payload, weight, orders, **kwargs):
+        self.weight_budget.check(weight, orders)
+        kwargs.setdefault("timeout", self.timeout)
+        if payload is not None:
+            kwargs["json"] = payload
+        res = (session or self.session).request(method=method, url=url, **kwargs)
+        self.weight_budget.observe(res.headers, res.status_code)
         data = handle_binance_errors(res)
         return data
 
     def get_server_time(self):
-        response = self.request(url=self.server_time_url)
-        data = handle_binance_errors(response)
+        data = self.request(url=self.server_time_url)
         return data["serverTime"]
 
     def signed_request(self, url, method="GET", payload: dict = {}) -> dict:
@@ -110,36 +237,35 @@ class BinanceApi:
         Arguments are all the same as requests
         except payload, which is centrally formatted
         here to become a JSON
+
+        The timestamp comes from ``server_clock`` (no extra round trip). A
+        -1021 timestamp error resyncs the clock and retries once.
         """
-        session = Session()
-        query_string = urlencode(payload, True)
-        timestamp = self.get_server_time()
-        session.headers.update(
-            {"Content-Type": "application/json", "X-MBX-APIKEY": self.key}
+        try:
+            return self._signed_request(url, method, payload)
+        except BinanceErrors as error:
+            if error.code != TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                raise
+            self.server_clock.invalidate()
+            return self._signed_request(url, method, payload)
+
+    def _signed_request(self, url, method, payload: dict) -> dict:
+        url = self.sign_url(
+            url, payload, self.server_clock.now_ms(self.get_server_time)
         )
-
-        if query_string:
-            query_string = (
-                f"{query_string}&recvWindow={self.recvWindow}&timestamp={timestamp}"
-            )
-        else:
-            query_string = f"recvWindow={self.recvWindow}&timestamp={timestamp}"
-
-        signature = hmac.new(
-            self.secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        url = f"{url}?{query_string}&signature={signature}"
-        data = self.request(url, method, session)
+        data = self.request(url, method, headers=self.api_key_headers())
         return data
 
     def get_listen_key(self):
         """
         Get user data websocket stream
         """
-        headers = {"Content-Type": "application/json", "X-MBX-APIKEY": self.key}
-        res = request(method="POST", url=self.user_data_stream, headers=headers)
+        res = self.session.request(
+            method="POST",
+            url=self.user_data_stream,
+            headers=self.api_key_headers(),
+            timeout=self.timeout,
+        )
         response = handle_binance_errors(res)
         listen_key = response["listenKey"]
         return listen_key
@@ -274,6 +400,97 @@ class BinanceApi:
         data = self.request(url=self.candlestick_url, params=params)
         return data
 
+    def get_klines_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        max_workers: int = 4,
+    ):
+        """
+        Klines with open times in ``[start_ms, end_ms)`` of any length.
+
+        The range is split into pages of ``klines_page_size`` candles that
+        are fetched concurrently (each waiting for ``weight_budget``), then
+        merged and deduplicated by open time into one typed frame.
+        """
+
+        def fetch_page(start: int, end: int) -> list:
+            self.weight_budget.acquire(self.klines_weight)
+            try:
+                return self.get_ui_klines(
+                    symbol,
+                    interval,
+                    limit=self.klines_page_size,
+                    start_time=start,
+                    # endTime is inclusive
+                    end_time=end - 1,
+                )
+            finally:
+                self.weight_budget.release(self.klines_weight)
+
+        rows = fetch_klines_range(
+            fetch_page,
+            start_ms,
+            end_ms,
+            interval_to_ms(interval),
+            self.klines_page_size,
+            max_workers,
+        )
+        return klines_frame(ExchangeId.BINANCE, rows)
+
+    def fetch_klines_many(
+        self,
+        symbols: Iterable[str],
+        interval: str,
+        limit: int = 500,
+        start_time=None,
+        end_time=None,
+        max_workers: int = 16,
+        return_exceptions: bool = False,
+    ) -> Iterator[tuple[str, list | Exception]]:
+        """
+        Fetch raw klines for many symbols concurrently.
+
+        Yields ``(symbol, klines)`` as each request completes, so callers can
+        process the fastest symbols first. At most *max_workers* requests run
+        at once, and each one waits for ``weight_budget`` first. The budget
+        follows the ``x-mbx-used-weight-1m`` header, so the batch slows down
+        as the IP gets close to its weight limit.
+
+        By default the first failure is raised and the remaining requests are
+        cancelled. With ``return_exceptions=True`` the exception is yielded in
+        place of the klines instead.
+        """
+
+        def fetch(symbol: str) -> list:
+            self.weight_budget.acquire(self.klines_weight)
+            try:
+                return self.get_ui_klines(
+                    symbol, interval, limit, start_time=start_time, end_time=end_time
+                )
+            finally:
+                self.weight_budget.release(self.klines_weight)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            # copy_context keeps the caller's scheduler lane in the workers
+            futures = {
+                executor.submit(copy_context().run, fetch, symbol): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    yield symbol, future.result()
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    yield symbol, error
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     """
     USER_DATA endpoints
     """
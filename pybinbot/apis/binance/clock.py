@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from threading import Lock, Thread
+from time import time
+
+ServerTimeFetcher = Callable[[], int]
+AsyncServerTimeFetcher = Callable[[], Awaitable[int]]
+
+
+class ServerClock:
+    """
+    Local estimate of the Binance server clock for signed requests.
+
+    ``sync`` calls *fetch_server_time* a few times, keeps the sample with
+    the shortest round trip (its midpoint is the best estimate of when the
+    server read its clock). ``now_ms`` is then the local time plus the
+    offset, without any network call.
+
+    The offset is refreshed in a background thread once it is older than
+    *resync_s*; those periodic resyncs are exponentially smoothed against
+    jitter. ``invalidate`` (e.g. following a -1021 timestamp error) drops
+    the offset instead, so the next ``now_ms`` resyncs synchronously and
+    takes the measured offset as is. Concurrent callers that need a
+    synchronous resync share a single one.
+
+    The fetcher can be given per call, so one clock can be shared by many
+    clients (see ``BinanceEndpoints.server_clock``); one given to the
+    constructor takes precedence. Async clients use ``now_ms_async`` with a
+    coroutine fetching the server time instead, which resyncs in a
+    background task.
+    """
+
+    def __init__(
+        self,
+        fetch_server_time: ServerTimeFetcher | None = None,
+        samples: int = 3,
+        resync_s: float = 300,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.fetch_server_time = fetch_server_time
+        self.samples = samples
+        self.resync_s = resync_s
+        self.smoothing = smoothing
+        self.clock = clock
+        self.offset_ms: float | None = None
+        self.rtt_ms: float | None = None
+        self.synced_at: float | None = None
+        self._lock = Lock()
+        self._sync_lock = Lock()
+        self._sync_task: asyncio.Task | None = None
+        self._resyncing = False
+        self._resync_task: asyncio.Task | None = None
+
+    def _local_ms(self) -> float:
+        return self.clock() * 1000
+
+    def sync(self, fetch_server_time: ServerTimeFetcher | None = None) -> float:
+        """
+        Measure the offset and round trip, update the estimate and return
+        the new offset.
+        """
+        fetch = self.fetch_server_time or fetch_server_time
+        if fetch is None:
+            raise RuntimeError("No blocking server time fetcher, use sync_async")
+        samples = []
+        for _ in range(self.samples):
+            sent = self._local_ms()
+            server_time = fetch()
+            samples.append((sent, server_time, self._local_ms()))
+        return self._record(samples)
+
+    async def sync_async(self, fetch_server_time: AsyncServerTimeFetcher) -> float:
+        """``sync`` with a coroutine fetching the server time."""
+        samples = []
+        for _ in range(self.samples):
+            sent = self._local_ms()
+            server_time = await fetch_server_time()
+            samples.append((sent, server_time, self._local_ms()))
+        return self._record(samples)
+
+    def _record(self, samples: list[tuple[float, int, float]]) -> float:
+        """Fold the fastest ``(sent, server_time, received)`` sample in."""
+        sent, server_time, received = min(samples, key=lambda s: s[2] - s[0])
+        rtt = received - sent
+        offset = server_time - (sent + received) / 2
+        with self._lock:
+            if self.offset_ms is not None:
+                offset = self.offset_ms + self.smoothing * (offset - self.offset_ms)
+            self.offset_ms = offset
+            self.rtt_ms = rtt
+            self.synced_at = self.clock()
+        return offset
+
+    def _synced_offset(self) -> float | None:
+        """The offset, or None when a synchronous resync is needed."""
+        with self._lock:
+            return self.offset_ms if self.synced_at is not None else None
+
+    @property
+    def needs_sync(self) -> bool:
+        return self._synced_offset() is None
+
+    @property
+    def stale(self) -> bool:
+        return self.synced_at is not None and (
+            self.clock() - self.synced_at > self.resync_s
+        )
+
+    def _start_resync(self) -> bool:
+        with self._lock:
+            start = not self._resyncing
+            self._resyncing = True
+        return start
+
+    def invalidate(self) -> None:
+        """
+        Drop the offset, forcing an unsmoothed synchronous resync on the
+        next ``now_ms``: after a clock jump a smoothed one could still land
+        outside recvWindow.
+        """
+        with self._lock:
+            self.offset_ms = None
+            self.synced_at = None
+
+    def _background_sync(self, fetch_server_time: ServerTimeFetcher | None) -> None:
+        try:
+            self.sync(fetch_server_time)
+        except Exception:
+            logging.exception("Binance server clock resync failed")
+        finally:
+            self._resyncing = False
+
+    def _sync_once(self, fetch_server_time: ServerTimeFetcher | None) -> float:
+        with self._sync_lock:
+            # Synced by another caller while this one waited
+            offset = self._synced_offset()
+            if offset is None:
+                offset = self.sync(fetch_server_time)
+            return offset
+
+    def now_ms(self, fetch_server_time: ServerTimeFetcher | None = None) -> int:
+        """Offset-corrected local timestamp in milliseconds."""
+        offset = self._synced_offset()
+        if offset is None:
+            offset = self._sync_once(fetch_server_time)
+        elif self.stale and self._start_resync():
+            Thread(
+                target=self._background_sync, args=(fetch_server_time,), daemon=True
+            ).start()
+        return int(self._local_ms() + offset)
+
+    async def _background_sync_async(
+        self, fetch_server_time: AsyncServerTimeFetcher
+    ) -> None:
+        try:
+            await self.sync_async(fetch_server_time)
+        except Exception:
+            logging.exception("Binance server clock resync failed")
+        finally:
+            self._resyncing = False
+
+    async def _sync_once_async(
+        self, fetch_server_time: AsyncServerTimeFetcher
+    ) -> float:
+        task = self._sync_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.create_task(self.sync_async(fetch_server_time))
+            self._sync_task = task
+        # A cancelled caller must not cancel the sync the others wait for
+        return await asyncio.shield(task)
+
+    async def now_ms_async(self, fetch_server_time: AsyncServerTimeFetcher) -> int:
+        """``now_ms`` for async clients, never blocking the event loop."""
+        offset = self._synced_offset()
+        if offset is None:
+            offset = await self._sync_once_async(fetch_server_time)
+        elif self.stale and self._start_resync():
+            self._resync_task = asyncio.create_task(
+                self._background_sync_async(fetch_server_time)
+            )
+        return int(self._local_ms() + offset)
@@ -15,3 +15,14 @@ class InvalidSymbol(BinanceErrors):
 
 class NotEnoughFunds(BinanceErrors):
     pass
+
+
+class RateLimited(BinanceErrors):
+    """
+    Rate limit hit (HTTP 418/429, -1003) or a request that would exceed
+    it. Retry after ``retry_after`` seconds.
+    """
+
+    def __init__(self, msg, code, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(msg, code)
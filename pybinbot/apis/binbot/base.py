@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from collections.abc import AsyncGenerator
 from typing import Any
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from requests import Session
 from pybinbot import (
     AutotradeSettingsSchema,
@@ -39,6 +40,14 @@ class BinbotApi:
     token: str | None = None
     expiry_date: str | None = None
 
+    # Keep-alive connection pool used by fetch, one per instance
+    connection_limit = 32
+    dns_cache_ttl = 300
+    keepalive_timeout = 30
+    _aio_session: ClientSession | None = None
+    _aio_session_loop: asyncio.AbstractEventLoop | None = None
+    _aio_session_closer: AsyncGenerator[None, None] | None = None
+
     def __init__(
         self, base_url: str, service_email: str, service_password: str
     ) -> None:
@@ -177,23 +186,109 @@ class BinbotApi:
         data = handle_binbot_errors(res)
         return data
 
+    @staticmethod
+    async def _close_at_shutdown(
+        session: ClientSession,
+    ) -> AsyncGenerator[None, None]:
+        """
+        Started async generator that closes *session* when its loop shuts
+        down async generators, which ``asyncio.run`` does before closing
+        the loop.
+        """
+        try:
+            yield
+        finally:
+            await session.close()
+
+    def _drop_aio_session(self) -> None:
+        """
+        Forget a session opened in another event loop, which cannot be
+        closed from this one. It is closed in its own loop if that still
+        runs (another thread); a session whose loop ended without shutting
+        down its async generators is detached from its connection pool and
+        dropped.
+        """
+        session, loop = self._aio_session, self._aio_session_loop
+        self._aio_session = None
+        self._aio_session_loop = None
+        self._aio_session_closer = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            session.detach()
+            logger.warning(
+                "Dropped a fetch session left open by a finished event loop, "
+                "call BinbotApi.aclose() before the loop ends"
+            )
+
+    async def aio_session(self) -> ClientSession:
+        """
+        Long-lived ``ClientSession`` for ``fetch``, created on first use in
+        the running event loop. It is closed with ``aclose``, or when the
+        loop shuts down (e.g. at the end of ``asyncio.run``); a later call
+        in another loop opens a new one and drops the old.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aio_session_loop is not loop:
+            self._drop_aio_session()
+        if self._aio_session is None or self._aio_session.closed:
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.connection_limit,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+            )
+            self._aio_session_closer = self._close_at_shutdown(session)
+            await anext(self._aio_session_closer)
+            self._aio_session = session
+            self._aio_session_loop = loop
+        return self._aio_session
+
+    async def aclose(self) -> None:
+        """
+        Wait for pending ``dispatch_create_signal`` writes, then close the
+        ``fetch`` connection pool.
+        """
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self._aio_session_loop is not asyncio.get_running_loop():
+            self._drop_aio_session()
+        elif self._aio_session_closer is not None:
+            # Runs the generator's finally, closing the session
+            await self._aio_session_closer.aclose()
+        self._aio_session = None
+        self._aio_session_loop = None
+        self._aio_session_closer = None
+
+    async def __aenter__(self) -> "BinbotApi":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     async def fetch(
         self, url, method="GET", authenticate=True, **kwargs
     ) -> dict[Any, Any]:
         """
         Async HTTP client/server for asyncio
         that replaces requests library
+
+        Requests share the keep-alive pool of ``aio_session``, close it
+        with ``aclose`` (or ``async with BinbotApi(...)``).
         """
         if authenticate:
             headers = self._auth_headers()
         else:
             headers = None
-        async with ClientSession() as session:
-            async with session.request(
-                method=method, url=url, headers=headers, **kwargs
-            ) as response:
-                data = await aio_response_handler(response)
-                return data
+        session = await self.aio_session()
+        async with session.request(
+            method=method, url=url, headers=headers, **kwargs
+        ) as response:
+            data = await aio_response_handler(response)
+            return data
 
     @staticmethod
     def _symbol_model(data: dict) -> SymbolModel:
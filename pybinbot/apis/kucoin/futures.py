@@ -84,6 +84,8 @@ from kucoin_universal_sdk.generate.account.deposit import (
 )
 
 from pybinbot.shared.maths import round_numbers
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.pagination import fetch_klines_range, klines_frame
 from pybinbot.models.derivatives import (
     FundingRateHistoryPoint,
     FuturesContractMarketData,
@@ -120,6 +122,8 @@ class KucoinFutures(KucoinRest):
     # Seconds to wait for each IOC step to be processed before checking fill.
     _EXIT_ESCALATION_SLEEP_S: float = 2.0
     OPEN_INTEREST_HISTORY_URL = "https://api.kucoin.com/api/ua/v1/market/open-interest"
+    # Maximum candles per klines request
+    klines_page_size = 500
 
     def __init__(self, key: str, secret: str, passphrase: str) -> None:
         self.DEFAULT_LEVERAGE = 3
@@ -746,6 +750,35 @@ class KucoinFutures(KucoinRest):
 
         return klines[-limit:]
 
+    def get_klines_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        max_workers: int = 4,
+    ):
+        """
+        Klines with open times in ``[start_ms, end_ms)`` of any length, as
+        one typed frame. Pages of ``klines_page_size`` candles are fetched
+        concurrently, then merged and deduplicated by open time.
+        """
+        rows = fetch_klines_range(
+            lambda start, end: self.get_klines(
+                symbol,
+                interval,
+                limit=self.klines_page_size,
+                start_time=start,
+                end_time=end - 1,
+            ),
+            start_ms,
+            end_ms,
+            KucoinKlineIntervals(interval).to_minutes() * 60 * 1000,
+            self.klines_page_size,
+            max_workers,
+        )
+        return klines_frame(ExchangeId.KUCOIN, rows)
+
     def get_ui_klines(
         self,
         symbol: str,
@@ -1,10 +1,13 @@
 import logging
+from collections import OrderedDict
 from datetime import datetime
+from threading import Lock
 
 from kucoin_universal_sdk.generate.spot.market import GetKlinesReqBuilder
 
 from pybinbot.apis.kucoin.rest import KucoinRest
-from pybinbot.shared.enums import KucoinKlineIntervals
+from pybinbot.shared.enums import ExchangeId, KucoinKlineIntervals
+from pybinbot.shared.pagination import fetch_klines_range, klines_frame, merge_klines
 
 
 class KucoinMarket(KucoinRest):
@@ -12,11 +15,17 @@ class KucoinMarket(KucoinRest):
     Convienience wrapper for Kucoin order operations.
 
     - Kucoin transactions don't immediately return all order details so we need cooldown sleep
-    - Module-level cache: (symbol, interval, candle_boundary_s) -> klines list
+    - Class-level LRU cache of kline windows per (symbol, interval, limit);
+      when the candle boundary moves only the new candles are fetched
     """
 
     TRANSACTION_COOLDOWN_SECONDS = 1
-    _klines_cache: dict[tuple[str, str, int, int], list] = {}
+    # Maximum candles per klines request
+    klines_page_size = 1500
+    # (symbol, interval, limit) -> (window end boundary ms, klines), LRU order
+    _klines_cache: OrderedDict[tuple[str, str, int], tuple[int, list]] = OrderedDict()
+    _klines_cache_lock = Lock()
+    klines_cache_size = 512
 
     def __init__(self, key: str, secret: str, passphrase: str):
         super().__init__(key=key, secret=secret, passphrase=passphrase)
@@ -60,19 +69,71 @@ class KucoinMarket(KucoinRest):
         end_time = now_ms - (now_ms % interval_ms)
         start_time = end_time - (limit * interval_ms)
 
-        candle_boundary_s = end_time // 1000
-        cache_key = (symbol, interval, candle_boundary_s, limit)
-        cached = self._klines_cache.get(cache_key)
-        if cached is not None:
+        cache_key = (symbol, interval, limit)
+        with self._klines_cache_lock:
+            entry = self._klines_cache.get(cache_key)
+            if entry is not None:
+                self._klines_cache.move_to_end(cache_key)
+        if entry is not None and entry[0] == end_time:
             logging.debug(
                 "get_ui_klines cache hit: %s %s boundary=%d limit=%d",
                 symbol,
                 interval,
-                candle_boundary_s,
+                end_time // 1000,
                 limit,
             )
-            return cached.copy()
+            return list(entry[1])
 
+        cached = entry[1] if entry is not None else []
+        if cached and cached[-1][0] >= start_time:
+            # Only the candles since the last cached one (which may have been
+            # still forming) are downloaded and appended to the window
+            last_open_time = cached[-1][0]
+            tail = self._request_klines(symbol, interval, last_open_time, end_time)
+            merged = merge_klines([cached, tail])
+            klines = [row for row in merged if start_time <= row[0] <= end_time]
+        else:
+            klines = self._request_klines(symbol, interval, start_time, end_time)
+
+        with self._klines_cache_lock:
+            self._klines_cache[cache_key] = (end_time, list(klines))
+            self._klines_cache.move_to_end(cache_key)
+            while len(self._klines_cache) > self.klines_cache_size:
+                self._klines_cache.popitem(last=False)
+        return klines
+
+    def get_klines_range(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        max_workers: int = 4,
+    ):
+        """
+        Klines with open times in ``[start_ms, end_ms)`` of any length, as
+        one typed frame. Pages of ``klines_page_size`` candles are fetched
+        concurrently, then merged and deduplicated by open time.
+        """
+        rows = fetch_klines_range(
+            # endAt is inclusive
+            lambda start, end: self._request_klines(symbol, interval, start, end - 1),
+            start_ms,
+            end_ms,
+            KucoinKlineIntervals.get_interval_ms(interval),
+            self.klines_page_size,
+            max_workers,
+        )
+        return klines_frame(ExchangeId.KUCOIN, rows)
+
+    def _request_klines(
+        self, symbol: str, interval: str, start_time: int, end_time: int
+    ) -> list:
+        """
+        One klines request for ``[start_time, end_time]`` (ms), converted to
+        Binance-compatible rows sorted by open time.
+        """
+        interval_ms = KucoinKlineIntervals.get_interval_ms(interval)
         builder = (
             GetKlinesReqBuilder()
             .set_symbol(symbol)
@@ -113,10 +174,4 @@ class KucoinMarket(KucoinRest):
                     ]
                 )
             klines.reverse()
-
-        # Cache result; evict only entries from previous candle periods.
-        stale = [k for k in self._klines_cache if k[2] != candle_boundary_s]
-        for k in stale:
-            del self._klines_cache[k]
-        self._klines_cache[cache_key] = klines.copy()
         return klines
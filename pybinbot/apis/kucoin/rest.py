@@ -8,9 +8,28 @@ from kucoin_universal_sdk.model import (
     GLOBAL_API_ENDPOINT,
     GLOBAL_FUTURES_API_ENDPOINT,
 )
+from pybinbot.shared.scheduler import Priority, RequestScheduler, ScheduledApi
+
+# Scheduler lane of each SDK API attribute, see KucoinRest.schedule_apis
+KUCOIN_API_LANES = {
+    "order_api": Priority.CRITICAL,
+    "margin_order_api": Priority.CRITICAL,
+    "futures_order_api": Priority.CRITICAL,
+    "account_api": Priority.ACCOUNT,
+    "futures_account_api": Priority.ACCOUNT,
+    "futures_positions_api": Priority.ACCOUNT,
+    "debit_api": Priority.ACCOUNT,
+    "transfer_api": Priority.ACCOUNT,
+    "deposit_api": Priority.ACCOUNT,
+    "spot_api": Priority.MARKET_DATA,
+    "futures_market_api": Priority.MARKET_DATA,
+    "futures_funding_fees_api": Priority.MARKET_DATA,
+}
 
 
 class KucoinRest:
+    scheduler: RequestScheduler | None = None
+
     def __init__(self, key: str, secret: str, passphrase: str):
         self.key = key
         self.secret = secret
@@ -31,7 +50,17 @@ class KucoinRest:
             return
         if remaining_int < 0:
             return
-        if remaining_int < 100:
+        if self.scheduler is not None:
+            # The scheduler sheds bulk lanes instead of sleeping
+            budget = self.scheduler.budget
+            budget.set_used(budget.limit - remaining_int)
+            if remaining_int < 100:
+                logging.warning(
+                    "KuCoin rate limit critically low (%d remaining) on %s",
+                    remaining_int,
+                    endpoint,
+                )
+        elif remaining_int < 100:
             logging.warning(
                 "KuCoin rate limit critically low (%d remaining) on %s — sleeping 2 s",
                 remaining_int,
@@ -45,6 +74,19 @@ class KucoinRest:
                 endpoint,
             )
 
+    def schedule_apis(self, scheduler: RequestScheduler) -> None:
+        """
+        Route the SDK calls of this client through *scheduler*, in the lanes
+        of ``KUCOIN_API_LANES``. The scheduler's budget should match the
+        KuCoin quota, e.g. ``WeightBudget(limit=4000, window_s=30)``, and
+        is fed by ``check_rate_limit``.
+        """
+        self.scheduler = scheduler
+        for name, priority in KUCOIN_API_LANES.items():
+            api = getattr(self, name, None)
+            if api is not None and not isinstance(api, ScheduledApi):
+                setattr(self, name, ScheduledApi(api, scheduler, priority))
+
     def setup_client(self) -> DefaultClient:
         client_option = (
             ClientOptionBuilder()
@@ -0,0 +1,245 @@
+from collections.abc import Mapping, Sequence
+from time import time
+from typing import Any, cast
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+from pandera.typing import DataFrame as TypedDataFrame
+from pybinbot.models.signals import KlineProduceModel, KlineSchema
+from pybinbot.shared.candles import Candles
+from pybinbot.shared.enums import ExchangeId
+
+StoreKey = tuple[ExchangeId, str, str]
+
+
+class CandleBuffer:
+    """
+    Fixed-capacity columnar ring buffer of closed candles for one
+    (exchange, symbol, interval).
+
+    Every column is a preallocated array of twice the capacity and each
+    candle is written to both halves ("mirrored" ring). The last
+    ``capacity`` candles are therefore always one contiguous slice, so
+    ``columns()`` and ``to_frame()`` return time-ordered, zero-copy views
+    instead of reassembling the ring on every read.
+
+    Candles are deduplicated by ``open_time``: a repeated open time replaces
+    the latest candle (e.g. a corrected close), older ones are ignored.
+    Views share memory with the buffer and are only valid until the next
+    write; copy them if they must outlive it.
+    """
+
+    columns_order = Candles.kucoin_cols
+
+    def __init__(self, capacity: int = 1000, float_dtype: Any = np.float64) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be a positive number of candles")
+        self.capacity = capacity
+        self.count = 0
+        self._data: dict[str, np.ndarray] = {
+            col: np.zeros(
+                2 * capacity,
+                dtype=np.int64 if col in Candles.time_cols else float_dtype,
+            )
+            for col in self.columns_order
+        }
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    @property
+    def last_open_time(self) -> int | None:
+        if not self.count:
+            return None
+        return int(self._data["open_time"][(self.count - 1) % self.capacity])
+
+    def _blank(self, col: str, size: int) -> np.ndarray:
+        data = self._data[col]
+        fill = np.nan if data.dtype.kind == "f" else 0
+        return np.full(size, fill, dtype=data.dtype)
+
+    def _write(self, slots: Any, values: Mapping[str, Any]) -> None:
+        for col, data in self._data.items():
+            value = values[col] if col in values else self._blank(col, 1)[0]
+            data[slots] = value
+            data[slots + self.capacity] = value
+
+    def append(self, candle: Mapping[str, Any]) -> bool:
+        """
+        Add one closed candle given as a mapping of column values. Returns
+        False when it is older than the latest stored candle.
+        """
+        open_time = int(candle["open_time"])
+        last_open_time = self.last_open_time
+        if last_open_time is not None and open_time < last_open_time:
+            return False
+        if last_open_time is not None and open_time == last_open_time:
+            self._write((self.count - 1) % self.capacity, candle)
+            return True
+        self._write(self.count % self.capacity, candle)
+        self.count += 1
+        return True
+
+    def extend(self, columns: Mapping[str, np.ndarray]) -> int:
+        """
+        Add a batch of candles given as column arrays (e.g.
+        ``Candles.parse_raw_klines`` output). Returns the number of new
+        candles. Batches that overlap the stored history or are not strictly
+        ordered are merged instead, so backfills may arrive after the stream
+        started.
+        """
+        open_times = np.asarray(columns["open_time"], dtype=np.int64)
+        size = len(open_times)
+        if not size:
+            return 0
+        last_open_time = self.last_open_time
+        overlaps = last_open_time is not None and open_times[0] <= last_open_time
+        if overlaps or (np.diff(open_times) <= 0).any():
+            return self._merge(columns)
+
+        # Only the newest `capacity` rows can survive
+        kept = min(size, self.capacity)
+        rows = np.arange(size - kept, size)
+        slots = (self.count + rows) % self.capacity
+        values = {col: np.asarray(v)[rows] for col, v in columns.items()}
+        self._write(slots, values)
+        self.count += size
+        return size
+
+    def _merge(self, columns: Mapping[str, np.ndarray]) -> int:
+        before = len(self)
+        current = self.columns()
+        size = len(columns["open_time"])
+        merged = {
+            col: np.concatenate(
+                (
+                    current[col],
+                    np.asarray(columns[col], dtype=data.dtype)
+                    if col in columns
+                    else self._blank(col, size),
+                )
+            )
+            for col, data in self._data.items()
+        }
+        # The latest value wins for duplicated open times
+        order = np.argsort(merged["open_time"], kind="stable")
+        open_times = merged["open_time"][order]
+        last = np.append(open_times[1:] != open_times[:-1], True)
+        selected = order[last][-self.capacity :]
+
+        kept = len(selected)
+        self._write(np.arange(kept), {col: v[selected] for col, v in merged.items()})
+        self.count = kept
+        return max(kept - before, 0)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Zero-copy, time-ordered views of every column."""
+        size = len(self)
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        return {col: data[start : start + size] for col, data in self._data.items()}
+
+    def to_frame(self, index: bool = True) -> TypedDataFrame[KlineSchema]:
+        """
+        Kline frame over the buffer views, shaped like ``Candles.pre_process``
+        output (close_time DatetimeIndex) unless ``index=False``.
+        """
+        df = DataFrame(self.columns(), copy=False)
+        if index:
+            df.index = to_datetime(df["close_time"], unit="ms").rename("timestamp")
+        return cast(TypedDataFrame[KlineSchema], df)
+
+
+class CandleStore:
+    """
+    Ring buffers of closed candles keyed by (exchange, symbol, interval).
+
+    Feeds:
+    - REST backfills: raw kline rows as returned by the exchange clients
+    - websocket candles: ``KlineProduceModel`` (or its dict), as queued by
+      ``AsyncKucoinWebsocketClient``
+    - Binance kline stream events, as received by
+      ``AsyncSpotWebsocketStreamClient`` (only closed candles are stored)
+
+    Memory is bounded by ``capacity`` candles per key.
+    """
+
+    def __init__(self, capacity: int = 1000, compact: bool = False) -> None:
+        self.capacity = capacity
+        self.float_dtype = np.float32 if compact else np.float64
+        self.buffers: dict[StoreKey, CandleBuffer] = {}
+
+    def buffer(self, exchange: ExchangeId, symbol: str, interval: str) -> CandleBuffer:
+        key = (exchange, symbol, interval)
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = CandleBuffer(self.capacity, self.float_dtype)
+            self.buffers[key] = buffer
+        return buffer
+
+    def ingest_rest(
+        self,
+        exchange: ExchangeId,
+        symbol: str,
+        interval: str,
+        candles: Sequence[Sequence[Any]],
+        now_ms: int | None = None,
+    ) -> int:
+        """
+        Store the closed rows of a REST kline payload (the candle still
+        forming at *now_ms* is skipped). Returns the number of new candles.
+        """
+        closed, _ = Candles.partition_closed_candles(
+            list(candles), now_ms=now_ms if now_ms is not None else int(time() * 1000)
+        )
+        if not closed:
+            return 0
+        columns = Candles.parse_exchange_klines(exchange, closed)
+        return self.buffer(exchange, symbol, interval).extend(columns)
+
+    def ingest_kline(
+        self,
+        kline: KlineProduceModel | Mapping[str, Any],
+        interval: str,
+        exchange: ExchangeId = ExchangeId.KUCOIN,
+    ) -> bool:
+        """Store one closed candle produced by the websocket clients."""
+        if isinstance(kline, Mapping):
+            kline = KlineProduceModel.model_validate(kline)
+        close = float(kline.close_price)
+        candle = {
+            "open_time": int(kline.open_time),
+            "close_time": int(kline.close_time),
+            "open": float(kline.open_price),
+            "high": float(kline.high_price),
+            "low": float(kline.low_price),
+            "close": close,
+            "volume": kline.volume,
+            "quote_asset_volume": kline.volume * close,
+        }
+        return self.buffer(exchange, kline.symbol, interval).append(candle)
+
+    def ingest_binance_event(self, message: Mapping[str, Any]) -> bool:
+        """
+        Store a Binance ``<symbol>@kline_<interval>`` event (raw or wrapped
+        in a combined stream). Candles that are not closed yet are ignored.
+        """
+        event = message.get("data", message)
+        kline = event.get("k") if isinstance(event, Mapping) else None
+        if not kline or not kline.get("x"):
+            return False
+        candle = {
+            "open_time": int(kline["t"]),
+            "close_time": int(kline["T"]),
+            "open": float(kline["o"]),
+            "high": float(kline["h"]),
+            "low": float(kline["l"]),
+            "close": float(kline["c"]),
+            "volume": float(kline["v"]),
+            "quote_asset_volume": float(kline.get("q", np.nan)),
+        }
+        return self.buffer(ExchangeId.BINANCE, kline["s"], kline["i"]).append(candle)
+
+    def frame(
+        self, exchange: ExchangeId, symbol: str, interval: str, index: bool = True
+    ) -> TypedDataFrame[KlineSchema]:
+        return self.buffer(exchange, symbol, interval).to_frame(index=index)
@@ -3,12 +3,25 @@ from math import isfinite
 from time import time
 from typing import Any, cast
 
-from pandas import DataFrame, to_numeric, Timedelta
+import numpy as np
+from pandas import DataFrame, Series, to_numeric, Timedelta
 from pandas.api.types import is_numeric_dtype
 from pandas import to_datetime
 from pandera.typing import DataFrame as TypedDataFrame
 from pybinbot.models.signals import KlineSchema
 from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.validation import validate_klines
+
+# Binance interval units that pandas spells differently ("1d" is deprecated)
+PANDAS_INTERVAL_UNITS = {"m": "min", "d": "D", "w": "W"}
+
+
+def pandas_interval(interval: str) -> str:
+    """Pandas alias of a Binance interval ("15m" -> "15min", "1d" -> "1D")."""
+    unit = interval[-1:]
+    if unit in PANDAS_INTERVAL_UNITS and interval[:-1].isdigit():
+        return interval[:-1] + PANDAS_INTERVAL_UNITS[unit]
+    return interval
 
 
 class Candles:
@@ -24,6 +37,15 @@ class Candles:
     bars and ``Indicators.bollinguer_spreads(df)`` for Bollinger-band columns.
     Subclasses (e.g. ``HeikinAshi``) override ``pre_process`` to apply
     additional transformations.
+
+    Pass ``compact=True`` to store the frame with the compact dtype policy
+    (see ``compact_dtypes``): float32 prices and volumes, int64 epoch-ms
+    times and no object columns, roughly halving the memory of a frame.
+    float32 keeps about 7 significant digits, so e.g. a 65000.12 price is
+    stored to within ~0.004. Indicators still compute in float64 and only
+    store their columns as float32 for compact frames; use the default
+    float64 frames where exact exchange prices matter (order placement,
+    precision checks).
     """
 
     binance_cols = [
@@ -65,9 +87,21 @@ class Candles:
 
     REQUIRED_COLUMNS = kucoin_cols
 
-    def __init__(self, exchange: ExchangeId, candles: list[list]) -> None:
+    time_cols = ["open_time", "close_time"]
+    count_cols = ["number_of_trades"]
+
+    def __init__(
+        self,
+        exchange: ExchangeId,
+        candles: list[list],
+        compact: bool = False,
+        symbol: str | None = None,
+    ) -> None:
         self.exchange = exchange
         self.candles = candles
+        self.compact = compact
+        # Key for the validation policy (e.g. first N frames per symbol)
+        self.symbol = symbol
 
     # ------------------------------------------------------------------
     # Static helpers
@@ -90,8 +124,170 @@ class Candles:
 
         return df
 
+    @classmethod
+    def compact_dtypes(cls, df: DataFrame) -> DataFrame:
+        """
+        Apply the compact dtype policy to the kline columns of *df* in place.
+
+        - open_time / close_time: int64 epoch ms (float64 if any are missing)
+        - number_of_trades: int64 (float32 if any are missing)
+        - prices and volumes: float32
+
+        String values are coerced to numbers, so no object columns are left.
+        Other columns (e.g. indicators already attached) are not touched.
+        """
+        for col in dict.fromkeys(cls.binance_cols + cls.kucoin_cols):
+            if col not in df.columns:
+                continue
+            values = df[col]
+            if not is_numeric_dtype(values):
+                values = to_numeric(values, errors="coerce")
+            exact = col in cls.time_cols or col in cls.count_cols
+            if exact and values.notna().all():
+                df[col] = values.astype("int64")
+            elif col in cls.time_cols:
+                df[col] = values.astype("float64")
+            else:
+                df[col] = values.astype("float32")
+        return df
+
+    @classmethod
+    def parse_raw_klines(
+        cls,
+        candles: Sequence[Sequence[Any]],
+        columns: Sequence[str],
+        float_dtype: Any = np.float64,
+    ) -> dict[str, np.ndarray]:
+        """
+        Parse raw kline rows straight into typed NumPy columns.
+
+        Rows are transposed once and every field is converted by NumPy in a
+        single call, which also parses numeric strings. Microsecond
+        timestamps are normalised to milliseconds during the pass.
+
+        - time and trade count columns: int64 (float64 if any are missing)
+        - everything else: *float_dtype* (float64, or float32 for compact)
+
+        Fields that cannot be parsed become NaN, like ``to_numeric(...,
+        errors="coerce")``. Extra trailing fields are ignored.
+        """
+        parsed: dict[str, np.ndarray] = {}
+        for name, values in zip(columns, zip(*candles)):
+            array: np.ndarray
+            try:
+                array = np.asarray(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                coerced = to_numeric(Series(values, dtype=object), errors="coerce")
+                array = coerced.to_numpy(dtype=np.float64, na_value=np.nan)
+
+            exact = name in cls.time_cols or name in cls.count_cols
+            if exact:
+                missing = np.isnan(array)
+                if name in cls.time_cols:
+                    sample = array[~missing][:1]
+                    if len(sample) and sample[0] >= 1e15:
+                        array = array / 1000
+                if not missing.any():
+                    parsed[name] = np.floor(array).astype(np.int64)
+                    continue
+                if name in cls.time_cols:
+                    parsed[name] = array
+                    continue
+            parsed[name] = array.astype(float_dtype, copy=False)
+        return parsed
+
+    @classmethod
+    def parse_exchange_klines(
+        cls,
+        exchange: ExchangeId,
+        candles: Sequence[Sequence[Any]],
+        float_dtype: Any = np.float64,
+    ) -> dict[str, np.ndarray]:
+        """
+        ``parse_raw_klines`` with the column layout of *exchange*. When KuCoin
+        rows have no quote volume, it is estimated as volume * close.
+        """
+        if exchange == ExchangeId.BINANCE:
+            return cls.parse_raw_klines(candles, cls.binance_cols, float_dtype)
+        if candles and len(candles[0]) >= len(cls.kucoin_cols):
+            # KuCoin spot rows carry the quote turnover as an eighth field
+            return cls.parse_raw_klines(candles, cls.kucoin_cols, float_dtype)
+        columns = cls.parse_raw_klines(candles, cls.kucoin_cols[:7], float_dtype)
+        columns["quote_asset_volume"] = columns["volume"] * columns["close"]
+        return columns
+
     @staticmethod
+    def split_closed(
+        open_times: np.ndarray, close_times: np.ndarray, now_ms: int | None = None
+    ) -> tuple[int, int | None]:
+        """
+        Closed/current split of candles sorted by time, in O(log n).
+
+        Takes int64 (or float) millisecond open and close times, both
+        non-decreasing, and returns ``(closed, current)``: rows ``[:closed]``
+        closed before *now_ms* and ``current`` is the index of the candle
+        forming at *now_ms*, or None.
+        """
+        current_time_ms = now_ms if now_ms is not None else int(time() * 1000)
+        closed = int(np.searchsorted(close_times, current_time_ms, side="left"))
+        opened = int(np.searchsorted(open_times, current_time_ms, side="right"))
+        return closed, opened - 1 if opened > closed else None
+
+    @staticmethod
+    def _sorted_times(
+        candles: list[Any], interval_ms: int | None
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Millisecond open/close times of uniform, valid and already sorted
+        rows, or None when the robust path is needed.
+        """
+        first = candles[0]
+        if isinstance(first, Mapping):
+            if not all(isinstance(candle, Mapping) for candle in candles):
+                return None
+            open_values = [candle.get("open_time") for candle in candles]
+            close_values = [candle.get("close_time") for candle in candles]
+        elif isinstance(first, (list, tuple)):
+            if not all(
+                isinstance(candle, (list, tuple)) and len(candle) >= 7
+                for candle in candles
+            ):
+                return None
+            open_values = [candle[0] for candle in candles]
+            close_values = [candle[6] for candle in candles]
+        else:
+            return None
+
+        open_times: np.ndarray
+        close_times: np.ndarray
+        try:
+            open_times = np.asarray(open_values, dtype=np.float64)
+            close_times = (
+                open_times
+                if interval_ms is not None
+                else np.asarray(close_values, dtype=np.float64)
+            )
+        except (TypeError, ValueError):
+            return None
+        if not (np.isfinite(open_times).all() and np.isfinite(close_times).all()):
+            return None
+
+        open_times = np.where(
+            open_times < 100_000_000_000, open_times * 1000, open_times
+        )
+        if interval_ms is not None:
+            close_times = open_times + interval_ms - 1
+        else:
+            close_times = np.where(
+                close_times < 100_000_000_000, close_times * 1000, close_times
+            )
+        if (np.diff(open_times) < 0).any() or (np.diff(close_times) < 0).any():
+            return None
+        return open_times, close_times
+
+    @classmethod
     def partition_closed_candles(
+        cls,
         candles: list[Any],
         now_ms: int | None = None,
         interval_ms: int | None = None,
@@ -103,11 +299,22 @@ class Candles:
         interval when the source does not provide a real close timestamp; the
         close boundary is then derived from ``open_time + interval_ms - 1``.
         Second timestamps are normalized to milliseconds.
+
+        Exchange payloads are normally sorted already: uniform, valid, sorted
+        rows are split with ``split_closed`` and a slice of the input is
+        returned. Mixed, invalid or unsorted rows take the row-by-row path.
         """
         if interval_ms is not None and interval_ms <= 0:
             raise ValueError("interval_ms must be positive")
 
         current_time_ms = now_ms if now_ms is not None else int(time() * 1000)
+        if not candles:
+            return [], None
+        times = cls._sorted_times(candles, interval_ms)
+        if times is not None:
+            closed, forming = cls.split_closed(*times, now_ms=current_time_ms)
+            return candles[:closed], None if forming is None else candles[forming]
+
         normalized_candles: list[tuple[float, float, Any]] = []
 
         for candle in candles:
@@ -167,6 +374,30 @@ class Candles:
     # ------------------------------------------------------------------
 
     def _build_df_from_raw_candles(
+        self, exchange: ExchangeId, candles: list[list], float_dtype: Any = np.float64
+    ) -> DataFrame:
+        widths = {len(row) for row in candles}
+        if len(widths) != 1:
+            # Empty or ragged payloads keep the DataFrame based path and errors
+            return self._build_df_from_raw_frame(exchange, candles)
+        width = widths.pop()
+
+        if exchange == ExchangeId.BINANCE:
+            if width < len(self.binance_cols):
+                return self._build_df_from_raw_frame(exchange, candles)
+            return DataFrame(
+                self.parse_raw_klines(candles, self.binance_cols, float_dtype)
+            )
+
+        if width != 7:
+            raise ValueError(f"Unexpected KuCoin kline column count: {width}")
+        # KuCoin futures adapters return Binance-compatible rows:
+        # open_time, open, high, low, close, volume, close_time.
+        columns = self.parse_raw_klines(candles, self.kucoin_cols[:7], float_dtype)
+        columns["quote_asset_volume"] = columns["volume"] * columns["close"]
+        return DataFrame(columns)
+
+    def _build_df_from_raw_frame(
         self, exchange: ExchangeId, candles: list[list]
     ) -> DataFrame:
         if exchange == ExchangeId.BINANCE:
@@ -203,7 +434,9 @@ class Candles:
 
         numeric_cols = ["open", "high", "low", "close", "volume"]
         for col in numeric_cols:
-            df[col] = to_numeric(df[col], errors="coerce")
+            # Frames from parse_raw_klines are already typed
+            if not is_numeric_dtype(df[col]):
+                df[col] = to_numeric(df[col], errors="coerce")
 
         return df
 
@@ -228,13 +461,15 @@ class Candles:
 
         Args:
             df_indexed: Time-indexed OHLCV DataFrame.
-            interval:   Pandas offset alias (e.g. ``"1h"``, ``"30min"``).
+            interval:   Pandas offset alias (e.g. ``"1h"``, ``"30min"``) or
+                        Binance interval (``"1d"``).
                         Must be **≥ 15 minutes** because the base candles are
                         always fetched at the 15-minute timeframe.
 
         Raises:
             ValueError: If *interval* resolves to less than 15 minutes.
         """
+        interval = pandas_interval(interval)
         if Timedelta(interval) < Timedelta("15min"):
             raise ValueError(
                 f"Resample interval '{interval}' is less than the minimum "
@@ -276,10 +511,16 @@ class Candles:
         Returns:
             df: Time-indexed DataFrame at the interval of the input candles.
         """
-        raw_df = self._build_df_from_raw_candles(self.exchange, self.candles)
+        float_dtype = np.float32 if self.compact else np.float64
+        raw_df = self._build_df_from_raw_candles(
+            self.exchange, self.candles, float_dtype
+        )
         raw_df = self._prepare_numeric_ohlcv(raw_df)
+        if self.compact:
+            raw_df = self.compact_dtypes(raw_df)
 
         raw_indexed = self._set_time_index(raw_df)
+        validate_klines(raw_indexed, key=(self.exchange, self.symbol))
 
         return cast(TypedDataFrame[KlineSchema], raw_indexed)
 
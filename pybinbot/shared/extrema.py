@@ -0,0 +1,123 @@
+from collections import deque
+from math import isnan, nan
+from typing import cast
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pybinbot.shared.kernels import FloatArray, as_float_array
+
+
+class RollingExtrema:
+    """
+    Highest and lowest value over a sliding window of samples.
+
+    Each side is a monotonic deque of ``(position, value)`` pairs: values
+    that can never be the extreme again (an older value dominated by a newer
+    one) are dropped on insert, and entries older than the window are
+    dropped from the front. Every sample enters and leaves each deque once,
+    so updates are amortised O(1) and a batch pass is O(n), with no rescans
+    of the window.
+
+    ``push(high, low)`` tracks the max of ``high`` and the min of ``low``
+    (``low`` defaults to ``high``), which is what channel indicators need.
+    NaN samples are skipped but still occupy their window slot; each side is
+    NaN until ``min_periods`` of its own valid samples are inside the
+    window, like pandas ``rolling().max()`` on that column.
+    """
+
+    def __init__(self, window: int, min_periods: int | None = None) -> None:
+        if window < 1:
+            raise ValueError("window must be a positive number of rows")
+        self.window = window
+        self.min_periods = max(window if min_periods is None else min_periods, 1)
+        self.position = -1
+        self._maxima: deque[tuple[int, float]] = deque()
+        self._minima: deque[tuple[int, float]] = deque()
+        self._valid_highs: deque[int] = deque()
+        self._valid_lows: deque[int] = deque()
+
+    def push(self, high: float, low: float | None = None) -> None:
+        if low is None:
+            low = high
+        self.position += 1
+        position = self.position
+        oldest = position - self.window
+
+        maxima = self._maxima
+        if not isnan(high):
+            while maxima and maxima[-1][1] <= high:
+                maxima.pop()
+            maxima.append((position, high))
+        while maxima and maxima[0][0] <= oldest:
+            maxima.popleft()
+
+        minima = self._minima
+        if not isnan(low):
+            while minima and minima[-1][1] >= low:
+                minima.pop()
+            minima.append((position, low))
+        while minima and minima[0][0] <= oldest:
+            minima.popleft()
+
+        for valid, value in ((self._valid_highs, high), (self._valid_lows, low)):
+            if not isnan(value):
+                valid.append(position)
+            while valid and valid[0] <= oldest:
+                valid.popleft()
+
+    @property
+    def ready(self) -> bool:
+        return min(len(self._valid_highs), len(self._valid_lows)) >= self.min_periods
+
+    @property
+    def highest(self) -> float:
+        ready = len(self._valid_highs) >= self.min_periods
+        return self._maxima[0][1] if ready and self._maxima else nan
+
+    @property
+    def lowest(self) -> float:
+        ready = len(self._valid_lows) >= self.min_periods
+        return self._minima[0][1] if ready and self._minima else nan
+
+
+def rolling_extrema(
+    high: ArrayLike,
+    low: ArrayLike | None = None,
+    window: int = 20,
+    min_periods: int | None = None,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Rolling highest ``high`` and lowest ``low`` (``low`` defaults to
+    ``high``) in one O(n) pass of ``RollingExtrema``.
+    """
+    highs = as_float_array(high)
+    lows = highs if low is None else as_float_array(low)
+    highest = np.empty(len(highs), dtype=np.float64)
+    lowest = np.empty(len(highs), dtype=np.float64)
+
+    engine = RollingExtrema(window, min_periods)
+    samples = zip(cast(list[float], highs.tolist()), cast(list[float], lows.tolist()))
+    for i, (high_value, low_value) in enumerate(samples):
+        engine.push(high_value, low_value)
+        highest[i] = engine.highest
+        lowest[i] = engine.lowest
+    return highest, lowest
+
+
+def _price_range(highest: ArrayLike, lowest: ArrayLike) -> FloatArray:
+    # A flat range has no defined position; report NaN instead of inf
+    price_range = as_float_array(highest) - as_float_array(lowest)
+    return np.where(price_range == 0, np.nan, price_range)
+
+
+def stochastic_k(close: ArrayLike, highest: ArrayLike, lowest: ArrayLike) -> FloatArray:
+    """%K: position of the close inside the high/low range, 0-100."""
+    distance = as_float_array(close) - as_float_array(lowest)
+    return 100 * distance / _price_range(highest, lowest)
+
+
+def williams_r(close: ArrayLike, highest: ArrayLike, lowest: ArrayLike) -> FloatArray:
+    """Williams %R: distance of the close below the range high, -100-0."""
+    distance = as_float_array(highest) - as_float_array(close)
+    return -100 * distance / _price_range(highest, lowest)
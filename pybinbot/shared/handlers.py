@@ -1,5 +1,4 @@
 import logging
-from time import sleep
 from typing import Any
 from requests import Response, HTTPError
 from aiohttp import ClientResponse
@@ -11,6 +10,12 @@ from pybinbot.apis.binance.exceptions import (
     BinanceErrors,
     InvalidSymbol,
     NotEnoughFunds,
+    RateLimited,
+)
+from pybinbot.shared.rate_limit import (
+    TOO_MANY_REQUESTS,
+    USED_WEIGHT_HEADER,
+    retry_after_s,
 )
 
 BODY_PREVIEW_CHARS = 1000
@@ -33,42 +38,22 @@ async def aio_response_handler(response: ClientResponse):
     return content
 
 
-def handle_binance_errors(response: Response) -> dict[Any, Any]:
-    """
-    Handles:
-    - HTTP codes, not authorized, rate limits...
-    - Bad request errors, binance internal e.g. {"code": -1013, "msg": "Invalid quantity"}
-    - Binbot internal errors - bot errors, returns "errored"
-
-    """
-
-    if "x-mbx-used-weight-1m" in response.headers:
-        logging.info(
-            f"Request to {response.url} weight: {response.headers.get('x-mbx-used-weight-1m')}"
+def _raise_for_binance_rate_limit(status_code: int, headers: Any) -> None:
+    """Raise ``RateLimited`` for 418 (IP ban) and 429 (too many requests)."""
+    if status_code == 418 or status_code == 429:
+        retry_after = retry_after_s(headers)
+        logging.warning(
+            f"Request weight limit hit, ban will come soon, retry after {retry_after}s"
+        )
+        raise RateLimited(
+            "Binance rate limit hit", TOO_MANY_REQUESTS, retry_after=retry_after
         )
-    # Binance doesn't seem to reach 418 or 429 even after 2000 weight requests
-    if (
-        response.headers.get("x-mbx-used-weight-1m")
-        and float(response.headers.get("x-mbx-used-weight-1m", 0)) > 7000
-    ):
-        logging.warning("Request weight limit prevention pause, waiting 1 min")
-        sleep(120)
-
-    if response.status_code == 418 or response.status_code == 429:
-        logging.warning("Request weight limit hit, ban will come soon, waiting 1 hour")
-        sleep(3600)
-
-    # Cloudfront 403 error
-    if response.status_code == 403 and response.reason:
-        raise HTTPError(response=response)
 
-    content = response.json()
-
-    if response.status_code == 404:
-        raise HTTPError(response=response)
 
+def _raise_for_binance_content(status_code: int, content: Any) -> None:
+    """Raise the exception mapped to a Binance error body."""
     # Show error messsage for bad requests
-    if response.status_code >= 400:
+    if status_code >= 400:
         # Binance errors
         if "msg" in content and "code" in content:
             raise BinanceErrors(content["msg"], content["code"])
@@ -82,7 +67,7 @@ def handle_binance_errors(response: Response) -> dict[Any, Any]:
         if content["code"] == -1013:
             raise QuantityTooLow(content["message"], content["error"])
         if content["code"] == 200:
-            return content
+            return
         if (
             content["code"] == -2010
             or content["code"] == -1013
@@ -92,15 +77,64 @@ def handle_binance_errors(response: Response) -> dict[Any, Any]:
             # Need to be dealt with at higher levels
             raise NotEnoughFunds(content["msg"], content["code"])
 
-        if content["code"] == -1003:
+        if content["code"] == TOO_MANY_REQUESTS:
             # Too many requests, most likely exceeded API rate limits
-            # Back off for > 5 minutes, which is Binance's ban time
-            print("Too many requests. Back off for 1 min...")
-            sleep(60)
+            raise RateLimited(content["msg"], content["code"], retry_after=60)
 
         if content["code"] == -1121:
             raise InvalidSymbol(f"Binance error: {content['msg']}", content["code"])
 
+
+def handle_binance_errors(response: Response) -> dict[Any, Any]:
+    """
+    Handles:
+    - HTTP codes, not authorized, rate limits...
+    - Bad request errors, binance internal e.g. {"code": -1013, "msg": "Invalid quantity"}
+    - Binbot internal errors - bot errors, returns "errored"
+
+    Rate limits (418, 429, -1003) raise ``RateLimited`` with the seconds to
+    wait rather than sleeping in the calling thread.
+    """
+    if USED_WEIGHT_HEADER in response.headers:
+        logging.info(
+            f"Request to {response.url} weight: {response.headers.get(USED_WEIGHT_HEADER)}"
+        )
+    _raise_for_binance_rate_limit(response.status_code, response.headers)
+
+    # Cloudfront 403 error
+    if response.status_code == 403 and response.reason:
+        raise HTTPError(response=response)
+
+    content = response.json()
+
+    if response.status_code == 404:
+        raise HTTPError(response=response)
+
+    _raise_for_binance_content(response.status_code, content)
+    return content
+
+
+async def aio_handle_binance_errors(response: ClientResponse) -> dict[Any, Any]:
+    """
+    ``handle_binance_errors`` for aiohttp responses, with the same error
+    mapping. 403 and 404 raise ``aiohttp.ClientResponseError``.
+    """
+    if USED_WEIGHT_HEADER in response.headers:
+        logging.info(
+            f"Request to {response.url} weight: {response.headers.get(USED_WEIGHT_HEADER)}"
+        )
+    _raise_for_binance_rate_limit(response.status, response.headers)
+
+    # Cloudfront 403 error
+    if response.status == 403 and response.reason:
+        response.raise_for_status()
+
+    content = await response.json(content_type=None)
+
+    if response.status == 404:
+        response.raise_for_status()
+
+    _raise_for_binance_content(response.status, content)
     return content
 
 
@@ -1,12 +1,15 @@
 from typing import cast
 
-from pandas import DataFrame, concat
+import numpy as np
+from pandas import DataFrame, Series, concat
 from pandas.api.types import is_numeric_dtype
 from pandas import to_numeric
 from pandera.typing import DataFrame as TypedDataFrame
 from pybinbot.models.signals import KlineSchema
 from pybinbot.shared.enums import ExchangeId
 from pybinbot.shared.candles import Candles
+from pybinbot.shared import kernels
+from pybinbot.shared.validation import validate_klines
 
 
 class HeikinAshi(Candles):
@@ -25,8 +28,14 @@ class HeikinAshi(Candles):
       * Validates required columns.
     """
 
-    def __init__(self, exchange: ExchangeId, candles: list[list]) -> None:
-        super().__init__(exchange, candles)
+    def __init__(
+        self,
+        exchange: ExchangeId,
+        candles: list[list],
+        compact: bool = False,
+        symbol: str | None = None,
+    ) -> None:
+        super().__init__(exchange, candles, compact=compact, symbol=symbol)
 
     def get_heikin_ashi(self, df: DataFrame) -> TypedDataFrame[KlineSchema]:
         if df.empty:
@@ -46,18 +55,25 @@ class HeikinAshi(Candles):
 
         ha_close = (work["open"] + work["high"] + work["low"] + work["close"]) / 4.0
 
-        ha_open = ha_close.copy()
-        ha_open.iloc[0] = (work["open"].iloc[0] + work["close"].iloc[0]) / 2.0
-        for i in range(1, len(work)):
-            ha_open.iloc[i] = (ha_open.iloc[i - 1] + ha_close.iloc[i - 1]) / 2.0
+        seed = (work["open"].iloc[0] + work["close"].iloc[0]) / 2.0
+        ha_open = Series(
+            kernels.heikin_ashi_open(ha_close.to_numpy(), seed),
+            index=ha_close.index,
+        )
 
         ha_high = concat([work["high"], ha_open, ha_close], axis=1).max(axis=1)
         ha_low = concat([work["low"], ha_open, ha_close], axis=1).min(axis=1)
 
-        work.loc[:, "open"] = ha_open
-        work.loc[:, "high"] = ha_high
-        work.loc[:, "low"] = ha_low
-        work.loc[:, "close"] = ha_close
+        # Compact (float32) frames stay float32; anything else, including
+        # integer OHLC, gets float64 HA values rather than truncated ones
+        for col, values in (
+            ("open", ha_open),
+            ("high", ha_high),
+            ("low", ha_low),
+            ("close", ha_close),
+        ):
+            dtype = np.float32 if work[col].dtype == np.float32 else np.float64
+            work[col] = values.astype(dtype)
 
         return cast(TypedDataFrame[KlineSchema], work)
 
@@ -78,6 +94,10 @@ class HeikinAshi(Candles):
         raw_df = self._prepare_numeric_ohlcv(raw_df)
 
         df = self.get_heikin_ashi(raw_df)
+        if self.compact:
+            # HA values are derived in float64 and only stored compactly
+            df = cast(TypedDataFrame[KlineSchema], self.compact_dtypes(df))
         df = cast(TypedDataFrame[KlineSchema], self._set_time_index(df))
+        validate_klines(df, key=(self.exchange, self.symbol))
 
         return df
@@ -0,0 +1,267 @@
+import json
+import os
+import tempfile
+from collections.abc import Callable, Sequence
+from functools import partial
+from pathlib import Path
+from time import time
+from typing import Any, cast
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+from pandera.typing import DataFrame as TypedDataFrame
+from pybinbot.models.signals import KlineSchema
+from pybinbot.shared.candles import Candles
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.pagination import interval_to_ms
+
+# fetch(start_ms, end_ms) -> raw kline rows with open times in [start, end]
+KlineFetcher = Callable[[int, int], Sequence[Sequence[Any]]]
+Range = tuple[int, int]
+
+
+def _subtract(start: int, end: int, covered: Sequence[Range]) -> list[Range]:
+    """Parts of [start, end) not inside the sorted, merged *covered* ranges."""
+    gaps: list[Range] = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _merge_ranges(ranges: Sequence[Range]) -> list[Range]:
+    merged: list[Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _months(open_times: np.ndarray) -> np.ndarray:
+    return open_times.astype("datetime64[ms]").astype("datetime64[M]")
+
+
+def _atomic_write(path: Path, write: Callable[[Any], None], mode: str) -> None:
+    # Write next to the target and rename, so readers never see a torn file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, mode) as handle:
+            write(handle)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class HistoricalCandleStore:
+    """
+    Local on-disk store of closed candles, so restarts and backtests only
+    download what is not already on disk.
+
+    Layout: ``<root>/<exchange>/<symbol>/<interval>/YYYY-MM.npy`` segments
+    (one structured array per calendar month of ``open_time``, columns as
+    ``Candles.kucoin_cols``) plus an ``index.json`` listing the covered
+    ``[start, end)`` open time ranges. Segments are opened with
+    ``mmap_mode="r"``, so reads only page in what they slice. Every file is
+    replaced atomically (temp file + rename).
+
+    ``get_klines`` serves a time range from disk and calls *fetch* only for
+    the gaps of the index, e.g.::
+
+        store = HistoricalCandleStore("~/.binbot/klines")
+        df = store.get_klines(
+            ExchangeId.BINANCE, "BTCUSDC", "15m", start_ms, end_ms,
+            fetch=lambda start, end: api.get_ui_klines(
+                "BTCUSDC", "15m", limit=1000, start_time=start, end_time=end
+            ),
+        )
+
+    Raw ``.npy`` is used rather than Parquet to avoid an extra dependency.
+    Backtests can run offline by omitting *fetch*.
+    """
+
+    columns_order = Candles.kucoin_cols
+
+    def __init__(self, root: str | os.PathLike[str], compact: bool = False) -> None:
+        self.root = Path(root).expanduser()
+        float_dtype = np.float32 if compact else np.float64
+        self.dtype = np.dtype(
+            [
+                (col, np.int64 if col in Candles.time_cols else float_dtype)
+                for col in self.columns_order
+            ]
+        )
+
+    def _directory(self, exchange: ExchangeId, symbol: str, interval: str) -> Path:
+        return self.root / ExchangeId(exchange).value / symbol / interval
+
+    def covered(self, exchange: ExchangeId, symbol: str, interval: str) -> list[Range]:
+        """Open time ranges ``[start, end)`` already stored on disk."""
+        path = self._directory(exchange, symbol, interval) / "index.json"
+        if not path.exists():
+            return []
+        with path.open() as handle:
+            return [(int(start), int(end)) for start, end in json.load(handle)]
+
+    def mark_covered(
+        self, exchange: ExchangeId, symbol: str, interval: str, start: int, end: int
+    ) -> None:
+        ranges = _merge_ranges(
+            [*self.covered(exchange, symbol, interval), (start, end)]
+        )
+        path = self._directory(exchange, symbol, interval) / "index.json"
+        _atomic_write(path, lambda handle: json.dump(ranges, handle), "w")
+
+    def missing(
+        self, exchange: ExchangeId, symbol: str, interval: str, start: int, end: int
+    ) -> list[Range]:
+        """Gaps of ``[start, end)`` that are not covered yet."""
+        return _subtract(start, end, self.covered(exchange, symbol, interval))
+
+    def write(
+        self,
+        exchange: ExchangeId,
+        symbol: str,
+        interval: str,
+        columns: dict[str, np.ndarray],
+    ) -> int:
+        """
+        Merge candle columns (e.g. ``Candles.parse_exchange_klines`` output)
+        into their monthly segments. Rows with an existing open time replace
+        it. Returns the number of rows written.
+        """
+        size = len(columns["open_time"])
+        if not size:
+            return 0
+        records: np.ndarray = np.empty(size, dtype=self.dtype)
+        for col in self.columns_order:
+            records[col] = columns.get(col, np.nan)
+        records = records[np.argsort(records["open_time"], kind="stable")]
+
+        months = _months(records["open_time"])
+        boundaries = np.flatnonzero(months[1:] != months[:-1]) + 1
+        directory = self._directory(exchange, symbol, interval)
+        for part, month in zip(
+            np.split(records, boundaries), months[np.append(0, boundaries)]
+        ):
+            path = directory / f"{month}.npy"
+            if path.exists():
+                part = np.concatenate((np.load(path), part))
+                order = np.argsort(part["open_time"], kind="stable")
+                part = part[order]
+                # The latest write wins for duplicated open times
+                keep = np.append(part["open_time"][1:] != part["open_time"][:-1], True)
+                part = part[keep]
+            _atomic_write(path, partial(np.save, arr=part), "wb")
+        return size
+
+    def read(
+        self, exchange: ExchangeId, symbol: str, interval: str, start: int, end: int
+    ) -> dict[str, np.ndarray]:
+        """
+        Stored candles with open times in ``[start, end)``. A range inside a
+        single month returns read-only views of the memory-mapped segment.
+        """
+        directory = self._directory(exchange, symbol, interval)
+        first, last = _months(np.array([start, max(end - 1, start)]))
+        parts = []
+        for month in np.arange(first, last + 1):
+            path = directory / f"{month}.npy"
+            if not path.exists():
+                continue
+            segment = np.load(path, mmap_mode="r")
+            open_times = segment["open_time"]
+            lo, hi = np.searchsorted(open_times, [start, end])
+            if hi > lo:
+                parts.append(segment[lo:hi])
+
+        if not parts:
+            records = np.empty(0, dtype=self.dtype)
+        elif len(parts) == 1:
+            records = parts[0]
+        else:
+            records = np.concatenate(parts)
+        return {col: records[col] for col in self.columns_order}
+
+    def get_klines(
+        self,
+        exchange: ExchangeId,
+        symbol: str,
+        interval: str,
+        start: int,
+        end: int,
+        fetch: KlineFetcher | None = None,
+        now_ms: int | None = None,
+        index: bool = True,
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Closed candles with open times in ``[start, end)``, downloading only
+        the ranges missing from the index through *fetch* (raw rows, as
+        returned by ``BinanceApi.get_ui_klines`` or
+        ``KucoinFutures.get_klines``). *fetch* is called repeatedly per gap,
+        from the last received candle, so page-limited endpoints work. The
+        candle still forming at *now_ms* is never stored.
+        """
+        interval_ms = interval_to_ms(interval)
+        now_ms = now_ms if now_ms is not None else int(time() * 1000)
+        start -= start % interval_ms
+        # Only closed candles can be covered
+        fetch_end = min(end, now_ms - now_ms % interval_ms)
+
+        if fetch is not None:
+            for gap_start, gap_end in self.missing(
+                exchange, symbol, interval, start, fetch_end
+            ):
+                self._backfill(
+                    exchange, symbol, interval, gap_start, gap_end, fetch, now_ms
+                )
+
+        df = DataFrame(self.read(exchange, symbol, interval, start, end))
+        if index:
+            df.index = to_datetime(df["close_time"], unit="ms").rename("timestamp")
+        return cast(TypedDataFrame[KlineSchema], df)
+
+    def _backfill(
+        self,
+        exchange: ExchangeId,
+        symbol: str,
+        interval: str,
+        start: int,
+        end: int,
+        fetch: KlineFetcher,
+        now_ms: int,
+    ) -> None:
+        interval_ms = interval_to_ms(interval)
+        # An empty answer only proves candles missing once the exchange had a
+        # full interval to publish them; the latest closed one is retried
+        settled = now_ms - now_ms % interval_ms - interval_ms
+        cursor = start
+        while cursor < end:
+            rows, _ = Candles.partition_closed_candles(
+                list(fetch(cursor, end - 1)), now_ms=now_ms
+            )
+            columns = Candles.parse_exchange_klines(exchange, rows) if rows else {}
+            if columns:
+                open_times = columns["open_time"]
+                inside = (open_times >= cursor) & (open_times < end)
+                columns = {col: values[inside] for col, values in columns.items()}
+            if not columns or not len(columns["open_time"]):
+                # Nothing (more) to download in this gap, e.g. before listing
+                cursor = max(cursor, min(end, settled))
+                break
+            self.write(exchange, symbol, interval, columns)
+            cursor = int(columns["open_time"].max()) + interval_ms
+            self.mark_covered(exchange, symbol, interval, start, min(cursor, end))
+        if cursor > start:
+            self.mark_covered(exchange, symbol, interval, start, min(cursor, end))
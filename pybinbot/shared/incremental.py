@@ -0,0 +1,481 @@
+from collections import deque
+from collections.abc import Mapping
+from math import isnan, nan, sqrt
+from typing import Any
+
+from pandera.typing import DataFrame as TypedDataFrame
+from pybinbot.models.signals import KlineProduceModel, KlineSchema
+from pybinbot.shared.kernels import DAY_MS
+from pybinbot.shared.extrema import RollingExtrema
+
+
+class _RollingSum:
+    """
+    Fixed window running sum that skips NaN samples, like pandas ``rolling``.
+
+    The sum is rebuilt from the window once every ``window`` evictions so
+    floating point drift from repeated add/subtract stays bounded.
+    """
+
+    def __init__(self, window: int, min_periods: int | None = None) -> None:
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.values: deque[float] = deque(maxlen=window)
+        self.total = 0.0
+        self.count = 0
+        self._evictions = 0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.window:
+            evicted = self.values[0]
+            if not isnan(evicted):
+                self.total -= evicted
+                self.count -= 1
+            self._evictions += 1
+        self.values.append(value)
+        if not isnan(value):
+            self.total += value
+            self.count += 1
+        if self._evictions >= self.window:
+            self.total = sum(v for v in self.values if not isnan(v))
+            self._evictions = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= max(self.min_periods, 1)
+
+    @property
+    def sum(self) -> float:
+        return self.total if self.ready else nan
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.ready else nan
+
+
+class _RollingMoments:
+    """
+    Sliding window mean and sample standard deviation (ddof=1) using
+    Welford's update, with the oldest sample removed in the same step.
+    NaN samples are skipped, and like pandas ``rolling`` (min_periods =
+    window) the window is only ready once it holds no NaN.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._evictions = 0
+
+    def _add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        self.count -= 1
+        if not self.count:
+            self.mean = self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.window:
+            evicted = self.values[0]
+            if not isnan(evicted):
+                self._remove(evicted)
+            self._evictions += 1
+        self.values.append(value)
+        if not isnan(value):
+            self._add(value)
+        if self._evictions >= self.window:
+            # Two-pass rebuild keeps the running moments from drifting
+            valid = [v for v in self.values if not isnan(v)]
+            self.mean = sum(valid) / len(valid) if valid else 0.0
+            self.m2 = sum((v - self.mean) ** 2 for v in valid)
+            self._evictions = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.count == self.window
+
+    @property
+    def std(self) -> float:
+        if not self.ready or self.window < 2:
+            return nan
+        return sqrt(max(self.m2, 0.0) / (self.window - 1))
+
+
+class _Ewm:
+    """
+    Exponentially weighted mean matching ``Series.ewm(span=...).mean()``.
+
+    ``adjust=True`` keeps the weighted numerator and denominator separately,
+    as pandas does. Leading NaN samples are skipped and ``min_periods``
+    counts valid observations only. Later NaN samples decay the weight of
+    the previous value, as ``ewm(ignore_na=False)`` does.
+    """
+
+    def __init__(self, span: int, adjust: bool, min_periods: int = 0) -> None:
+        self.alpha = 2 / (span + 1)
+        self.decay = 1 - self.alpha
+        self.adjust = adjust
+        self.min_periods = max(min_periods, 1)
+        self.numerator = 0.0
+        self.denominator = 0.0
+        self.value = nan
+        self.count = 0
+        # adjust=False: weight of the previous value, decayed across NaN gaps
+        self.weight = 1.0
+
+    def push(self, value: float) -> float:
+        if isnan(value):
+            if self.count:
+                self.numerator *= self.decay
+                self.denominator *= self.decay
+                self.weight *= self.decay
+            return self.current
+
+        self.count += 1
+        if self.adjust:
+            self.numerator = self.decay * self.numerator + value
+            self.denominator = self.decay * self.denominator + 1
+            self.value = self.numerator / self.denominator
+        elif self.count == 1:
+            self.value = value
+        else:
+            weight = self.weight * self.decay
+            self.value = (weight * self.value + self.alpha * value) / (
+                weight + self.alpha
+            )
+            self.weight = 1.0
+        return self.current
+
+    @property
+    def current(self) -> float:
+        return self.value if self.count >= self.min_periods else nan
+
+
+class IncrementalIndicators:
+    """
+    Streaming counterpart of ``Indicators`` for one (symbol, interval).
+
+    Holds the rolling state of every supported indicator and updates it in
+    constant time per closed candle, so websocket consumers do not need to
+    recompute whole columns on every tick. Values follow the same column
+    names, windows and warm-up (NaN) rules as the batch functions:
+
+    - ``ma_{period}``: ``Indicators.moving_averages``
+    - ``ema_{span}``: ``Indicators.ema``
+    - ``macd``, ``macd_signal``: ``Indicators.macd``
+    - ``rsi``: ``Indicators.rsi``
+    - ``ATR``: ``Indicators.atr``
+    - ``bb_upper``, ``bb_mid``, ``bb_lower``: ``Indicators.bollinguer_spreads``
+    - ``supertrend``, ``supertrend_dir``: ``Indicators.set_supertrend``
+    - ``mfi``: ``Indicators.mfi``
+    - ``donchian_upper``, ``donchian_mid``, ``donchian_lower``:
+      ``Indicators.donchian``
+    - ``stoch_k``, ``stoch_d``: ``Indicators.stochastic``
+    - ``williams_r``: ``Indicators.williams_r`` (over ``stochastic_window``)
+    - ``twap``: ``Indicators.set_twap`` (needs ``close_time``)
+    - ``vwap``: session ``Indicators.set_vwap`` (sessions need ``open_time``)
+
+    Running sums are periodically rebuilt from their windows, so streamed
+    values agree with the batch columns to floating point rounding.
+    Candles are expected to be closed and in chronological order; when an
+    ``open_time`` is given, repeated or older candles are ignored.
+    """
+
+    def __init__(
+        self,
+        ma_periods: tuple[int, ...] = (7, 25, 100),
+        ema_spans: tuple[int, ...] = (9,),
+        rsi_window: int = 14,
+        atr_window: int = 14,
+        bb_window: int = 20,
+        bb_num_std: float = 2,
+        supertrend_multiplier: float = 3.0,
+        mfi_window: int = 14,
+        donchian_window: int = 20,
+        stochastic_window: int = 14,
+        stochastic_d_window: int = 3,
+        twap_periods: int = 30,
+        vwap_session_ms: int = DAY_MS,
+    ) -> None:
+        self.bb_num_std = bb_num_std
+        self.supertrend_multiplier = supertrend_multiplier
+        self.vwap_session_ms = vwap_session_ms
+        self.last_open_time: int | None = None
+        self.count = 0
+
+        self._ma = {period: _RollingSum(period) for period in ma_periods}
+        self._ema = {span: _Ewm(span, adjust=False) for span in ema_spans}
+        self._macd_fast = _Ewm(12, adjust=True, min_periods=12)
+        self._macd_slow = _Ewm(26, adjust=True, min_periods=26)
+        self._macd_signal = _Ewm(9, adjust=True, min_periods=9)
+        self._rsi_gain = _RollingSum(rsi_window)
+        self._rsi_loss = _RollingSum(rsi_window)
+        self._true_range = _RollingSum(atr_window)
+        self._bollinger = _RollingMoments(bb_window)
+        self._mfi_positive = _RollingSum(mfi_window)
+        self._mfi_negative = _RollingSum(mfi_window)
+        self._donchian = RollingExtrema(donchian_window)
+        self._stochastic = RollingExtrema(stochastic_window)
+        self._stochastic_d = _RollingSum(stochastic_d_window)
+        self._twap_weighted = _RollingSum(twap_periods)
+        self._twap_duration = _RollingSum(twap_periods)
+        self._vwap_session: int | None = None
+        self._vwap_weighted = 0.0
+        self._vwap_volume = 0.0
+        self._prev_close_time = nan
+
+        self._prev_close = nan
+        self._prev_typical_price = nan
+        self._final_upper = nan
+        self._final_lower = nan
+        self._direction = 0
+        self.values: dict[str, float] = {}
+
+    @classmethod
+    def from_frame(
+        cls, df: TypedDataFrame[KlineSchema], **kwargs: Any
+    ) -> "IncrementalIndicators":
+        """
+        Warm up the state from historical candles, e.g. a REST backfill
+        produced by ``Candles.pre_process``.
+        """
+        state = cls(**kwargs)
+        open_times = df["open_time"].tolist() if "open_time" in df else [None] * len(df)
+        close_times = (
+            df["close_time"].tolist() if "close_time" in df else [None] * len(df)
+        )
+        for open_time, close_time, high, low, close, volume in zip(
+            open_times,
+            close_times,
+            df["high"].tolist(),
+            df["low"].tolist(),
+            df["close"].tolist(),
+            df["volume"].tolist(),
+        ):
+            state.update(
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                open_time=None if open_time is None else int(open_time),
+                close_time=None if close_time is None else int(close_time),
+            )
+        return state
+
+    def update_from_kline(
+        self, kline: KlineProduceModel | Mapping[str, Any]
+    ) -> dict[str, float]:
+        """
+        Consume a closed candle as produced by the websocket clients
+        (``KlineProduceModel`` or its ``model_dump()``).
+        """
+        if isinstance(kline, Mapping):
+            kline = KlineProduceModel.model_validate(kline)
+        return self.update(
+            high=float(kline.high_price),
+            low=float(kline.low_price),
+            close=float(kline.close_price),
+            volume=float(kline.volume),
+            open_time=int(kline.open_time),
+            close_time=int(kline.close_time),
+        )
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        open_time: int | None = None,
+        close_time: int | None = None,
+    ) -> dict[str, float]:
+        """
+        Apply one closed candle and return the latest indicator values.
+        Timestamps are epoch milliseconds.
+        """
+        if open_time is not None:
+            if self.last_open_time is not None and open_time <= self.last_open_time:
+                return self.values
+            self.last_open_time = open_time
+
+        self.count += 1
+        values: dict[str, float] = {}
+        prev_close = self._prev_close
+
+        for period, window in self._ma.items():
+            window.push(close)
+            values[f"ma_{period}"] = window.mean
+
+        for span, ewm in self._ema.items():
+            values[f"ema_{span}"] = ewm.push(close)
+
+        fast = self._macd_fast.push(close)
+        slow = self._macd_slow.push(close)
+        macd = fast - slow
+        values["macd"] = macd
+        values["macd_signal"] = self._macd_signal.push(macd)
+
+        change = close - prev_close
+        if isnan(change):
+            self._rsi_gain.push(nan)
+            self._rsi_loss.push(nan)
+        else:
+            self._rsi_gain.push(max(change, 0.0))
+            self._rsi_loss.push(max(-change, 0.0))
+        avg_up = self._rsi_gain.mean
+        avg_down = self._rsi_loss.mean
+        total = avg_up + avg_down
+        values["rsi"] = 100 * avg_up / total if total else nan
+
+        # pandas' row-wise max skips the NaN gaps of the first candle
+        true_range = high - low
+        if not isnan(prev_close):
+            true_range = max(true_range, abs(high - prev_close), abs(low - prev_close))
+        self._true_range.push(true_range)
+        atr = self._true_range.mean
+        values["ATR"] = atr
+
+        self._bollinger.push(close)
+        if self._bollinger.ready:
+            mid = self._bollinger.mean
+            spread = self.bb_num_std * self._bollinger.std
+            values["bb_upper"] = mid + spread
+            values["bb_mid"] = mid
+            values["bb_lower"] = mid - spread
+        else:
+            values["bb_upper"] = values["bb_mid"] = values["bb_lower"] = nan
+
+        values.update(self._update_supertrend(high, low, close, atr))
+        values["mfi"] = self._update_mfi(high, low, close, volume)
+        values.update(self._update_channels(high, low, close))
+        values["twap"] = self._update_twap(close, open_time, close_time)
+        values["vwap"] = self._update_vwap(high, low, close, volume, open_time)
+
+        self._prev_close = close
+        self.values = values
+        return values
+
+    def _update_supertrend(
+        self, high: float, low: float, close: float, atr: float
+    ) -> dict[str, float]:
+        hl2 = (high + low) / 2
+        upper = hl2 + self.supertrend_multiplier * atr
+        lower = hl2 - self.supertrend_multiplier * atr
+
+        if self.count == 1:
+            self._final_upper = upper
+            self._final_lower = lower
+            return {"supertrend": nan, "supertrend_dir": 0}
+
+        prev_upper = self._final_upper
+        prev_lower = self._final_lower
+        prev_close = self._prev_close
+        final_upper = min(upper, prev_upper) if prev_close <= prev_upper else upper
+        final_lower = max(lower, prev_lower) if prev_close >= prev_lower else lower
+
+        if close > prev_upper:
+            self._direction = 1
+        elif close < prev_lower:
+            self._direction = -1
+
+        self._final_upper = final_upper
+        self._final_lower = final_lower
+        return {
+            "supertrend": final_lower if self._direction == 1 else final_upper,
+            "supertrend_dir": self._direction,
+        }
+
+    def _update_channels(
+        self, high: float, low: float, close: float
+    ) -> dict[str, float]:
+        self._donchian.push(high, low)
+        upper = self._donchian.highest
+        lower = self._donchian.lowest
+
+        self._stochastic.push(high, low)
+        highest = self._stochastic.highest
+        lowest = self._stochastic.lowest
+        price_range = highest - lowest
+        stoch_k = 100 * (close - lowest) / price_range if price_range else nan
+        self._stochastic_d.push(stoch_k)
+
+        return {
+            "donchian_upper": upper,
+            "donchian_mid": (upper + lower) / 2,
+            "donchian_lower": lower,
+            "stoch_k": stoch_k,
+            "stoch_d": self._stochastic_d.mean,
+            "williams_r": -100 * (highest - close) / price_range
+            if price_range
+            else nan,
+        }
+
+    def _update_twap(
+        self, close: float, open_time: int | None, close_time: int | None
+    ) -> float:
+        if close_time is None:
+            duration = nan
+        elif self.count == 1:
+            duration = nan if open_time is None else close_time - open_time + 1
+        else:
+            duration = close_time - self._prev_close_time
+        self._prev_close_time = nan if close_time is None else close_time
+
+        self._twap_weighted.push(close * duration)
+        self._twap_duration.push(duration)
+        total_duration = self._twap_duration.sum
+        if not total_duration:
+            return nan
+        return self._twap_weighted.sum / total_duration
+
+    def _update_vwap(
+        self,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        open_time: int | None,
+    ) -> float:
+        session = None if open_time is None else open_time // self.vwap_session_ms
+        if session != self._vwap_session:
+            self._vwap_session = session
+            self._vwap_weighted = 0.0
+            self._vwap_volume = 0.0
+
+        weighted = (high + low + close) / 3 * volume
+        if not isnan(weighted):
+            self._vwap_weighted += weighted
+            self._vwap_volume += volume
+        if not self._vwap_volume:
+            return nan
+        return self._vwap_weighted / self._vwap_volume
+
+    def _update_mfi(
+        self, high: float, low: float, close: float, volume: float
+    ) -> float:
+        typical_price = (high + low + close) / 3
+        raw_money_flow = typical_price * volume
+        prev_typical_price = self._prev_typical_price
+        self._prev_typical_price = typical_price
+
+        self._mfi_positive.push(
+            raw_money_flow if typical_price > prev_typical_price else 0.0
+        )
+        self._mfi_negative.push(
+            raw_money_flow if typical_price < prev_typical_price else 0.0
+        )
+        positive_sum = self._mfi_positive.sum
+        negative_sum = self._mfi_negative.sum
+        if isnan(positive_sum) or isnan(negative_sum) or negative_sum == 0:
+            return 100.0
+        return 100 - (100 / (1 + positive_sum / negative_sum))
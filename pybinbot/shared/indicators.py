@@ -1,7 +1,84 @@
+from math import ceil, log
 from typing import cast
-from pandas import Series, Timedelta, concat, to_datetime
+
+import numpy as np
+from pandas import Series
+from pandas.api.types import is_datetime64_any_dtype
 from pandera.typing import DataFrame as TypedDataFrame
 from pybinbot.models.signals import KlineSchema
+from pybinbot.shared import extrema, kernels
+
+# Weight of the truncated history below which an EWM tail is considered exact
+EWM_TAIL_TOLERANCE = 1e-10
+
+
+def _ewm_warmup(span: int) -> int:
+    """Candles needed for the discarded EWM weights to drop below tolerance."""
+    decay = 1 - 2 / (span + 1)
+    if decay <= 0:
+        return 0
+    return ceil(log(EWM_TAIL_TOLERANCE) / log(decay))
+
+
+def _tail_window(
+    df: TypedDataFrame[KlineSchema], tail: int | None, warmup: int
+) -> TypedDataFrame[KlineSchema]:
+    """Trailing rows needed to compute the last *tail* values."""
+    if tail is None:
+        return df
+    if tail < 1:
+        raise ValueError("tail must be a positive number of rows")
+    rows = tail + warmup
+    if rows >= len(df):
+        return df
+    return cast(TypedDataFrame[KlineSchema], df.iloc[-rows:])
+
+
+def compact_dtype(df: TypedDataFrame[KlineSchema]) -> type[np.floating] | None:
+    """float32 when *df* is a compact frame (float32 prices), otherwise None."""
+    if "close" in df and df["close"].dtype == np.float32:
+        return np.float32
+    return None
+
+
+def _set_column(
+    df: TypedDataFrame[KlineSchema],
+    column: str,
+    values: Series | np.ndarray,
+    tail: int | None,
+    fill: float = np.nan,
+) -> None:
+    """
+    Attach *values* to *df*. In tail mode only the last *tail* rows are
+    filled; everything before them is set to *fill*. Float results are
+    stored as float32 on compact frames.
+    """
+    computed = np.asarray(values)
+    dtype = compact_dtype(df)
+    if dtype is not None and computed.dtype.kind == "f":
+        computed = computed.astype(dtype)
+
+    if tail is None:
+        df[column] = computed
+        return
+
+    size = min(tail, len(computed), len(df))
+    # NaN fits any float dtype; only integer results may need widening
+    if computed.dtype.kind == "f":
+        out_dtype = computed.dtype
+    else:
+        out_dtype = np.result_type(computed.dtype, type(fill))
+    out = np.full(len(df), fill, dtype=out_dtype)
+    if size:
+        out[-size:] = computed[-size:]
+    df[column] = out
+
+
+def _epoch_ms(values: Series) -> np.ndarray:
+    """Epoch milliseconds; datetime columns are reinterpreted, not parsed."""
+    if is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype="datetime64[ms]").astype(np.int64)
+    return values.to_numpy()
 
 
 class Indicators:
@@ -9,37 +86,55 @@ class Indicators:
     Technical indicators for financial data analysis
     this avoids using ta-lib because that requires
     dependencies that causes issues in the infrastructure
+
+    The math lives in ``pybinbot.shared.kernels`` as NumPy functions over
+    the frame's column arrays; these methods only slice, call the kernel
+    and attach the result.
+
+    Column producing indicators accept ``tail``: when set, only the last
+    ``tail`` rows are computed, using the trailing window plus warm-up the
+    indicator needs, and earlier rows are left as NaN. Signal code that only
+    reads ``iloc[-1]`` can pass ``tail=1``. Rolling window indicators are
+    exact in tail mode; EWM based ones (EMA, MACD) discard history whose
+    weight is below ``EWM_TAIL_TOLERANCE``.
+
+    On compact frames (float32 prices, see ``Candles.compact_dtypes``) the
+    math still runs in float64 and the new columns are stored as float32.
     """
 
     @staticmethod
     def moving_averages(
-        df: TypedDataFrame[KlineSchema], period=7
+        df: TypedDataFrame[KlineSchema], period=7, tail: int | None = None
     ) -> TypedDataFrame[KlineSchema]:
         """
         Calculate moving averages for 7, 25, 100 days
         this also takes care of Bollinguer bands
         """
-        df[f"ma_{period}"] = df["close"].rolling(window=period).mean()
+        window_df = _tail_window(df, tail, period - 1)
+        ma = kernels.rolling_mean(window_df["close"].to_numpy(), period)
+        _set_column(df, f"ma_{period}", ma, tail)
         return df
 
     @staticmethod
-    def macd(df: TypedDataFrame[KlineSchema]) -> TypedDataFrame[KlineSchema]:
+    def macd(
+        df: TypedDataFrame[KlineSchema], tail: int | None = None
+    ) -> TypedDataFrame[KlineSchema]:
         """
         Moving Average Convergence Divergence (MACD) indicator
         https://www.alpharithms.com/calculate-macd-python-272222/
         """
+        window_df = _tail_window(df, tail, _ewm_warmup(26) + _ewm_warmup(9))
 
-        k = df["close"].ewm(span=12, min_periods=12).mean()
+        close = window_df["close"].to_numpy()
         # Get the 12-day EMA of the closing price
-        d = df["close"].ewm(span=26, min_periods=26).mean()
+        macd = kernels.ewm_mean(close, span=12, min_periods=12)
         # Subtract the 26-day EMA from the 12-Day EMA to get the MACD
-        macd = k - d
-        # Get the 9-Day EMA of the MACD for the Trigger line
+        macd -= kernels.ewm_mean(close, span=26, min_periods=26)
         # Get the 9-Day EMA of the MACD for the Trigger line
-        macd_s = macd.ewm(span=9, min_periods=9).mean()
+        macd_s = kernels.ewm_mean(macd, span=9, min_periods=9)
 
-        df["macd"] = macd
-        df["macd_signal"] = macd_s
+        _set_column(df, "macd", macd, tail)
+        _set_column(df, "macd_signal", macd_s, tail)
 
         return df
 
@@ -49,13 +144,16 @@ class Indicators:
         column: str = "close",
         span: int = 9,
         out_col: str | None = None,
+        tail: int | None = None,
     ) -> TypedDataFrame[KlineSchema]:
         """Exponential moving average for a given column.
 
         Adds a new column with the EMA values and returns the DataFrame.
         """
         target_col = out_col or f"ema_{span}"
-        df[target_col] = df[column].ewm(span=span, adjust=False).mean()
+        window_df = _tail_window(df, tail, _ewm_warmup(span))
+        ema = kernels.ewm_mean(window_df[column].to_numpy(), span=span, adjust=False)
+        _set_column(df, target_col, ema, tail)
         return df
 
     @staticmethod
@@ -64,50 +162,41 @@ class Indicators:
         column: str = "close",
         fast_span: int = 9,
         slow_span: int = 21,
+        tail: int | None = None,
     ) -> TypedDataFrame[KlineSchema]:
         """Compute fast and slow EMAs for trend analysis.
 
         Adds 'ema_fast' and 'ema_slow' columns and returns the DataFrame.
         """
-        df = Indicators.ema(df, column=column, span=fast_span, out_col="ema_fast")
-        df = Indicators.ema(df, column=column, span=slow_span, out_col="ema_slow")
+        df = Indicators.ema(
+            df, column=column, span=fast_span, out_col="ema_fast", tail=tail
+        )
+        df = Indicators.ema(
+            df, column=column, span=slow_span, out_col="ema_slow", tail=tail
+        )
         return df
 
     @staticmethod
     def rsi(
-        df: TypedDataFrame[KlineSchema], window: int = 14
+        df: TypedDataFrame[KlineSchema], window: int = 14, tail: int | None = None
     ) -> TypedDataFrame[KlineSchema]:
         """
         Relative Strength Index (RSI) indicator
         https://www.qmr.ai/relative-strength-index-rsi-in-python/
         """
-
-        change = df["close"].astype(float).diff()
-
-        gain = change.mask(change < 0, 0.0)
-        loss = -change.mask(change > 0, -0.0)
-
-        # Verify that we did not make any mistakes
-        change.equals(gain + loss)
-
-        # Calculate the rolling average of average up and average down
-        avg_up = gain.rolling(window).mean()
-        avg_down = loss.rolling(window).mean().abs()
-
-        rsi = 100 * avg_up / (avg_up + avg_down)
-        df["rsi"] = rsi
+        window_df = _tail_window(df, tail, window)
+        rsi = kernels.rsi(window_df["close"].to_numpy(), window)
+        _set_column(df, "rsi", rsi, tail)
 
         return df
 
     @staticmethod
     def standard_rsi(
-        df: TypedDataFrame[KlineSchema], window: int = 14
+        df: TypedDataFrame[KlineSchema], window: int = 14, tail: int | None = None
     ) -> TypedDataFrame[KlineSchema]:
-        delta = df["close"].diff()
-        gain = delta.where(delta > 0, 0).rolling(window=window, min_periods=1).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window, min_periods=1).mean()
-        rs = gain / (loss + 1e-10)
-        df["rsi"] = 100 - (100 / (1 + rs))
+        window_df = _tail_window(df, tail, window)
+        rsi = kernels.standard_rsi(window_df["close"].to_numpy(), window)
+        _set_column(df, "rsi", rsi, tail)
         return df
 
     @staticmethod
@@ -118,24 +207,21 @@ class Indicators:
         Requires 'high', 'low', 'close', and 'volume' columns.
         Returns the latest MFI value in the 0-100 range.
         """
-        typical_price = (df["high"] + df["low"] + df["close"]) / 3
-        raw_money_flow = typical_price * df["volume"]
-
-        tp_change = typical_price.diff()
-        positive_flow = raw_money_flow.where(tp_change > 0, 0.0)
-        negative_flow = raw_money_flow.where(tp_change < 0, 0.0)
-
-        positive_sum = positive_flow.rolling(window).sum()
-        negative_sum = negative_flow.rolling(window).sum()
-
-        money_ratio = positive_sum / negative_sum.replace(0, float("nan"))
-        raw_mfi = 100 - (100 / (1 + money_ratio))
-        mfi = raw_mfi.fillna(100.0)
-
-        return float(mfi.iloc[-1])
+        # The last value only depends on the last window flows plus one diff
+        df = _tail_window(df, 1, window)
+        mfi = kernels.money_flow_index(
+            df["high"].to_numpy(),
+            df["low"].to_numpy(),
+            df["close"].to_numpy(),
+            df["volume"].to_numpy(),
+            window,
+        )
+        return float(mfi[-1])
 
     @staticmethod
-    def ma_spreads(df: TypedDataFrame[KlineSchema]) -> TypedDataFrame[KlineSchema]:
+    def ma_spreads(
+        df: TypedDataFrame[KlineSchema], tail: int | None = None
+    ) -> TypedDataFrame[KlineSchema]:
         """
         Calculates spread based on bollinger bands,
         for later use in take profit and stop loss
@@ -144,18 +230,20 @@ class Indicators:
         - top_band: diff between ma_25 and ma_100
         - bottom_band: diff between ma_7 and ma_25
         """
+        window_df = _tail_window(df, tail, 0)
 
-        band_1 = (abs(df["ma_100"] - df["ma_25"]) / df["ma_100"]) * 100
-        band_2 = (abs(df["ma_25"] - df["ma_7"]) / df["ma_25"]) * 100
+        ma_25 = window_df["ma_25"].to_numpy()
+        band_1 = kernels.ma_spread(window_df["ma_100"].to_numpy(), ma_25)
+        band_2 = kernels.ma_spread(ma_25, window_df["ma_7"].to_numpy())
 
-        df["big_ma_spread"] = band_1
-        df["small_ma_spread"] = band_2
+        _set_column(df, "big_ma_spread", band_1, tail)
+        _set_column(df, "small_ma_spread", band_2, tail)
 
         return df
 
     @staticmethod
     def bollinguer_spreads(
-        df: TypedDataFrame[KlineSchema], window=20, num_std=2
+        df: TypedDataFrame[KlineSchema], window=20, num_std=2, tail: int | None = None
     ) -> TypedDataFrame[KlineSchema]:
         """
         Calculates Bollinguer bands
@@ -163,21 +251,20 @@ class Indicators:
         https://www.kaggle.com/code/blakemarterella/pandas-bollinger-bands
 
         """
-        bb_df = df.copy()
-        bb_df["rolling_mean"] = bb_df["close"].rolling(window).mean()
-        bb_df["rolling_std"] = bb_df["close"].rolling(window).std()
-        bb_df["upper_band"] = bb_df["rolling_mean"] + (num_std * bb_df["rolling_std"])
-        bb_df["lower_band"] = bb_df["rolling_mean"] - (num_std * bb_df["rolling_std"])
+        window_df = _tail_window(df, tail, window - 1)
+        upper, mid, lower = kernels.bollinger_bands(
+            window_df["close"].to_numpy(), window, num_std
+        )
 
-        df["bb_upper"] = bb_df["upper_band"]
-        df["bb_lower"] = bb_df["lower_band"]
-        df["bb_mid"] = bb_df["rolling_mean"]
+        _set_column(df, "bb_upper", upper, tail)
+        _set_column(df, "bb_lower", lower, tail)
+        _set_column(df, "bb_mid", mid, tail)
 
         return df
 
     @staticmethod
     def log_volatility(
-        df: TypedDataFrame[KlineSchema], window_size=7
+        df: TypedDataFrame[KlineSchema], window_size=7, tail: int | None = None
     ) -> TypedDataFrame[KlineSchema]:
         """
         Volatility (standard deviation of returns) using logarithm, this normalizes data
@@ -186,37 +273,76 @@ class Indicators:
         Returns:
         - Volatility in percentage
         """
-        log_volatility = (
-            Series(df["close"]).astype(float).pct_change().rolling(window_size).std()
-        )
-        df["perc_volatility"] = log_volatility
+        window_df = _tail_window(df, tail, window_size)
+        returns = kernels.pct_change(window_df["close"].to_numpy())
+        log_volatility = kernels.rolling_std(returns, window_size, out=returns)
+        _set_column(df, "perc_volatility", log_volatility, tail)
 
         return df
 
     @staticmethod
     def set_twap(
-        df: TypedDataFrame[KlineSchema], periods: int = 30
+        df: TypedDataFrame[KlineSchema], periods: int = 30, tail: int | None = None
     ) -> TypedDataFrame[KlineSchema]:
         """
-        Time-weighted average price
-        https://stackoverflow.com/a/69517577/2454059
+        Time-weighted average price over the last ``periods`` candles.
 
-        Periods kept at 4 by default,
-        otherwise there's not enough data
+        Each close is weighted by the milliseconds since the previous
+        ``close_time``, so gaps in the data count for the time they
+        lasted. Computed from cumulative sums of the integer millisecond
+        timestamps, without datetime parsing or copying the frame.
+
+        Adds column: 'twap'
         """
-        pre_df = df.copy()
-        pre_df["Event Time"] = to_datetime(pre_df["close_time"])
-        time_diff_td = cast(
-            "Series[Timedelta]", pre_df["Event Time"].diff(periods=periods)
+        # One extra row: the first duration is measured from its close
+        window_df = _tail_window(df, tail, periods)
+        durations = kernels.candle_durations(
+            _epoch_ms(window_df["close_time"]),
+            _epoch_ms(window_df["open_time"]) if "open_time" in window_df else None,
         )
-        pre_df["Time Diff"] = time_diff_td.dt.total_seconds() / 3600
-        pre_df["Weighted Value"] = pre_df["close"] * pre_df["Time Diff"]
-        pre_df["Weighted Average"] = (
-            pre_df["Weighted Value"].rolling(periods).sum() / pre_df["Time Diff"].sum()
+        twap = kernels.rolling_weighted_mean(
+            window_df["close"].to_numpy(), durations, periods
         )
-        # Fixed window of given interval
-        df["twap"] = pre_df["Weighted Average"]
+        _set_column(df, "twap", twap, tail)
+        return df
 
+    @staticmethod
+    def set_vwap(
+        df: TypedDataFrame[KlineSchema],
+        periods: int | None = None,
+        session_ms: int = kernels.DAY_MS,
+        tail: int | None = None,
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Volume-weighted average of the typical price (high + low + close) / 3.
+
+        By default the average is anchored to sessions of ``session_ms``
+        (UTC days), keyed on ``open_time`` (or ``close_time``) in epoch
+        milliseconds. Pass ``periods`` for a rolling VWAP over the last
+        ``periods`` candles instead.
+
+        Adds column: 'vwap'
+        """
+        if periods is None:
+            # A session VWAP depends on every row since the session start
+            window_df = df
+        else:
+            window_df = _tail_window(df, tail, periods)
+
+        typical_price = kernels.as_float_array(window_df["high"])
+        typical_price = typical_price + kernels.as_float_array(window_df["low"])
+        typical_price += kernels.as_float_array(window_df["close"])
+        typical_price /= 3
+        volume = window_df["volume"].to_numpy()
+
+        if periods is None:
+            time_col = "open_time" if "open_time" in window_df else "close_time"
+            sessions = _epoch_ms(window_df[time_col]) // session_ms
+            vwap = kernels.session_weighted_mean(typical_price, volume, sessions)
+        else:
+            vwap = kernels.rolling_weighted_mean(typical_price, volume, periods)
+
+        _set_column(df, "vwap", vwap, tail)
         return df
 
     @staticmethod
@@ -225,6 +351,7 @@ class Indicators:
         window: int = 14,
         min_periods: int | None = None,
         col_prefix: str = "",
+        tail: int | None = None,
     ) -> TypedDataFrame[KlineSchema]:
         """
         Generic ATR indicator.
@@ -237,20 +364,15 @@ class Indicators:
         if min_periods is None:
             min_periods = window
 
-        prev_close = df["close"].shift(1)
-
-        tr = concat(
-            [
-                df["high"] - df["low"],
-                (df["high"] - prev_close).abs(),
-                (df["low"] - prev_close).abs(),
-            ],
-            axis=1,
-        ).max(axis=1)
-
-        df[f"{col_prefix}ATR"] = tr.rolling(
-            window=window, min_periods=min_periods
-        ).mean()
+        window_df = _tail_window(df, tail, window)
+        atr = kernels.atr(
+            window_df["high"].to_numpy(),
+            window_df["low"].to_numpy(),
+            window_df["close"].to_numpy(),
+            window=window,
+            min_periods=min_periods,
+        )
+        _set_column(df, f"{col_prefix}ATR", atr, tail)
 
         return df
 
@@ -260,6 +382,8 @@ class Indicators:
         atr_col: str = "ATR",
         multiplier: float = 3.0,
         prefix: str = "",
+        tail: int | None = None,
+        warmup: int = 200,
     ) -> TypedDataFrame[KlineSchema]:
         """
         Supertrend indicator.
@@ -268,48 +392,100 @@ class Indicators:
         Adds:
         - '{prefix}supertrend'
         - '{prefix}supertrend_dir'  (1 bullish, -1 bearish)
+
+        The bands are path dependent, so in tail mode they are rebuilt from
+        the last ``tail + warmup`` candles (the ATR column must cover them).
+        The band state re-anchors every time price crosses a band, so the
+        tail matches the full computation once a crossing falls inside the
+        warm-up.
         """
         if df.empty or atr_col not in df:
             return df
 
-        hl2 = (df["high"] + df["low"]) / 2
-        atr = df[atr_col]
+        window_df = _tail_window(df, tail, warmup)
+        supertrend, direction = kernels.supertrend(
+            window_df["high"].to_numpy(),
+            window_df["low"].to_numpy(),
+            window_df["close"].to_numpy(),
+            window_df[atr_col].to_numpy(),
+            multiplier=multiplier,
+        )
 
-        upperband = hl2 + multiplier * atr
-        lowerband = hl2 - multiplier * atr
+        _set_column(df, f"{prefix}supertrend", supertrend, tail)
+        _set_column(df, f"{prefix}supertrend_dir", direction, tail, fill=0)
 
-        final_upper = upperband.copy()
-        final_lower = lowerband.copy()
+        return df
 
-        for i in range(1, len(df)):
-            final_upper.iloc[i] = (
-                min(upperband.iloc[i], final_upper.iloc[i - 1])
-                if df["close"].iloc[i - 1] <= final_upper.iloc[i - 1]
-                else upperband.iloc[i]
-            )
+    @staticmethod
+    def highest_lowest(
+        df: TypedDataFrame[KlineSchema], window: int = 20, tail: int | None = None
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Rolling highest high and lowest low, e.g. for stop placement.
 
-            final_lower.iloc[i] = (
-                max(lowerband.iloc[i], final_lower.iloc[i - 1])
-                if df["close"].iloc[i - 1] >= final_lower.iloc[i - 1]
-                else lowerband.iloc[i]
-            )
+        Adds columns: 'highest_high', 'lowest_low'
+        """
+        window_df = _tail_window(df, tail, window - 1)
+        highest, lowest = extrema.rolling_extrema(
+            window_df["high"].to_numpy(), window_df["low"].to_numpy(), window
+        )
+        _set_column(df, "highest_high", highest, tail)
+        _set_column(df, "lowest_low", lowest, tail)
+        return df
 
-        direction = [0] * len(df)
-        supertrend = [None] * len(df)
+    @staticmethod
+    def donchian(
+        df: TypedDataFrame[KlineSchema], window: int = 20, tail: int | None = None
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Donchian channels
+
+        Adds columns: 'donchian_upper', 'donchian_lower', 'donchian_mid'
+        """
+        window_df = _tail_window(df, tail, window - 1)
+        upper, lower = extrema.rolling_extrema(
+            window_df["high"].to_numpy(), window_df["low"].to_numpy(), window
+        )
+        _set_column(df, "donchian_upper", upper, tail)
+        _set_column(df, "donchian_lower", lower, tail)
+        _set_column(df, "donchian_mid", (upper + lower) / 2, tail)
+        return df
 
-        for i in range(1, len(df)):
-            if df["close"].iloc[i] > final_upper.iloc[i - 1]:
-                direction[i] = 1
-            elif df["close"].iloc[i] < final_lower.iloc[i - 1]:
-                direction[i] = -1
-            else:
-                direction[i] = direction[i - 1]
+    @staticmethod
+    def stochastic(
+        df: TypedDataFrame[KlineSchema],
+        window: int = 14,
+        d_window: int = 3,
+        tail: int | None = None,
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Stochastic oscillator
 
-            supertrend[i] = (
-                final_lower.iloc[i] if direction[i] == 1 else final_upper.iloc[i]
-            )
+        Adds columns: 'stoch_k' (0-100) and 'stoch_d' (moving average of %K)
+        """
+        window_df = _tail_window(df, tail, window + d_window - 2)
+        highest, lowest = extrema.rolling_extrema(
+            window_df["high"].to_numpy(), window_df["low"].to_numpy(), window
+        )
+        stoch_k = extrema.stochastic_k(window_df["close"].to_numpy(), highest, lowest)
+        stoch_d = kernels.rolling_mean(stoch_k, d_window)
+        _set_column(df, "stoch_k", stoch_k, tail)
+        _set_column(df, "stoch_d", stoch_d, tail)
+        return df
 
-        df[f"{prefix}supertrend"] = supertrend
-        df[f"{prefix}supertrend_dir"] = direction
+    @staticmethod
+    def williams_r(
+        df: TypedDataFrame[KlineSchema], window: int = 14, tail: int | None = None
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Williams %R, in the -100 (oversold) to 0 (overbought) range
 
+        Adds column: 'williams_r'
+        """
+        window_df = _tail_window(df, tail, window - 1)
+        highest, lowest = extrema.rolling_extrema(
+            window_df["high"].to_numpy(), window_df["low"].to_numpy(), window
+        )
+        result = extrema.williams_r(window_df["close"].to_numpy(), highest, lowest)
+        _set_column(df, "williams_r", result, tail)
         return df
@@ -0,0 +1,598 @@
+from math import log2
+from typing import Any, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pandas import Series
+
+FloatArray = NDArray[np.floating[Any]]
+IntArray = NDArray[np.int64]
+
+# Milliseconds in a UTC day, the default VWAP session
+DAY_MS = 86_400_000
+
+# Largest power of two the scaled cumulative sums may reach inside one block
+MAX_BLOCK_EXPONENT = 256
+
+
+def as_float_array(values: ArrayLike) -> FloatArray:
+    """Return *values* as a contiguous float64 array (no copy when possible)."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _to_floats(values: FloatArray) -> list[float]:
+    # Python floats are considerably faster than NumPy scalars in a scalar loop
+    return cast(list[float], values.tolist())
+
+
+def supertrend(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    atr: ArrayLike,
+    multiplier: float = 3.0,
+) -> tuple[FloatArray, IntArray]:
+    """
+    Supertrend bands and direction in a single forward pass.
+
+    Mirrors the band ratcheting of the original pandas implementation,
+    including how NaN ATR warm-up rows propagate through ``min``/``max``
+    and comparisons, so the output is identical to it.
+
+    Returns:
+    - supertrend: lower band when bullish, upper band otherwise (NaN at row 0)
+    - direction: 1 bullish, -1 bearish, 0 before the first breakout
+    """
+    high_arr = as_float_array(high)
+    low_arr = as_float_array(low)
+    n = len(high_arr)
+
+    hl2: FloatArray = (high_arr + low_arr) / 2
+    band: FloatArray = multiplier * as_float_array(atr)
+    upper = _to_floats(hl2 + band)
+    lower = _to_floats(hl2 - band)
+    closes = _to_floats(as_float_array(close))
+
+    if n == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+
+    trend_out: list[float] = [np.nan] * n
+    direction_out: list[int] = [0] * n
+    prev_upper = upper[0]
+    prev_lower = lower[0]
+    prev_close = closes[0]
+    prev_dir = 0
+
+    for i in range(1, n):
+        final_upper = (
+            min(upper[i], prev_upper) if prev_close <= prev_upper else upper[i]
+        )
+        final_lower = (
+            max(lower[i], prev_lower) if prev_close >= prev_lower else lower[i]
+        )
+
+        current_close = closes[i]
+        if current_close > prev_upper:
+            prev_dir = 1
+        elif current_close < prev_lower:
+            prev_dir = -1
+
+        direction_out[i] = prev_dir
+        trend_out[i] = final_lower if prev_dir == 1 else final_upper
+
+        prev_upper = final_upper
+        prev_lower = final_lower
+        prev_close = current_close
+
+    return np.array(trend_out, dtype=np.float64), np.array(
+        direction_out, dtype=np.int64
+    )
+
+
+def linear_recurrence(
+    inputs: ArrayLike, decay: float, seed: float, block: int = 64
+) -> FloatArray:
+    """
+    Vectorised first-order linear filter.
+
+    Computes ``y[0] = seed`` and ``y[i] = decay * y[i - 1] + inputs[i]``
+    without a Python-level loop per row. Each block is solved in closed form
+    as a scaled cumulative sum, ``y[k] = decay**k * (y[0] + sum(inputs[j] /
+    decay**j))``, and the last value seeds the next block. Blocks are kept
+    short enough that ``decay**-block`` stays far away from overflow, so the
+    result matches the row-by-row recurrence to floating point rounding.
+    ``inputs[0]`` is ignored.
+    """
+    if not 0 <= decay <= 1:
+        raise ValueError("decay must be within [0, 1]")
+
+    values = as_float_array(inputs)
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    out[0] = seed
+    if decay == 0:
+        out[1:] = values[1:]
+        return out
+
+    if decay < 1:
+        block = max(1, min(block, int(MAX_BLOCK_EXPONENT / -log2(decay))))
+    steps = np.arange(1, block + 1, dtype=np.float64)
+    growth = decay**-steps
+    shrink = decay**steps
+
+    start = 0
+    while start < n - 1:
+        stop = min(start + block, n - 1)
+        size = stop - start
+        scaled = np.cumsum(values[start + 1 : stop + 1] * growth[:size])
+        out[start + 1 : stop + 1] = (out[start] + scaled) * shrink[:size]
+        start = stop
+
+    return out
+
+
+def heikin_ashi_open(ha_close: ArrayLike, seed: float) -> FloatArray:
+    """
+    Heikin Ashi open series for ``ha_open[i] = (ha_open[i-1] + ha_close[i-1]) / 2``
+
+    *seed* is the first open, conventionally ``(open[0] + close[0]) / 2``.
+    """
+    closes = as_float_array(ha_close)
+    inputs = np.empty(len(closes), dtype=np.float64)
+    if len(closes):
+        inputs[0] = 0.0
+        np.multiply(closes[:-1], 0.5, out=inputs[1:])
+    return linear_recurrence(inputs, 0.5, seed)
+
+
+class PrefixSums:
+    """
+    Block-wise cumulative sums of one series for O(1) rolling window
+    statistics.
+
+    The series is cut into blocks at least as long as the window, and each
+    block is centred on its own mean and summed from its first row. The
+    cancellation in ``sum(x**2) - sum(x)**2 / n`` is then bounded by the
+    spread inside a block rather than by the whole history, which matters
+    for long price series. A window spans at most two blocks; the earlier
+    block's sums are shifted onto the later block's mean.
+
+    NaN samples are excluded and counted separately, so windows that
+    contain them are reported with a smaller count, as pandas ``rolling``
+    does.
+    """
+
+    # Minimum block length; windows longer than this use blocks of their size
+    block = 256
+
+    def __init__(self, values: ArrayLike) -> None:
+        self.data = as_float_array(values)
+        self.size = len(self.data)
+        self._blocks: dict[int, tuple[FloatArray, ...]] = {}
+        # First row of the run of equal values each row belongs to
+        index = np.arange(self.size)
+        breaks = np.ones(self.size, dtype=bool)
+        breaks[1:] = self.data[1:] != self.data[:-1]
+        self.run_start = np.maximum.accumulate(np.where(breaks, index, 0))
+
+    def _sums(self, block: int) -> tuple[FloatArray, ...]:
+        """Block means and in-block cumulative count, sum and squares."""
+        if block not in self._blocks:
+            blocks = -(-self.size // block)
+            padded = np.full(blocks * block, np.nan)
+            padded[: self.size] = self.data
+            grid = padded.reshape(blocks, block)
+            valid = ~np.isnan(grid)
+            count = valid.sum(axis=1)
+            offsets = np.zeros(blocks)
+            np.divide(
+                np.where(valid, grid, 0.0).sum(axis=1),
+                count,
+                out=offsets,
+                where=count > 0,
+            )
+            centred = np.where(valid, grid - offsets[:, None], 0.0)
+            self._blocks[block] = (
+                offsets,
+                valid.cumsum(axis=1, dtype=np.float64).ravel(),
+                centred.cumsum(axis=1).ravel(),
+                (centred * centred).cumsum(axis=1).ravel(),
+            )
+        return self._blocks[block]
+
+    def window(
+        self, window: int
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        """
+        Valid count, sum and sum of squares of the trailing *window*
+        samples at every row (shorter at the start of the series), centred
+        on the per-row offset returned last.
+        """
+        if window < 1:
+            raise ValueError("window must be a positive number of rows")
+        block = max(self.block, window)
+        offsets, *sums = self._sums(block)
+        last = np.arange(self.size)
+        start = np.maximum(last + 1 - window, 0)
+        first = last - last % block
+        spans = start < first
+        # Rows of the window in the block of its last row...
+        head_from = np.where(spans, first, start)
+        # ...and in the previous block, if it reaches back into it
+        tail_to = np.maximum(first - 1, 0)
+        shift = np.where(spans, offsets[np.maximum(last // block - 1, 0)], 0.0)
+        shift -= offsets[last // block]
+
+        def before(cumulative: FloatArray, row: np.ndarray) -> FloatArray:
+            """In-block cumulative value just before *row*."""
+            return np.where(row % block > 0, cumulative[np.maximum(row - 1, 0)], 0.0)
+
+        count, total, squares = (
+            cumulative[last] - before(cumulative, head_from) for cumulative in sums
+        )
+        tail_count, tail_total, tail_squares = (
+            np.where(spans, cumulative[tail_to] - before(cumulative, start), 0.0)
+            for cumulative in sums
+        )
+        count += tail_count
+        total += tail_total + tail_count * shift
+        squares += tail_squares + 2 * shift * tail_total + tail_count * shift * shift
+        return count, total, squares, offsets[last // block]
+
+    def flat(self, window: int) -> np.ndarray:
+        """Rows whose trailing *window* samples are all equal."""
+        last = np.arange(self.size)
+        return self.run_start <= np.maximum(last + 1 - window, 0)
+
+
+def _output(size: int, out: FloatArray | None) -> FloatArray:
+    if out is None:
+        return np.empty(size, dtype=np.float64)
+    if out.shape != (size,):
+        raise ValueError(f"out buffer must have shape ({size},), got {out.shape}")
+    return out
+
+
+def _prefix_sums(values: ArrayLike | PrefixSums) -> PrefixSums:
+    return values if isinstance(values, PrefixSums) else PrefixSums(values)
+
+
+def rolling_sum(
+    values: ArrayLike | PrefixSums,
+    window: int,
+    min_periods: int | None = None,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """``Series.rolling(window, min_periods).sum()``."""
+    prefix = _prefix_sums(values)
+    count, total, _, offset = prefix.window(window)
+    required = max(window if min_periods is None else min_periods, 1)
+    result = _output(prefix.size, out)
+    np.multiply(offset, count, out=result)
+    result += total
+    result[count < required] = np.nan
+    return result
+
+
+def rolling_mean(
+    values: ArrayLike | PrefixSums,
+    window: int,
+    min_periods: int | None = None,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """``Series.rolling(window, min_periods).mean()``."""
+    prefix = _prefix_sums(values)
+    count, total, _, offset = prefix.window(window)
+    required = max(window if min_periods is None else min_periods, 1)
+    result = _output(prefix.size, out)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(total, count, out=result)
+    result += offset
+    result[count < required] = np.nan
+    return result
+
+
+def rolling_std(
+    values: ArrayLike | PrefixSums,
+    window: int,
+    min_periods: int | None = None,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """``Series.rolling(window, min_periods).std()`` (ddof=1)."""
+    prefix = _prefix_sums(values)
+    count, total, squares, _ = prefix.window(window)
+    required = max(window if min_periods is None else min_periods, 2)
+    result = _output(prefix.size, out)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # (squares - total**2 / count) / (count - 1), reusing the buffers
+        np.multiply(total, total, out=total)
+        np.divide(total, count, out=total)
+        np.subtract(squares, total, out=squares)
+        np.divide(squares, count - 1, out=result)
+    np.maximum(result, 0.0, out=result)
+    np.sqrt(result, out=result)
+    # Rounding residue must not give a flat window a spread
+    result[prefix.flat(window)] = 0.0
+    result[count < required] = np.nan
+    return result
+
+
+def shift(values: ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Previous value at every row (``Series.shift(1)``)."""
+    data = as_float_array(values)
+    result = _output(len(data), out)
+    if len(data):
+        result[1:] = data[:-1]
+        result[0] = np.nan
+    return result
+
+
+def diff(values: ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """``Series.diff()``."""
+    data = as_float_array(values)
+    result = _output(len(data), out)
+    if len(data):
+        np.subtract(data[1:], data[:-1], out=result[1:])
+        result[0] = np.nan
+    return result
+
+
+def pct_change(values: ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """``Series.pct_change()`` without filling gaps."""
+    data = as_float_array(values)
+    result = _output(len(data), out)
+    if len(data):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            np.divide(data[1:], data[:-1], out=result[1:])
+        result[1:] -= 1
+        result[0] = np.nan
+    return result
+
+
+def true_range(
+    high: ArrayLike, low: ArrayLike, close: ArrayLike, out: FloatArray | None = None
+) -> FloatArray:
+    """
+    ``max(high - low, |high - prev_close|, |low - prev_close|)``, skipping
+    NaN like the row-wise ``max`` used by ``Indicators.atr``.
+    """
+    high_arr = as_float_array(high)
+    low_arr = as_float_array(low)
+    prev_close = shift(close)
+    result = _output(len(high_arr), out)
+    np.subtract(high_arr, low_arr, out=result)
+    gap = np.subtract(high_arr, prev_close)
+    np.abs(gap, out=gap)
+    np.fmax(result, gap, out=result)
+    np.subtract(low_arr, prev_close, out=gap)
+    np.abs(gap, out=gap)
+    np.fmax(result, gap, out=result)
+    return result
+
+
+def ewm_mean(
+    values: ArrayLike,
+    span: int,
+    adjust: bool = True,
+    min_periods: int = 0,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """
+    ``Series.ewm(span, adjust, min_periods).mean()``.
+
+    Both the adjusted (weighted average) and recursive forms are solved with
+    ``linear_recurrence``. Leading NaN are skipped as pandas does; series
+    with gaps after the first valid value fall back to pandas, whose NaN
+    weighting is not a plain recurrence.
+    """
+    data = as_float_array(values)
+    n = len(data)
+    result = _output(n, out)
+    valid = ~np.isnan(data)
+    if not valid.any():
+        result.fill(np.nan)
+        return result
+
+    first = int(np.argmax(valid))
+    if not valid[first:].all():
+        ewm = Series(data).ewm(span=span, adjust=adjust, min_periods=min_periods)
+        result[:] = ewm.mean().to_numpy()
+        return result
+
+    alpha = 2 / (span + 1)
+    decay = 1 - alpha
+    samples = data[first:]
+    if adjust:
+        numerator = linear_recurrence(samples, decay, samples[0])
+        # Sum of weights: 1 + decay + ... + decay**k
+        steps = np.arange(1, len(samples) + 1, dtype=np.float64)
+        denominator = (1 - decay**steps) / alpha
+        np.divide(numerator, denominator, out=result[first:])
+    else:
+        result[first:] = linear_recurrence(samples * alpha, decay, samples[0])
+
+    result[: first + max(min_periods, 1) - 1] = np.nan
+    return result
+
+
+def rsi(
+    close: ArrayLike, window: int = 14, out: FloatArray | None = None
+) -> FloatArray:
+    """RSI from simple rolling averages of gains and losses (``Indicators.rsi``)."""
+    change = diff(close)
+    gain = np.maximum(change, 0.0)
+    np.negative(change, out=change)
+    np.maximum(change, 0.0, out=change)
+    avg_up = rolling_mean(gain, window, out=gain)
+    avg_down = rolling_mean(change, window, out=change)
+    result = _output(len(avg_up), out)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.add(avg_up, avg_down, out=avg_down)
+        np.divide(avg_up, avg_down, out=result)
+    result *= 100
+    return result
+
+
+def standard_rsi(
+    close: ArrayLike, window: int = 14, out: FloatArray | None = None
+) -> FloatArray:
+    """``Indicators.standard_rsi``: partial windows allowed, epsilon on losses."""
+    change = diff(close)
+    gain = np.where(change > 0, change, 0.0)
+    loss = np.where(change < 0, -change, 0.0)
+    avg_up = rolling_mean(gain, window, min_periods=1, out=gain)
+    avg_down = rolling_mean(loss, window, min_periods=1, out=loss)
+    result = _output(len(avg_up), out)
+    avg_down += 1e-10
+    np.divide(avg_up, avg_down, out=result)
+    # 100 - 100 / (1 + rs)
+    result += 1
+    np.divide(100, result, out=result)
+    np.subtract(100, result, out=result)
+    return result
+
+
+def atr(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    window: int = 14,
+    min_periods: int | None = None,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """Simple moving average of the true range."""
+    tr = true_range(high, low, close)
+    return rolling_mean(tr, window, min_periods=min_periods, out=out)
+
+
+def bollinger_bands(
+    close: ArrayLike | PrefixSums, window: int = 20, num_std: float = 2
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Upper band, rolling mean and lower band."""
+    prefix = _prefix_sums(close)
+    mid = rolling_mean(prefix, window)
+    spread = rolling_std(prefix, window)
+    spread *= num_std
+    return mid + spread, mid, np.subtract(mid, spread, out=spread)
+
+
+def ma_spread(
+    slow: ArrayLike, fast: ArrayLike, out: FloatArray | None = None
+) -> FloatArray:
+    """Percentage distance ``|slow - fast| / slow * 100``."""
+    slow_arr = as_float_array(slow)
+    result = _output(len(slow_arr), out)
+    np.subtract(slow_arr, as_float_array(fast), out=result)
+    np.abs(result, out=result)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(result, slow_arr, out=result)
+    result *= 100
+    return result
+
+
+def money_flow_index(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    volume: ArrayLike,
+    window: int = 14,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """
+    Money Flow Index series. Rows without a full window or without negative
+    flow are reported as 100, like ``Indicators.mfi``.
+    """
+    typical_price = as_float_array(high) + as_float_array(low)
+    typical_price += as_float_array(close)
+    typical_price /= 3
+    raw_money_flow = typical_price * as_float_array(volume)
+    change = diff(typical_price, out=typical_price)
+
+    positive = rolling_sum(np.where(change > 0, raw_money_flow, 0.0), window)
+    negative = rolling_sum(np.where(change < 0, raw_money_flow, 0.0), window)
+    result = _output(len(positive), out)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(positive, negative, out=result)
+    # 100 - 100 / (1 + ratio)
+    result += 1
+    with np.errstate(divide="ignore"):
+        np.divide(100, result, out=result)
+    np.subtract(100, result, out=result)
+    result[np.isnan(result) | (negative == 0)] = 100.0
+    return result
+
+
+def candle_durations(
+    close_time: ArrayLike,
+    open_time: ArrayLike | None = None,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """
+    Milliseconds each close price was in effect: the time since the previous
+    close. The first row uses its own span (``close - open + 1``) when open
+    times are given and is NaN otherwise.
+    """
+    closes = as_float_array(close_time)
+    result = diff(closes, out=out)
+    if len(closes) and open_time is not None:
+        result[0] = closes[0] - as_float_array(open_time)[0] + 1
+    return result
+
+
+def rolling_weighted_mean(
+    values: ArrayLike,
+    weights: ArrayLike,
+    window: int,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """``sum(values * weights) / sum(weights)`` over the trailing *window* rows."""
+    weight_arr = as_float_array(weights)
+    numerator = rolling_sum(as_float_array(values) * weight_arr, window, out=out)
+    denominator = rolling_sum(weight_arr, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(numerator, denominator, out=numerator)
+    numerator[denominator == 0] = np.nan
+    return numerator
+
+
+def session_weighted_mean(
+    values: ArrayLike,
+    weights: ArrayLike,
+    sessions: ArrayLike,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """
+    Weighted mean accumulated since the start of each session, where
+    *sessions* holds a session id per row (e.g. ``open_time // DAY_MS``).
+    One pair of cumulative sums covers every session; NaN rows are skipped.
+    """
+    weight_arr = as_float_array(weights)
+    weighted = as_float_array(values) * weight_arr
+    skip = np.isnan(weighted)
+    weighted[skip] = 0.0
+    numerator = np.cumsum(weighted)
+    denominator = np.cumsum(np.where(skip, 0.0, weight_arr))
+
+    session_ids = np.asarray(sessions)
+    size = len(session_ids)
+    result = _output(size, out)
+    if not size:
+        return result
+
+    # Row index where each row's session starts
+    changed = np.empty(size, dtype=bool)
+    changed[0] = True
+    np.not_equal(session_ids[1:], session_ids[:-1], out=changed[1:])
+    start = np.maximum.accumulate(np.where(changed, np.arange(size), 0))
+    before = start - 1
+    has_prior = before >= 0
+    numerator -= np.where(has_prior, numerator[before], 0.0)
+    denominator -= np.where(has_prior, denominator[before], 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(numerator, denominator, out=result)
+    result[denominator == 0] = np.nan
+    return result
@@ -0,0 +1,123 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, cast
+
+from pandas import DataFrame, Timedelta, to_datetime
+from pandera.typing import DataFrame as TypedDataFrame
+from pybinbot.models.signals import KlineSchema
+from pybinbot.shared.candles import Candles, pandas_interval
+from pybinbot.shared.enums import ExchangeId, KucoinKlineIntervals
+
+# fetch_page(start_ms, end_ms) -> raw kline rows with open times in [start, end)
+PageFetcher = Callable[[int, int], Sequence[Sequence[Any]]]
+AsyncPageFetcher = Callable[[int, int], Awaitable[Sequence[Sequence[Any]]]]
+
+
+def interval_to_ms(interval: str) -> int:
+    """Length of a Binance ("15m") or KuCoin ("15min") interval in ms."""
+    if interval in {e.value for e in KucoinKlineIntervals}:
+        return KucoinKlineIntervals.get_interval_ms(interval)
+    if interval.endswith("M"):
+        raise ValueError("Monthly candles have no fixed length")
+    return int(Timedelta(pandas_interval(interval)) / Timedelta("1ms"))
+
+
+def page_ranges(
+    start_ms: int, end_ms: int, interval_ms: int, page_size: int
+) -> list[tuple[int, int]]:
+    """
+    Split ``[start_ms, end_ms)`` into ``[start, end)`` windows of at most
+    *page_size* candles. The start is aligned down to the interval.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be a positive number of candles")
+    start_ms -= start_ms % interval_ms
+    step = page_size * interval_ms
+    return [
+        (page_start, min(page_start + step, end_ms))
+        for page_start in range(start_ms, end_ms, step)
+    ]
+
+
+def merge_klines(pages: Iterable[Sequence[Sequence[Any]]]) -> list[Sequence[Any]]:
+    """
+    Concatenate kline pages sorted by open time, dropping duplicated open
+    times (the row from the later page wins).
+    """
+    rows: dict[int, Sequence[Any]] = {}
+    for page in pages:
+        for row in page:
+            rows[int(row[0])] = row
+    return [rows[open_time] for open_time in sorted(rows)]
+
+
+def fetch_klines_range(
+    fetch_page: PageFetcher,
+    start_ms: int,
+    end_ms: int,
+    interval_ms: int,
+    page_size: int,
+    max_workers: int = 4,
+) -> list[Sequence[Any]]:
+    """
+    Fetch every page of ``[start_ms, end_ms)`` concurrently with
+    *fetch_page* and merge them into one list of rows. Rate limiting is up
+    to *fetch_page* (and bounded by *max_workers*).
+    """
+    pages = page_ranges(start_ms, end_ms, interval_ms, page_size)
+    if not pages:
+        return []
+    first = pages[0][0]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # copy_context keeps the caller's scheduler lane in the workers
+        futures = [
+            executor.submit(copy_context().run, fetch_page, start, end)
+            for start, end in pages
+        ]
+        results = [future.result() for future in futures]
+    return [row for row in merge_klines(results) if first <= int(row[0]) < end_ms]
+
+
+async def fetch_klines_range_async(
+    fetch_page: AsyncPageFetcher,
+    start_ms: int,
+    end_ms: int,
+    interval_ms: int,
+    page_size: int,
+    max_concurrency: int = 4,
+) -> list[Sequence[Any]]:
+    """``fetch_klines_range`` with a coroutine *fetch_page*."""
+    pages = page_ranges(start_ms, end_ms, interval_ms, page_size)
+    if not pages:
+        return []
+    first = pages[0][0]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page: tuple[int, int]) -> Sequence[Sequence[Any]]:
+        async with semaphore:
+            return await fetch_page(*page)
+
+    results = await asyncio.gather(*(fetch(page) for page in pages))
+    return [row for row in merge_klines(results) if first <= int(row[0]) < end_ms]
+
+
+def klines_frame(
+    exchange: ExchangeId, rows: Sequence[Sequence[Any]]
+) -> TypedDataFrame[KlineSchema]:
+    """
+    Typed kline frame of raw rows (int64 times, float64 values), indexed by
+    close time like ``Candles.pre_process``.
+    """
+    if rows:
+        df = DataFrame(Candles.parse_exchange_klines(exchange, rows))
+    else:
+        columns = (
+            Candles.binance_cols
+            if exchange == ExchangeId.BINANCE
+            else Candles.kucoin_cols
+        )
+        df = DataFrame({col: [] for col in columns}, dtype="float64")
+    df.index = to_datetime(df["close_time"], unit="ms").rename("timestamp")
+    return cast(TypedDataFrame[KlineSchema], df)
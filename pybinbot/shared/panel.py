@@ -0,0 +1,165 @@
+from collections.abc import Mapping
+from typing import cast
+
+import numpy as np
+from numpy.typing import ArrayLike
+from pandas import DataFrame, Index, concat
+
+
+class IndicatorPanel:
+    """
+    Cross-sectional counterpart of ``Indicators``.
+
+    Holds close/high/low/volume as wide (time x symbol) frames and computes
+    each indicator for every symbol in one vectorised pass, instead of one
+    pandas pipeline per symbol. Formulas, windows and column names follow
+    the single-symbol ``Indicators`` functions; results are stored in
+    ``columns`` keyed by the same names (``ma_7``, ``rsi``, ``ATR`` ...).
+
+    Typical market scan::
+
+        panel = IndicatorPanel.from_frames({"BTCUSDC": df_btc, "ETHUSDC": df_eth})
+        panel.rsi()
+        panel.bollinguer_spreads()
+        snapshot = panel.latest()  # symbols x indicators
+    """
+
+    def __init__(
+        self,
+        close: DataFrame | ArrayLike,
+        high: DataFrame | ArrayLike | None = None,
+        low: DataFrame | ArrayLike | None = None,
+        volume: DataFrame | ArrayLike | None = None,
+        symbols: list[str] | None = None,
+        index: Index | None = None,
+    ) -> None:
+        self.close = self._as_panel(close, symbols, index)
+        self.symbols = list(self.close.columns)
+        self.index = self.close.index
+        self.high = self._align(high)
+        self.low = self._align(low)
+        self.volume = self._align(volume)
+        self.columns: dict[str, DataFrame] = {}
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, DataFrame]) -> "IndicatorPanel":
+        """
+        Build a panel from per-symbol OHLCV frames (e.g. ``Candles.pre_process``
+        output). Frames are aligned on their index; missing rows become NaN.
+        """
+        fields = {}
+        for field in ("close", "high", "low", "volume"):
+            available = {
+                symbol: df[field] for symbol, df in frames.items() if field in df
+            }
+            if len(available) == len(frames) and available:
+                fields[field] = concat(available, axis=1)
+
+        if "close" not in fields:
+            raise ValueError("Every frame needs a 'close' column")
+
+        return cls(
+            fields["close"],
+            high=fields.get("high"),
+            low=fields.get("low"),
+            volume=fields.get("volume"),
+        )
+
+    @staticmethod
+    def _as_panel(
+        values: DataFrame | ArrayLike,
+        symbols: list[str] | None,
+        index: Index | None,
+    ) -> DataFrame:
+        if isinstance(values, DataFrame):
+            return values.astype(float)
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim != 2:
+            raise ValueError("Panel data must be 2-D (time x symbol)")
+        return DataFrame(array, columns=symbols, index=index)
+
+    def _align(self, values: DataFrame | ArrayLike | None) -> DataFrame | None:
+        if values is None:
+            return None
+        panel = self._as_panel(values, self.symbols, self.index)
+        if panel.shape != self.close.shape:
+            raise ValueError("All panel fields must share the close panel's shape")
+        return panel
+
+    def _require(self, *fields: str) -> list[DataFrame]:
+        panels = []
+        for field in fields:
+            panel = getattr(self, field)
+            if panel is None:
+                raise ValueError(f"IndicatorPanel requires '{field}' data")
+            panels.append(panel)
+        return panels
+
+    def moving_averages(self, period: int = 7) -> DataFrame:
+        result = self.close.rolling(window=period).mean()
+        self.columns[f"ma_{period}"] = result
+        return result
+
+    def ema(self, span: int = 9, out_col: str | None = None) -> DataFrame:
+        result = self.close.ewm(span=span, adjust=False).mean()
+        self.columns[out_col or f"ema_{span}"] = result
+        return result
+
+    def rsi(self, window: int = 14) -> DataFrame:
+        change = self.close.diff()
+        avg_up = change.clip(lower=0).rolling(window).mean()
+        avg_down = (-change).clip(lower=0).rolling(window).mean()
+        result = 100 * avg_up / (avg_up + avg_down)
+        self.columns["rsi"] = result
+        return result
+
+    def atr(
+        self, window: int = 14, min_periods: int | None = None, col_prefix: str = ""
+    ) -> DataFrame:
+        high, low = self._require("high", "low")
+        prev_close = self.close.shift(1)
+        # fmax skips NaN like the row-wise max of the single-symbol version
+        tr = cast(
+            DataFrame,
+            np.fmax(
+                high - low,
+                np.fmax((high - prev_close).abs(), (low - prev_close).abs()),
+            ),
+        )
+        result = tr.rolling(
+            window=window, min_periods=window if min_periods is None else min_periods
+        ).mean()
+        self.columns[f"{col_prefix}ATR"] = result
+        return result
+
+    def bollinguer_spreads(
+        self, window: int = 20, num_std: float = 2
+    ) -> dict[str, DataFrame]:
+        rolling = self.close.rolling(window)
+        mid = rolling.mean()
+        spread = num_std * rolling.std()
+        bands = {"bb_upper": mid + spread, "bb_lower": mid - spread, "bb_mid": mid}
+        self.columns.update(bands)
+        return bands
+
+    def log_volatility(self, window_size: int = 7) -> DataFrame:
+        result = self.close.pct_change().rolling(window_size).std()
+        self.columns["perc_volatility"] = result
+        return result
+
+    def symbol_frame(self, symbol: str) -> DataFrame:
+        """All computed indicator columns for one symbol, on the panel index."""
+        return DataFrame(
+            {name: panel[symbol] for name, panel in self.columns.items()},
+            index=self.index,
+        )
+
+    def to_symbol_frames(self) -> dict[str, DataFrame]:
+        return {symbol: self.symbol_frame(symbol) for symbol in self.symbols}
+
+    def latest(self) -> DataFrame:
+        """Cross-sectional snapshot: last row of every indicator (symbols x columns)."""
+        return DataFrame(
+            {name: panel.iloc[-1] for name, panel in self.columns.items()},
+            index=self.symbols,
+        )
@@ -0,0 +1,219 @@
+import re
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+import numpy as np
+from pandera.typing import DataFrame as TypedDataFrame
+from pybinbot.models.signals import KlineSchema
+from pybinbot.shared import kernels
+from pybinbot.shared.indicators import compact_dtype
+from pybinbot.shared.kernels import FloatArray
+from pybinbot.shared.validation import validate_klines
+
+# Graph node: (kind, *params), e.g. ("mean", "close", 20)
+Node = tuple[Any, ...]
+
+# Indicators method names accepted as shorthands for their columns
+ALIASES: dict[str, tuple[str, ...]] = {
+    "moving_averages": ("ma_7", "ma_25", "ma_100"),
+    "macd": ("macd", "macd_signal"),
+    "atr": ("ATR",),
+    "bollinguer_spreads": ("bb_upper", "bb_lower", "bb_mid"),
+    "ma_spreads": ("big_ma_spread", "small_ma_spread"),
+    "log_volatility": ("perc_volatility",),
+}
+
+_PARAMETRISED = re.compile(r"^(ma|ema)_(\d+)$")
+
+
+def _dependencies(node: Node) -> tuple[Node, ...]:
+    kind, *params = node
+    if kind in ("high", "low", "close"):
+        return ()
+    if kind == "prev_close":
+        return (("close",),)
+    if kind in ("change", "returns"):
+        return (("close",), ("prev_close",))
+    if kind in ("gain", "loss"):
+        return (("change",),)
+    if kind == "true_range":
+        return (("high",), ("low",), ("prev_close",))
+    if kind == "prefix":
+        return ((params[0],),)
+    if kind in ("mean", "std"):
+        return (("prefix", params[0]),)
+    if kind == "ema":
+        return (("close",),)
+    if kind == "macd_signal":
+        return (("macd",),)
+    if kind == "macd":
+        return (("close",),)
+    if kind == "rsi":
+        return (("mean", "gain", params[0]), ("mean", "loss", params[0]))
+    if kind in ("bb_upper", "bb_lower"):
+        return (("mean", "close", params[0]), ("std", "close", params[0]))
+    if kind in ("big_ma_spread", "small_ma_spread"):
+        return tuple(("mean", "close", period) for period in (7, 25, 100))
+    raise ValueError(f"Unknown pipeline node {node}")
+
+
+def _compute(node: Node, results: dict[Node, Any], df: TypedDataFrame) -> Any:
+    kind, *params = node
+    if kind in ("high", "low", "close"):
+        return kernels.as_float_array(df[kind].to_numpy())
+    if kind == "prev_close":
+        close = results[("close",)]
+        return np.concatenate(([np.nan], close[:-1]))
+    if kind == "change":
+        return results[("close",)] - results[("prev_close",)]
+    if kind == "returns":
+        return results[("close",)] / results[("prev_close",)] - 1
+    if kind == "gain":
+        change = results[("change",)]
+        return np.where(change < 0, 0.0, change)
+    if kind == "loss":
+        change = results[("change",)]
+        return np.where(change > 0, 0.0, -change)
+    if kind == "true_range":
+        high, low = results[("high",)], results[("low",)]
+        prev_close = results[("prev_close",)]
+        # fmax skips NaN like the row-wise max of Indicators.atr
+        return np.fmax(
+            high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+        )
+    if kind == "prefix":
+        return kernels.PrefixSums(results[(params[0],)])
+    if kind == "mean":
+        return kernels.rolling_mean(results[("prefix", params[0])], params[1])
+    if kind == "std":
+        return kernels.rolling_std(results[("prefix", params[0])], params[1])
+    if kind == "ema":
+        return kernels.ewm_mean(results[("close",)], params[0], adjust=False)
+    if kind == "macd":
+        close = results[("close",)]
+        macd = kernels.ewm_mean(close, 12, min_periods=12)
+        macd -= kernels.ewm_mean(close, 26, min_periods=26)
+        return macd
+    if kind == "macd_signal":
+        return kernels.ewm_mean(results[("macd",)], 9, min_periods=9)
+    if kind == "rsi":
+        window = params[0]
+        avg_up = results[("mean", "gain", window)]
+        avg_down = results[("mean", "loss", window)]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return 100 * avg_up / (avg_up + avg_down)
+    if kind in ("bb_upper", "bb_lower"):
+        window, num_std = params
+        mean = results[("mean", "close", window)]
+        spread = num_std * results[("std", "close", window)]
+        return mean + spread if kind == "bb_upper" else mean - spread
+    if kind == "big_ma_spread":
+        return kernels.ma_spread(
+            results[("mean", "close", 100)], results[("mean", "close", 25)]
+        )
+    if kind == "small_ma_spread":
+        return kernels.ma_spread(
+            results[("mean", "close", 25)], results[("mean", "close", 7)]
+        )
+    raise ValueError(f"Unknown pipeline node {node}")
+
+
+class IndicatorPipeline:
+    """
+    Declarative batch of indicators computed over shared intermediates.
+
+    The caller lists the output columns (or ``Indicators`` method names as
+    shorthands, see ``ALIASES``). The pipeline resolves them into a
+    dependency graph once, so intermediates such as ``prev_close``, the
+    true range and the rolling sums / sums of squares of a series are
+    computed a single time no matter how many outputs use them: ``ma_20``
+    and the Bollinger bands share one pass over ``close``, ``ma_spreads``
+    reuses the moving averages, and so on.
+
+    Results are written straight into the frame, without copying it, and
+    match the single ``Indicators`` functions (default windows) to floating
+    point rounding::
+
+        pipeline = IndicatorPipeline(
+            ["moving_averages", "ma_spreads", "bollinguer_spreads", "atr", "rsi"]
+        )
+        df = pipeline.run(df)
+    """
+
+    def __init__(
+        self,
+        outputs: Iterable[str],
+        rsi_window: int = 14,
+        atr_window: int = 14,
+        bb_window: int = 20,
+        bb_num_std: float = 2,
+        volatility_window: int = 7,
+    ) -> None:
+        self.columns: dict[str, Node] = {}
+        named: dict[str, Node] = {
+            "macd": ("macd",),
+            "macd_signal": ("macd_signal",),
+            "rsi": ("rsi", rsi_window),
+            "ATR": ("mean", "true_range", atr_window),
+            "bb_upper": ("bb_upper", bb_window, bb_num_std),
+            "bb_lower": ("bb_lower", bb_window, bb_num_std),
+            "bb_mid": ("mean", "close", bb_window),
+            "big_ma_spread": ("big_ma_spread",),
+            "small_ma_spread": ("small_ma_spread",),
+            "perc_volatility": ("std", "returns", volatility_window),
+        }
+
+        for output in outputs:
+            for column in ALIASES.get(output, (output,)):
+                match = _PARAMETRISED.match(column)
+                if match:
+                    prefix, size = match.group(1), int(match.group(2))
+                    node = ("mean", "close", size) if prefix == "ma" else ("ema", size)
+                elif column in named:
+                    node = named[column]
+                else:
+                    raise ValueError(f"Unsupported pipeline output '{column}'")
+                self.columns[column] = node
+
+        self.plan = self._resolve(self.columns.values())
+
+    @staticmethod
+    def _resolve(targets: Iterable[Node]) -> list[Node]:
+        """Topologically ordered, de-duplicated list of nodes to evaluate."""
+        plan: list[Node] = []
+        visited: set[Node] = set()
+
+        def visit(node: Node) -> None:
+            if node in visited:
+                return
+            visited.add(node)
+            for dependency in _dependencies(node):
+                visit(dependency)
+            plan.append(node)
+
+        for target in targets:
+            visit(target)
+        return plan
+
+    def compute(self, df: TypedDataFrame[KlineSchema]) -> dict[str, FloatArray]:
+        """Evaluate the graph and return the requested columns as arrays."""
+        results: dict[Node, Any] = {}
+        for node in self.plan:
+            results[node] = _compute(node, results, df)
+        return {column: results[node] for column, node in self.columns.items()}
+
+    def run(
+        self, df: TypedDataFrame[KlineSchema], key: Hashable = None
+    ) -> TypedDataFrame[KlineSchema]:
+        """
+        Compute every requested column and attach it to *df* in place. The
+        input is checked per the validation policy, *key* (e.g. the symbol)
+        selecting the first-N bucket.
+        """
+        if df.empty:
+            return df
+        validate_klines(df, key=key)
+        dtype = compact_dtype(df) or np.float64
+        for column, values in self.compute(df).items():
+            df[column] = values.astype(dtype, copy=False)
+        return df
@@ -0,0 +1,275 @@
+import asyncio
+from collections.abc import Mapping
+from threading import Condition
+from time import time
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+from pybinbot.apis.binance.exceptions import RateLimited
+
+USED_WEIGHT_HEADER = "x-mbx-used-weight-1m"
+ORDER_COUNT_HEADER = "x-mbx-order-count-10s"
+RETRY_AFTER_HEADER = "Retry-After"
+
+# Binance "Too many requests"
+TOO_MANY_REQUESTS = -1003
+# Back-off when a 418/429 carries no Retry-After header
+DEFAULT_BAN_S = 3600
+ORDER_WINDOW_S = 10
+
+# REQUEST_WEIGHT of the /api/v3 endpoints used by BinanceApi, by
+# "METHOD path". SAPI and futures endpoints have their own limits and are
+# not counted here.
+ENDPOINT_WEIGHTS = {
+    "GET /api/v3/time": 1,
+    "GET /api/v3/exchangeInfo": 20,
+    "GET /api/v3/depth": 5,
+    "GET /api/v3/klines": 2,
+    "GET /api/v3/uiKlines": 2,
+    "GET /api/v3/avgPrice": 2,
+    "GET /api/v3/ticker/price": 2,
+    "GET /api/v3/ticker/24hr": 2,
+    "GET /api/v3/account": 20,
+    "GET /api/v3/order": 4,
+    "POST /api/v3/order": 1,
+    "DELETE /api/v3/order": 1,
+    "POST /api/v3/order/cancelReplace": 1,
+    "GET /api/v3/openOrders": 6,
+    "GET /api/v3/allOrders": 20,
+    "POST /api/v3/userDataStream": 2,
+}
+# Weight when the "symbol" parameter is omitted
+ALL_SYMBOLS_WEIGHTS = {
+    "GET /api/v3/ticker/price": 4,
+    "GET /api/v3/ticker/24hr": 80,
+    "GET /api/v3/openOrders": 80,
+}
+# Endpoints counted by the order rate limit
+ORDER_ENDPOINTS = {"POST /api/v3/order", "POST /api/v3/order/cancelReplace"}
+
+
+def request_cost(
+    method: str, url: Any, params: Mapping[str, Any] | None = None
+) -> tuple[int, int]:
+    """``(weight, orders)`` of a Binance request, from the endpoint tables."""
+    parts = urlsplit(str(url))
+    if not parts.path.startswith("/api/"):
+        return 0, 0
+    endpoint = f"{method.upper()} {parts.path}"
+    has_symbol = "symbol" in (params or {}) or "symbol" in parse_qs(parts.query)
+    if not has_symbol and endpoint in ALL_SYMBOLS_WEIGHTS:
+        weight = ALL_SYMBOLS_WEIGHTS[endpoint]
+    else:
+        weight = ENDPOINT_WEIGHTS.get(endpoint, 1)
+    return weight, int(endpoint in ORDER_ENDPOINTS)
+
+
+def retry_after_s(headers: Mapping[str, Any], default: float = DEFAULT_BAN_S) -> float:
+    value = headers.get(RETRY_AFTER_HEADER)
+    return float(value) if value is not None else default
+
+
+class WeightBudget:
+    """
+    Per-minute request weight budget shared by concurrent Binance calls.
+
+    Binance counts REQUEST_WEIGHT per IP and per clock minute and reports
+    the running total in the ``x-mbx-used-weight-1m`` header. The budget
+    keeps the larger of that reported value and the weight this process
+    spent, plus the weight of requests still in flight.
+
+    Two thresholds share that count:
+
+    - bulk work (kline batches, backfills) reserves weight with
+      ``acquire`` / ``acquire_async`` / ``try_acquire``, which wait until a
+      request fits under ``limit * headroom``
+    - every request is checked against the full *limit* (and the order
+      rate limit) with ``check``, which raises ``RateLimited`` instead of
+      sleeping
+
+    So bulk fetches back off first and leave the headroom to low-weight
+    calls such as orders. A 418/429 blocks both until its Retry-After.
+
+    Thread safe; one instance is normally shared per IP.
+    """
+
+    def __init__(
+        self,
+        limit: int = 6000,
+        headroom: float = 0.8,
+        window_s: float = 60,
+        clock: Callable[[], float] = time,
+        order_limit: int = 100,
+        poll_s: float = 0.05,
+    ) -> None:
+        self.limit = limit
+        self.capacity = int(limit * headroom)
+        self.window_s = window_s
+        self.clock = clock
+        self.order_limit = order_limit
+        self.poll_s = poll_s
+        self.used = 0
+        self.spent = 0
+        self.in_flight = 0
+        self.orders = 0
+        self.blocked_until = 0.0
+        self._window = int(clock() // window_s)
+        self._order_window = int(clock() // ORDER_WINDOW_S)
+        self._condition = Condition()
+
+    def _roll(self) -> float:
+        """Reset the counters on a new window; returns seconds left in it."""
+        now = self.clock()
+        window = int(now // self.window_s)
+        if window != self._window:
+            self._window = window
+            self.used = 0
+            self.spent = 0
+        order_window = int(now // ORDER_WINDOW_S)
+        if order_window != self._order_window:
+            self._order_window = order_window
+            self.orders = 0
+        return (window + 1) * self.window_s - now
+
+    def _wait_s(self, weight: int) -> float:
+        """Seconds until *weight* fits under the capacity, 0 if it does now."""
+        remaining = self._roll()
+        blocked = self.blocked_until - self.clock()
+        if blocked > 0:
+            return blocked
+        used = max(self.used, self.spent)
+        if used + self.in_flight + weight <= self.capacity:
+            return 0
+        return remaining
+
+    @property
+    def usage(self) -> float:
+        """Fraction of the full limit used or in flight in this window."""
+        with self._condition:
+            self._roll()
+            return (max(self.used, self.spent) + self.in_flight) / self.limit
+
+    @property
+    def reset_in(self) -> float:
+        """Seconds until the weight window rolls over."""
+        with self._condition:
+            return self._roll()
+
+    @property
+    def available(self) -> int:
+        with self._condition:
+            self._roll()
+            return self.capacity - max(self.used, self.spent) - self.in_flight
+
+    def try_acquire(self, weight: int = 1) -> float:
+        """
+        Reserve *weight* if it fits now and return 0, otherwise reserve
+        nothing and return the seconds to wait before trying again.
+        """
+        if weight > self.capacity:
+            raise ValueError(f"Request weight {weight} exceeds the budget")
+        with self._condition:
+            wait = self._wait_s(weight)
+            if not wait:
+                self.in_flight += weight
+            return wait
+
+    def acquire(self, weight: int = 1, timeout: float | None = None) -> bool:
+        """
+        Reserve *weight* for a request, waiting for the budget if needed.
+        Returns False if *timeout* seconds pass first.
+        """
+        if weight > self.capacity:
+            raise ValueError(f"Request weight {weight} exceeds the budget")
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._condition:
+            while True:
+                wait = self._wait_s(weight)
+                if not wait:
+                    self.in_flight += weight
+                    return True
+                if deadline is not None:
+                    if self.clock() >= deadline:
+                        return False
+                    wait = min(wait, deadline - self.clock())
+                # Woken early by release(); otherwise wait for the next window
+                self._condition.wait(max(wait, 0.001))
+
+    async def acquire_async(
+        self, weight: int = 1, timeout: float | None = None
+    ) -> bool:
+        """``acquire`` without blocking the event loop."""
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            wait = self.try_acquire(weight)
+            if not wait:
+                return True
+            if deadline is not None:
+                if self.clock() >= deadline:
+                    return False
+                wait = min(wait, deadline - self.clock())
+            # Poll, as release() may free weight before the window ends
+            await asyncio.sleep(max(min(wait, self.poll_s), 0.001))
+
+    def release(self, weight: int = 1) -> None:
+        """Mark a reserved request as finished."""
+        with self._condition:
+            self._roll()
+            self.in_flight = max(self.in_flight - weight, 0)
+            self.spent += weight
+            self._condition.notify_all()
+
+    def check(self, weight: int = 1, orders: int = 0) -> None:
+        """
+        Raise ``RateLimited`` if a request of *weight* (placing *orders*)
+        would exceed the full limit, or while a 418/429 is in force.
+        """
+        with self._condition:
+            remaining = self._roll()
+            now = self.clock()
+            if self.blocked_until > now:
+                raise RateLimited(
+                    "Rate limited by Binance",
+                    TOO_MANY_REQUESTS,
+                    self.blocked_until - now,
+                )
+            if max(self.used, self.spent) + weight > self.limit:
+                raise RateLimited(
+                    f"Request weight {weight} would exceed the limit",
+                    TOO_MANY_REQUESTS,
+                    remaining,
+                )
+            if orders and self.orders + orders > self.order_limit:
+                raise RateLimited(
+                    "Order rate limit reached",
+                    TOO_MANY_REQUESTS,
+                    ORDER_WINDOW_S - now % ORDER_WINDOW_S,
+                )
+
+    def block(self, seconds: float) -> None:
+        """Hold every request for *seconds*, e.g. after a 418/429."""
+        with self._condition:
+            self.blocked_until = max(self.blocked_until, self.clock() + seconds)
+
+    def set_used(self, used: int) -> None:
+        """Record used weight reported other than by headers (e.g. KuCoin)."""
+        with self._condition:
+            self._roll()
+            self.used = max(self.used, used)
+
+    def observe(
+        self, headers: Mapping[str, Any], status_code: int | None = None
+    ) -> None:
+        """Record the used weight and orders reported by a Binance response."""
+        if status_code in (418, 429):
+            self.block(retry_after_s(headers))
+        value = headers.get(USED_WEIGHT_HEADER)
+        orders = headers.get(ORDER_COUNT_HEADER)
+        if value is None and orders is None:
+            return
+        with self._condition:
+            self._roll()
+            if value is not None:
+                self.used = max(self.used, int(float(value)))
+            if orders is not None:
+                self.orders = max(self.orders, int(float(orders)))
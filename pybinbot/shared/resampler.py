@@ -0,0 +1,172 @@
+from collections import deque
+from collections.abc import Iterable, Mapping
+from math import isnan
+from typing import Any, cast
+
+from pandas import DataFrame, Timedelta, to_datetime
+from pandera.typing import DataFrame as TypedDataFrame
+from pybinbot.models.signals import KlineProduceModel, KlineSchema
+from pybinbot.shared.candles import pandas_interval
+
+# Base candles are always fetched at 15 minutes, like Candles.resample
+MIN_INTERVAL = Timedelta("15min")
+
+
+class MultiTimeframeResampler:
+    """
+    Incremental counterpart of ``Candles.resample`` for several higher
+    timeframes at once.
+
+    Each base candle (normally 15m) is folded into one partial bar per
+    timeframe in O(1): open/close_time/open_time take the first value,
+    close the last, high the max, low the min, and volume /
+    quote_asset_volume are summed, exactly like the ``resample().agg()``
+    mapping. Bars are bucketed on ``close_time`` as ``Candles.resample``
+    does (its index is the close time), aligned to UTC midnight.
+
+    A bar is emitted as completed when its last base candle arrives
+    (``close_time + 1`` reaches the bucket boundary), or when a candle for a
+    later bucket shows up first (gaps in the stream). Candles that are not
+    newer than the last one are ignored.
+    """
+
+    def __init__(
+        self,
+        intervals: Iterable[str] = ("30min", "1h", "2h", "4h", "1d"),
+        max_bars: int = 500,
+    ) -> None:
+        self.interval_ms: dict[str, int] = {}
+        for interval in intervals:
+            length = Timedelta(pandas_interval(interval))
+            if length < MIN_INTERVAL:
+                raise ValueError(
+                    f"Resample interval '{interval}' is less than the minimum "
+                    "allowed interval of 15 minutes."
+                )
+            self.interval_ms[interval] = int(length / Timedelta("1ms"))
+
+        self.partial: dict[str, dict[str, Any] | None] = dict.fromkeys(self.interval_ms)
+        self.bars: dict[str, deque[dict[str, Any]]] = {
+            interval: deque(maxlen=max_bars) for interval in self.interval_ms
+        }
+        self.last_close_time: int | None = None
+
+    def update(self, candle: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+        """
+        Fold one closed base candle (``open_time``, ``close_time`` in ms and
+        OHLCV values) into every timeframe. Returns the bars it completed,
+        keyed by interval.
+        """
+        close_time = int(candle["close_time"])
+        if self.last_close_time is not None and close_time <= self.last_close_time:
+            return {}
+        self.last_close_time = close_time
+
+        completed: dict[str, dict[str, Any]] = {}
+        for interval, size in self.interval_ms.items():
+            bucket = close_time - close_time % size
+            bar = self.partial[interval]
+            if bar is not None and bar["timestamp"] != bucket:
+                completed[interval] = self._complete(interval, bar)
+                bar = None
+
+            if bar is None:
+                bar = self._new_bar(bucket, candle)
+            else:
+                self._fold(bar, candle)
+
+            if (close_time + 1) % size == 0:
+                completed[interval] = self._complete(interval, bar)
+                self.partial[interval] = None
+            else:
+                self.partial[interval] = bar
+        return completed
+
+    def update_from_kline(
+        self, kline: KlineProduceModel | Mapping[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """Consume a closed candle as produced by the websocket clients."""
+        if isinstance(kline, Mapping):
+            kline = KlineProduceModel.model_validate(kline)
+        close = float(kline.close_price)
+        return self.update(
+            {
+                "open_time": int(kline.open_time),
+                "close_time": int(kline.close_time),
+                "open": float(kline.open_price),
+                "high": float(kline.high_price),
+                "low": float(kline.low_price),
+                "close": close,
+                "volume": kline.volume,
+                "quote_asset_volume": kline.volume * close,
+            }
+        )
+
+    def ingest_frame(
+        self, df: TypedDataFrame[KlineSchema]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Feed a frame of closed base candles in order (e.g. a REST backfill)
+        and return every bar it completed, per interval.
+        """
+        completed: dict[str, list[dict[str, Any]]] = {
+            interval: [] for interval in self.interval_ms
+        }
+        records = cast(list[dict[str, Any]], df.to_dict("records"))
+        for candle in records:
+            for interval, bar in self.update(candle).items():
+                completed[interval].append(bar)
+        return completed
+
+    @staticmethod
+    def _new_bar(bucket: int, candle: Mapping[str, Any]) -> dict[str, Any]:
+        return {
+            "timestamp": bucket,
+            "open": float(candle["open"]),
+            "high": float(candle["high"]),
+            "low": float(candle["low"]),
+            "close": float(candle["close"]),
+            "volume": float(candle.get("volume", 0.0)),
+            "quote_asset_volume": float(candle.get("quote_asset_volume", 0.0)),
+            "close_time": int(candle["close_time"]),
+            "open_time": int(candle["open_time"]),
+        }
+
+    @staticmethod
+    def _fold(bar: dict[str, Any], candle: Mapping[str, Any]) -> None:
+        high = float(candle["high"])
+        low = float(candle["low"])
+        # NaN never wins the comparisons, like the NaN-skipping max/min
+        if high > bar["high"] or isnan(bar["high"]):
+            bar["high"] = high
+        if low < bar["low"] or isnan(bar["low"]):
+            bar["low"] = low
+        bar["close"] = float(candle["close"])
+        bar["volume"] += float(candle.get("volume", 0.0))
+        bar["quote_asset_volume"] += float(candle.get("quote_asset_volume", 0.0))
+
+    def _complete(self, interval: str, bar: dict[str, Any]) -> dict[str, Any]:
+        self.bars[interval].append(bar)
+        return bar
+
+    def frame(self, interval: str) -> TypedDataFrame[KlineSchema]:
+        """
+        Completed bars of *interval* shaped like ``Candles.resample`` output
+        (bucket start DatetimeIndex).
+        """
+        df = DataFrame(
+            list(self.bars[interval]),
+            columns=[
+                "timestamp",
+                "open",
+                "close",
+                "high",
+                "low",
+                "volume",
+                "quote_asset_volume",
+                "close_time",
+                "open_time",
+            ],
+        )
+        df.index = to_datetime(df.pop("timestamp"), unit="ms")
+        return cast(TypedDataFrame[KlineSchema], df)
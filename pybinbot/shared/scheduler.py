@@ -0,0 +1,265 @@
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import wraps
+from itertools import count
+from threading import Condition
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+from pybinbot.apis.binance.exceptions import RateLimited
+from pybinbot.shared.rate_limit import TOO_MANY_REQUESTS, WeightBudget
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Request lanes, most urgent first."""
+
+    CRITICAL = 0  # order placement, cancels, stop-loss updates
+    ACCOUNT = 1  # balances, open orders, positions
+    MARKET_DATA = 2  # tickers, klines, exchange info
+    RESEARCH = 3  # backfills, scans, backtests
+
+
+_lane_override: ContextVar[Priority | None] = ContextVar("lane", default=None)
+
+
+@contextmanager
+def lane(priority: Priority) -> Iterator[None]:
+    """
+    Schedule the requests made inside the block in *priority*, e.g.
+    ``with lane(Priority.RESEARCH): api.get_klines_range(...)``. Critical
+    requests (orders) stay critical.
+    """
+    token = _lane_override.set(priority)
+    try:
+        yield
+    finally:
+        _lane_override.reset(token)
+
+
+def current_lane(default: Priority) -> Priority:
+    override = _lane_override.get()
+    if override is None or default == Priority.CRITICAL:
+        return default
+    return override
+
+
+# Binance endpoints that create, cancel or close positions
+BINANCE_ORDER_PATHS = {
+    "/api/v3/order",
+    "/api/v3/order/cancelReplace",
+    "/api/v3/openOrders",
+    "/sapi/v1/margin/order",
+    "/sapi/v1/margin/manual-liquidation",
+}
+
+
+def binance_lane(method: str, url: Any) -> Priority:
+    """Default lane of a Binance request."""
+    parts = urlsplit(str(url))
+    if method.upper() != "GET" and parts.path in BINANCE_ORDER_PATHS:
+        return Priority.CRITICAL
+    if "signature=" in parts.query or parts.path.startswith("/sapi/"):
+        return Priority.ACCOUNT
+    return Priority.MARKET_DATA
+
+
+@dataclass(order=True)
+class _Ticket:
+    finish: float
+    seq: int
+    priority: Priority = field(compare=False)
+    weight: int = field(compare=False)
+    granted: bool = field(default=False, compare=False)
+
+
+class RequestScheduler:
+    """
+    Priority lanes for exchange REST calls sharing one rate budget.
+
+    - ``CRITICAL`` requests never wait for the scheduler; they only go
+      through the budget's hard limit checks.
+    - The other lanes share *max_concurrent* request slots with weighted
+      fair queuing: each request gets a virtual finish tag advanced by
+      ``weight / lane_weights[lane]``, and the lowest tag goes next. Under
+      contention account calls get 4x, and market data 2x, the research
+      share, but no lane starves.
+    - Lanes are shed as the budget fills up: once ``budget.usage`` reaches
+      ``shed_at[lane]`` new requests of that lane raise ``RateLimited``
+      (retry when the window resets) and queued ones wait.
+
+    So a backfill burst queues and then sheds, while stop-loss updates
+    keep going out. Thread safe; ``run_async`` is the asyncio variant.
+    """
+
+    lane_weights: Mapping[Priority, int] = {
+        Priority.ACCOUNT: 4,
+        Priority.MARKET_DATA: 2,
+        Priority.RESEARCH: 1,
+    }
+    # Fraction of the budget's full limit from which a lane is shed
+    shed_at: Mapping[Priority, float] = {
+        Priority.ACCOUNT: 0.95,
+        Priority.MARKET_DATA: 0.8,
+        Priority.RESEARCH: 0.6,
+    }
+
+    def __init__(
+        self,
+        budget: WeightBudget,
+        max_concurrent: int = 16,
+        lane_weights: Mapping[Priority, int] | None = None,
+        shed_at: Mapping[Priority, float] | None = None,
+        poll_s: float = 0.05,
+    ) -> None:
+        self.budget = budget
+        self.max_concurrent = max_concurrent
+        if lane_weights is not None:
+            self.lane_weights = lane_weights
+        if shed_at is not None:
+            self.shed_at = shed_at
+        self.poll_s = poll_s
+        self.running = 0
+        self.shed: Counter[Priority] = Counter()
+        self._queues: dict[Priority, deque[_Ticket]] = {
+            priority: deque() for priority in self.lane_weights
+        }
+        self._finish = {priority: 0.0 for priority in self.lane_weights}
+        self._virtual = 0.0
+        self._seq = count()
+        self._condition = Condition()
+
+    @property
+    def queued(self) -> dict[Priority, int]:
+        with self._condition:
+            return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def _over(self, priority: Priority, weight: int = 0) -> bool:
+        threshold = self.shed_at.get(priority)
+        if threshold is None:
+            return False
+        return self.budget.usage + weight / self.budget.limit > threshold
+
+    def _admit(self, priority: Priority, weight: int) -> _Ticket | None:
+        """Queue a request (lock held); None for requests that skip the queue."""
+        if priority == Priority.CRITICAL or priority not in self._queues:
+            return None
+        if self._over(priority, weight):
+            self.shed[priority] += 1
+            raise RateLimited(
+                f"{priority.name} requests shed near the rate limit",
+                TOO_MANY_REQUESTS,
+                self.budget.reset_in,
+            )
+        start = max(self._finish[priority], self._virtual)
+        self._finish[priority] = start + max(weight, 1) / self.lane_weights[priority]
+        ticket = _Ticket(self._finish[priority], next(self._seq), priority, weight)
+        self._queues[priority].append(ticket)
+        self._dispatch()
+        return ticket
+
+    def _dispatch(self) -> None:
+        """Grant queued requests in finish tag order (lock held)."""
+        while self.running < self.max_concurrent:
+            heads = sorted(queue[0] for queue in self._queues.values() if queue)
+            ticket = next(
+                (t for t in heads if not self._over(t.priority, t.weight)), None
+            )
+            if ticket is None:
+                return
+            self._queues[ticket.priority].popleft()
+            ticket.granted = True
+            self.running += 1
+            self._virtual = ticket.finish
+            self._condition.notify_all()
+
+    def _leave(self, ticket: _Ticket) -> None:
+        with self._condition:
+            if ticket.granted:
+                self.running -= 1
+            else:
+                self._queues[ticket.priority].remove(ticket)
+            self._dispatch()
+
+    def run(
+        self, priority: Priority, weight: int, fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        """Call ``fn(*args, **kwargs)`` once *priority* gets a slot."""
+        with self._condition:
+            ticket = self._admit(priority, weight)
+            try:
+                while ticket is not None and not ticket.granted:
+                    # Budget usage also drops when the window rolls over
+                    self._condition.wait(self.poll_s)
+                    self._dispatch()
+            except BaseException:
+                if ticket is not None and not ticket.granted:
+                    self._queues[ticket.priority].remove(ticket)
+                raise
+        if ticket is None:
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._leave(ticket)
+
+    async def run_async(
+        self,
+        priority: Priority,
+        weight: int,
+        fn: Callable[..., Awaitable[T]],
+        *args,
+        **kwargs,
+    ) -> T:
+        """``run`` for coroutine functions, waiting without blocking the loop."""
+        with self._condition:
+            ticket = self._admit(priority, weight)
+        if ticket is None:
+            return await fn(*args, **kwargs)
+        try:
+            while not ticket.granted:
+                await asyncio.sleep(self.poll_s)
+                with self._condition:
+                    self._dispatch()
+            return await fn(*args, **kwargs)
+        finally:
+            self._leave(ticket)
+
+
+class ScheduledApi:
+    """
+    Proxy of an SDK API object (e.g. a KuCoin ``get_order_api()``) whose
+    method calls go through *scheduler* in *priority* (or the ``lane``
+    context), each counted as *weight*.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        scheduler: RequestScheduler,
+        priority: Priority,
+        weight: int = 1,
+    ) -> None:
+        self.api = api
+        self.scheduler = scheduler
+        self.priority = priority
+        self.weight = weight
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.api, name)
+        if not callable(attr):
+            return attr
+
+        @wraps(attr)
+        def call(*args, **kwargs):
+            return self.scheduler.run(
+                current_lane(self.priority), self.weight, attr, *args, **kwargs
+            )
+
+        return call
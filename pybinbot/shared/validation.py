@@ -0,0 +1,138 @@
+import logging
+import os
+import random
+from collections.abc import Hashable
+from enum import Enum
+from threading import Lock
+
+from pandas import DataFrame
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from pybinbot.models.signals import KlineSchema
+
+
+class ValidationMode(str, Enum):
+    ALWAYS = "always"
+    FIRST_N = "first_n"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class ValidationPolicy:
+    """
+    Decides when kline frames get a full ``KlineSchema`` (pandera)
+    validation.
+
+    - ``always``: every frame
+    - ``first_n``: the first *first_n* frames of each key (e.g. symbol)
+    - ``sampled``: a random fraction *rate* of the frames
+    - ``off``: never (the default, as before)
+
+    Frames that are not fully validated still get the cheap structural
+    check (columns and dtypes) unless the mode is ``off``, so production
+    workers pay for schema checks once per symbol rather than every cycle.
+    """
+
+    def __init__(
+        self,
+        mode: ValidationMode | str = ValidationMode.OFF,
+        first_n: int = 1,
+        rate: float = 0.01,
+        seed: int | None = None,
+    ) -> None:
+        if not 0 <= rate <= 1:
+            raise ValueError("rate must be between 0 and 1")
+        self.mode = ValidationMode(mode)
+        self.first_n = first_n
+        self.rate = rate
+        self._random = random.Random(seed)
+        self._seen: dict[Hashable, int] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def from_env(cls, value: str | None = None) -> "ValidationPolicy":
+        """
+        Build a policy from ``KLINE_VALIDATION``: ``always``, ``off``,
+        ``first_n[:N]`` or ``sampled[:RATE]``.
+        """
+        raw = value if value is not None else os.environ.get("KLINE_VALIDATION", "off")
+        mode, _, param = raw.strip().lower().partition(":")
+        if mode == ValidationMode.FIRST_N and param:
+            return cls(mode, first_n=int(param))
+        if mode == ValidationMode.SAMPLED and param:
+            return cls(mode, rate=float(param))
+        return cls(mode)
+
+    def should_validate(self, key: Hashable = None) -> bool:
+        if self.mode == ValidationMode.ALWAYS:
+            return True
+        if self.mode == ValidationMode.OFF:
+            return False
+        with self._lock:
+            if self.mode == ValidationMode.SAMPLED:
+                return self._random.random() < self.rate
+            seen = self._seen.get(key, 0)
+            self._seen[key] = seen + 1
+            return seen < self.first_n
+
+    def reset(self) -> None:
+        with self._lock:
+            self._seen.clear()
+
+
+def _policy_from_env() -> ValidationPolicy:
+    """``ValidationPolicy.from_env``, falling back to the default on bad values."""
+    try:
+        return ValidationPolicy.from_env()
+    except ValueError as error:
+        logging.warning(
+            f"Invalid KLINE_VALIDATION {os.environ.get('KLINE_VALIDATION')!r} "
+            f"({error}), kline validation is off"
+        )
+        return ValidationPolicy()
+
+
+# Built at import time, so a bad env value must not break importing pybinbot
+_policy = _policy_from_env()
+
+
+def get_validation_policy() -> ValidationPolicy:
+    return _policy
+
+
+def set_validation_policy(policy: ValidationPolicy) -> None:
+    """Replace the process-wide policy used by the candle and indicator entry points."""
+    global _policy
+    _policy = policy
+
+
+def check_structure(df: DataFrame) -> None:
+    """
+    Cheap ``KlineSchema`` check: the columns exist and are numeric. Values
+    are not inspected.
+    """
+    columns = list(KlineSchema.to_schema().columns)
+    missing = set(columns) - set(df.columns)
+    if missing:
+        raise ValueError(f"Missing required OHLC columns: {missing}")
+    for column in columns:
+        dtype = df[column].dtype
+        if not is_numeric_dtype(dtype) or is_bool_dtype(dtype):
+            raise ValueError(f"Column '{column}' has non-numeric dtype {dtype}")
+
+
+def validate_klines(
+    df: DataFrame, key: Hashable = None, policy: ValidationPolicy | None = None
+) -> None:
+    """
+    Validate *df* according to *policy* (the process-wide one by default):
+    a full ``KlineSchema`` validation when the policy selects this frame,
+    otherwise the structural check, or nothing when validation is off.
+    """
+    policy = policy or _policy
+    if policy.mode == ValidationMode.OFF or df.empty:
+        return
+    check_structure(df)
+    if policy.should_validate(key):
+        columns = list(KlineSchema.to_schema().columns)
+        # The schema declares float64; compact float32 frames are upcast
+        KlineSchema.validate(df[columns].astype("float64"), lazy=True)
@@ -0,0 +1,135 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from pybinbot.apis.binance.base import BinanceApi
+from pybinbot.apis.binance.exceptions import InvalidSymbol, RateLimited
+from pybinbot.shared.rate_limit import WeightBudget
+
+
+def create_api(
+    monkeypatch: Any, delays: dict[str, float], budget=None
+) -> tuple[BinanceApi, dict[str, int]]:
+    api = BinanceApi("key", "secret")
+    api.weight_budget = budget or WeightBudget()
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_klines(symbol, interval, limit=500, start_time=None, end_time=None):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(delays[symbol])
+        with lock:
+            state["running"] -= 1
+        if symbol == "BAD":
+            raise InvalidSymbol("Invalid symbol.", -1121)
+        return [[symbol, interval, limit]]
+
+    monkeypatch.setattr(api, "get_ui_klines", fake_klines)
+    return api, state
+
+
+class TestFetchKlinesMany:
+    def test_streams_results_as_they_complete(self, monkeypatch: Any) -> None:
+        delays = {"SLOWUSDC": 0.2, "FASTUSDC": 0.0, "MIDUSDC": 0.1}
+        api, _ = create_api(monkeypatch, delays)
+
+        started = time.monotonic()
+        results = list(api.fetch_klines_many(delays, "15m", limit=10))
+        elapsed = time.monotonic() - started
+
+        assert [symbol for symbol, _ in results] == ["FASTUSDC", "MIDUSDC", "SLOWUSDC"]
+        assert dict(results)["MIDUSDC"] == [["MIDUSDC", "15m", 10]]
+        # Concurrent: about as long as the slowest request
+        assert elapsed < 0.29
+
+    def test_concurrency_is_bounded_by_weight_budget(self, monkeypatch: Any) -> None:
+        delays = {f"S{i}USDC": 0.02 for i in range(12)}
+        budget = WeightBudget(limit=6, headroom=1, window_s=0.05)
+        api, state = create_api(monkeypatch, delays, budget)
+
+        results = list(api.fetch_klines_many(delays, "1h", max_workers=12))
+
+        assert len(results) == 12
+        # 2 weight per klines request
+        assert state["peak"] <= 3
+
+    def test_errors(self, monkeypatch: Any) -> None:
+        delays = {"BAD": 0.0, "GOODUSDC": 0.05}
+        api, _ = create_api(monkeypatch, delays)
+
+        results = dict(api.fetch_klines_many(delays, "1h", return_exceptions=True))
+        assert isinstance(results["BAD"], InvalidSymbol)
+        assert results["GOODUSDC"] == [["GOODUSDC", "1h", 500]]
+
+        with pytest.raises(InvalidSymbol):
+            list(api.fetch_klines_many(delays, "1h"))
+
+
+class FakeResponse:
+    status_code = 200
+    reason = "OK"
+    url = "https://api.binance.com"
+
+    def __init__(self, payload: Any, headers: dict | None = None) -> None:
+        self.payload = payload
+        self.headers = headers or {}
+
+    def json(self) -> Any:
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def request(self, **kwargs: Any) -> FakeResponse:
+        self.calls.append(kwargs)
+        return FakeResponse({"listenKey": "abc", "price": "1.5"})
+
+
+class TestPooledSession:
+    def test_session_is_shared_and_pooled(self, monkeypatch: Any) -> None:
+        monkeypatch.setattr(BinanceApi, "_session", None)
+
+        first = BinanceApi("key", "secret").session
+        second = BinanceApi("key", "secret").session
+
+        assert first is second
+        adapter = first.get_adapter("https://api.binance.com")
+        assert adapter._pool_maxsize == BinanceApi.pool_maxsize  # type: ignore[attr-defined]
+        BinanceApi.close_session()
+        assert BinanceApi._session is None
+
+    def test_requests_reuse_the_pool(self, monkeypatch: Any) -> None:
+        session = FakeSession()
+        monkeypatch.setattr(BinanceApi, "_session", session)
+        api = BinanceApi("key", "secret")
+        monkeypatch.setattr(api, "get_server_time", lambda: 1_000)
+
+        assert api.get_ticker_price("BTCUSDC") == 1.5
+        api.signed_request(api.account_url, payload={"omitZeroBalances": "true"})
+        assert api.get_listen_key() == "abc"
+
+        assert len(session.calls) == 3
+        assert all(call["timeout"] == BinanceApi.timeout for call in session.calls)
+        signed = session.calls[1]
+        assert signed["headers"]["X-MBX-APIKEY"] == "key"
+        assert "timestamp=1000" in signed["url"]
+        assert session.calls[2]["method"] == "POST"
+
+    def test_rate_limited_request_is_not_sent(self, monkeypatch: Any) -> None:
+        session = FakeSession()
+        monkeypatch.setattr(BinanceApi, "_session", session)
+        api = BinanceApi("key", "secret")
+        api.weight_budget = WeightBudget()
+        api.weight_budget.block(30)
+
+        with pytest.raises(RateLimited) as exc_info:
+            api.get_ticker_price("BTCUSDC")
+
+        assert exc_info.value.retry_after == pytest.approx(30, abs=1)
+        assert session.calls == []
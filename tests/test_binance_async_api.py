@@ -0,0 +1,181 @@
+import hashlib
+import hmac
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
+
+from pybinbot.apis.binance.async_base import AsyncBinanceApi
+from pybinbot.apis.binance.exceptions import InvalidSymbol, NotEnoughFunds
+from pybinbot.shared.rate_limit import WeightBudget
+
+
+class FakeBinance:
+    """Minimal Binance REST server checking signatures like the exchange."""
+
+    def __init__(self) -> None:
+        self.server_time_calls = 0
+        self.timestamp_errors = 0
+        self.signed_queries: list[str] = []
+
+    async def server_time(self, request: web.Request) -> web.Response:
+        self.server_time_calls += 1
+        return web.json_response({"serverTime": 1_700_000_000_000})
+
+    async def ticker_price(self, request: web.Request) -> web.Response:
+        symbol = request.query["symbol"]
+        if symbol == "BAD":
+            return web.json_response({"code": -1121, "msg": "Invalid symbol."})
+        return web.json_response(
+            {"symbol": symbol, "price": "42.5"},
+            headers={"x-mbx-used-weight-1m": "7"},
+        )
+
+    async def klines(self, request: web.Request) -> web.Response:
+        start = int(request.query["startTime"])
+        end = int(request.query["endTime"])
+        limit = int(request.query["limit"])
+        rows = [
+            [t, "1", "2", "0.5", "1.5", "10", t + 59_999, "15", 1, "5", "7", "0"]
+            for t in range(start, end + 1, 60_000)
+        ][:limit]
+        return web.json_response(rows)
+
+    async def account(self, request: web.Request) -> web.Response:
+        query = request.rel_url.raw_query_string
+        payload, _, signature = query.rpartition("&signature=")
+        expected = hmac.new(b"secret", payload.encode(), hashlib.sha256).hexdigest()
+        assert request.headers["X-MBX-APIKEY"] == "key"
+        assert signature == expected
+        self.signed_queries.append(payload)
+        if self.timestamp_errors:
+            self.timestamp_errors -= 1
+            return web.json_response(
+                {"code": -1021, "msg": "Timestamp outside recvWindow"}, status=400
+            )
+        if request.query["asset"] == "NONE":
+            return web.json_response({"code": -2010, "msg": "Insufficient balance"})
+        return web.json_response({"balances": [], "query": dict(request.query)})
+
+    async def missing(self, request: web.Request) -> web.Response:
+        return web.json_response({}, status=404)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v3/time", self.server_time)
+        app.router.add_get("/api/v3/ticker/price", self.ticker_price)
+        app.router.add_get("/api/v3/uiKlines", self.klines)
+        app.router.add_post("/sapi/v3/asset/getUserAsset", self.account)
+        app.router.add_get("/missing", self.missing)
+        return app
+
+
+@pytest_asyncio.fixture
+async def binance() -> AsyncIterator[tuple[AsyncBinanceApi, FakeBinance]]:
+    fake = FakeBinance()
+    server = TestServer(fake.app())
+    await server.start_server()
+    api = AsyncBinanceApi("key", "secret")
+    api.weight_budget = WeightBudget()
+    base = str(server.make_url("")).rstrip("/")
+    api.server_time_url = f"{base}/api/v3/time"
+    api.ticker_price_url = f"{base}/api/v3/ticker/price"
+    api.candlestick_url = f"{base}/api/v3/uiKlines"
+    api.user_asset_url = f"{base}/sapi/v3/asset/getUserAsset"
+    try:
+        yield api, fake
+    finally:
+        AsyncBinanceApi._server_clocks.pop(api.server_time_url, None)
+        await api.aclose()
+        await server.close()
+
+
+class TestAsyncBinanceApi:
+    @pytest.mark.asyncio
+    async def test_public_request_reuses_session(self, binance: Any) -> None:
+        api, _ = binance
+
+        assert await api.get_ticker_price("BTCUSDC") == 42.5
+        session = api.session
+        assert await api.get_ticker_price("ETHUSDC") == 42.5
+
+        assert api.session is session
+        assert api.weight_budget.used == 7
+
+    @pytest.mark.asyncio
+    async def test_error_mapping(self, binance: Any) -> None:
+        api, _ = binance
+
+        with pytest.raises(InvalidSymbol):
+            await api.get_ticker_price("BAD")
+        with pytest.raises(NotEnoughFunds):
+            await api.get_user_asset("NONE")
+        with pytest.raises(ClientResponseError):
+            await api.request(api.server_time_url.replace("/api/v3/time", "/missing"))
+
+    @pytest.mark.asyncio
+    async def test_signed_request(self, binance: Any) -> None:
+        api, fake = binance
+
+        data = await api.get_user_asset("BTC,ETH", need_btc_valuation=True)
+
+        # Encoded query (e.g. "%2C") is sent exactly as it was signed
+        assert fake.signed_queries[0].startswith(
+            "asset=BTC%2CETH&needBtcValuation=True&recvWindow=9000&timestamp="
+        )
+        assert data["query"]["asset"] == "BTC,ETH"
+        assert fake.server_time_calls == api.server_clock.samples
+
+        await api.get_user_asset("BTC")
+        assert fake.server_time_calls == api.server_clock.samples
+
+        # A new client for the same host reuses the synced clock
+        other = AsyncBinanceApi("key", "secret", session=api.session)
+        other.server_time_url = api.server_time_url
+        other.user_asset_url = api.user_asset_url
+        await other.get_user_asset("BTC")
+        assert other.server_clock is api.server_clock
+        assert fake.server_time_calls == api.server_clock.samples
+
+    @pytest.mark.asyncio
+    async def test_timestamp_error_resyncs_and_retries(self, binance: Any) -> None:
+        api, fake = binance
+        await api.server_clock.sync_async(api.get_server_time)
+        fake.timestamp_errors = 1
+
+        data = await api.get_user_asset("BTC")
+
+        assert data["balances"] == []
+        assert len(fake.signed_queries) == 2
+        assert fake.server_time_calls == 2 * api.server_clock.samples
+
+    @pytest.mark.asyncio
+    async def test_klines_range_and_many(self, binance: Any) -> None:
+        api, _ = binance
+        api.klines_page_size = 100
+        start = 1_700_000_040_000
+
+        df = await api.get_klines_range("BTCUSDC", "1m", start, start + 250 * 60_000)
+        assert len(df) == 250
+        assert df["open_time"].is_monotonic_increasing
+
+        results = {
+            symbol: klines
+            async for symbol, klines in api.fetch_klines_many(
+                ["BTCUSDC", "ETHUSDC"], "1m", limit=5, start_time=start, end_time=start
+            )
+        }
+        assert {symbol: len(rows) for symbol, rows in results.items()} == {
+            "BTCUSDC": 1,
+            "ETHUSDC": 1,
+        }
+        assert api.weight_budget.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_own_session(self) -> None:
+        async with AsyncBinanceApi("key", "secret") as api:
+            session = api.session
+        assert session.closed
@@ -0,0 +1,232 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from pybinbot.apis.binance.base import BinanceApi
+from pybinbot.apis.binance.clock import ServerClock
+from pybinbot.apis.binance.exceptions import BinanceErrors
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeServer:
+    """Server *offset* ms ahead; each call takes the next simulated round trip."""
+
+    def __init__(self, clock: FakeClock, rtts: list[float], offset: int = 250) -> None:
+        self.clock = clock
+        self.rtts = rtts
+        self.offset = offset
+        self.calls = 0
+
+    def __call__(self) -> int:
+        rtt = self.rtts[self.calls % len(self.rtts)]
+        self.calls += 1
+        self.clock.now += rtt / 2000
+        server_time = int(self.clock.now * 1000 + self.offset)
+        self.clock.now += rtt / 2000
+        return server_time
+
+
+class TestServerClock:
+    def test_offset_from_fastest_sample(self) -> None:
+        clock = FakeClock()
+        server = FakeServer(clock, rtts=[80, 20, 200])
+        server_clock = ServerClock(server, samples=3, clock=clock)
+
+        server_clock.sync()
+
+        assert server_clock.offset_ms == pytest.approx(250, abs=1)
+        assert server_clock.rtt_ms == pytest.approx(20)
+        assert server_clock.now_ms() == pytest.approx(clock.now * 1000 + 250, abs=1)
+        assert server.calls == 3
+
+    def test_now_ms_has_no_network_cost_until_resync(self) -> None:
+        clock = FakeClock()
+        server = FakeServer(clock, rtts=[10])
+        server_clock = ServerClock(server, samples=2, resync_s=60, clock=clock)
+
+        server_clock.now_ms()
+        for _ in range(100):
+            server_clock.now_ms()
+
+        assert server.calls == 2
+
+    def test_stale_offset_resyncs_in_background(self) -> None:
+        clock = FakeClock()
+        server = FakeServer(clock, rtts=[10])
+        server_clock = ServerClock(server, samples=1, resync_s=60, clock=clock)
+        server_clock.sync()
+        done = threading.Event()
+        original_sync = server_clock.sync
+
+        def sync(fetch_server_time: Any = None) -> float:
+            offset = original_sync(fetch_server_time)
+            done.set()
+            return offset
+
+        server_clock.sync = sync  # type: ignore[method-assign]
+        clock.now += 61
+
+        server_clock.now_ms()
+
+        assert done.wait(1)
+        assert server.calls == 2
+
+    def test_invalidate_forces_sync(self) -> None:
+        clock = FakeClock()
+        server = FakeServer(clock, rtts=[10])
+        server_clock = ServerClock(server, samples=1, smoothing=0.5, clock=clock)
+        server_clock.now_ms()
+
+        server_clock.invalidate()
+        server_clock.now_ms()
+
+        assert server.calls == 2
+
+    def test_concurrent_callers_share_one_sync(self) -> None:
+        clock = FakeClock()
+        release = threading.Event()
+        calls = []
+
+        def server() -> int:
+            calls.append(1)
+            release.wait(1)
+            return int(clock.now * 1000 + 250)
+
+        server_clock = ServerClock(server, samples=3, clock=clock)
+        threads = [threading.Thread(target=server_clock.now_ms) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(1)
+
+        assert len(calls) == 3
+
+    def test_invalidate_during_sync_keeps_synced_offset(self) -> None:
+        clock = FakeClock()
+        server_clock = ServerClock(samples=1, clock=clock)
+
+        def server() -> int:
+            return int(clock.now * 1000 + 250)
+
+        original_record = server_clock._record
+
+        def record(samples: Any) -> float:
+            offset = original_record(samples)
+            server_clock.invalidate()
+            return offset
+
+        server_clock._record = record  # type: ignore[method-assign]
+
+        assert server_clock.now_ms(server) == int(clock.now * 1000 + 250)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_callers_share_one_sync(self) -> None:
+        clock = FakeClock()
+        calls = []
+
+        async def server() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return int(clock.now * 1000 + 250)
+
+        server_clock = ServerClock(samples=3, clock=clock)
+        timestamps = await asyncio.gather(
+            *(server_clock.now_ms_async(server) for _ in range(8))
+        )
+
+        assert len(calls) == 3
+        assert set(timestamps) == {int(clock.now * 1000 + 250)}
+
+
+class TestSignedRequestTimestamp:
+    def test_timestamp_error_resyncs_and_retries_once(self, monkeypatch: Any) -> None:
+        api = BinanceApi("key", "secret")
+        server_times = iter([1_000, 2_000])
+        monkeypatch.setattr(api, "get_server_time", lambda: next(server_times))
+        api._server_clock = ServerClock(
+            lambda: api.get_server_time(), samples=1, clock=FakeClock(0)
+        )
+        urls = []
+
+        def fake_request(url: str, method: str, **kwargs: Any) -> dict:
+            urls.append(url)
+            if len(urls) == 1:
+                raise BinanceErrors("Timestamp outside recvWindow", -1021)
+            return {"ok": True}
+
+        monkeypatch.setattr(api, "request", fake_request)
+
+        assert api.signed_request(api.account_url) == {"ok": True}
+        assert "timestamp=1000" in urls[0]
+        # The resync after the error takes the new offset unsmoothed
+        assert "timestamp=2000" in urls[1]
+
+    def test_retry_after_clock_jump_is_inside_recv_window(
+        self, monkeypatch: Any
+    ) -> None:
+        clock = FakeClock()
+        server = FakeServer(clock, rtts=[10])
+        api = BinanceApi("key", "secret")
+        api._server_clock = ServerClock(server, samples=1, clock=clock)
+        api.server_clock.sync()
+        # The server pulls 20 s ahead of the local clock
+        server.offset = 20_000
+        timestamps = []
+
+        def fake_request(url: str, method: str, **kwargs: Any) -> dict:
+            timestamp = int(url.split("timestamp=")[1].split("&")[0])
+            timestamps.append(timestamp)
+            if abs(clock.now * 1000 + server.offset - timestamp) > api.recvWindow:
+                raise BinanceErrors("Timestamp outside recvWindow", -1021)
+            return {"ok": True}
+
+        monkeypatch.setattr(api, "request", fake_request)
+
+        assert api.signed_request(api.account_url) == {"ok": True}
+        assert len(timestamps) == 2
+        assert timestamps[1] == pytest.approx(clock.now * 1000 + 20_000, abs=10)
+
+    def test_other_errors_are_raised(self, monkeypatch: Any) -> None:
+        api = BinanceApi("key", "secret")
+        api._server_clock = ServerClock(lambda: 0, samples=1, clock=FakeClock(0))
+
+        def fake_request(url: str, method: str, **kwargs: Any) -> dict:
+            raise BinanceErrors("Invalid symbol.", -1121)
+
+        monkeypatch.setattr(api, "request", fake_request)
+
+        with pytest.raises(BinanceErrors):
+            api.signed_request(api.account_url)
+
+    def test_clock_is_shared_by_instances(self, monkeypatch: Any) -> None:
+        monkeypatch.setattr(BinanceApi, "_server_clocks", {})
+        server_times = []
+
+        def get_server_time(self: BinanceApi) -> int:
+            server_times.append(1)
+            return 0
+
+        monkeypatch.setattr(BinanceApi, "get_server_time", get_server_time)
+        monkeypatch.setattr(BinanceApi, "request", lambda *args, **kwargs: {})
+
+        BinanceApi("key", "secret").signed_request(BinanceApi.account_url)
+        BinanceApi("key", "secret").signed_request(BinanceApi.account_url)
+
+        assert (
+            BinanceApi("key", "secret").server_clock
+            is BinanceApi._server_clocks[BinanceApi.server_time_url]
+        )
+        assert (
+            len(server_times)
+            == BinanceApi._server_clocks[BinanceApi.server_time_url].samples
+        )
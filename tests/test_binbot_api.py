@@ -1,10 +1,11 @@
 import enum
+import gc
 import importlib.util
 import asyncio
 import sys
 import types
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 from unittest.mock import patch
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
@@ -620,3 +621,93 @@ class TestEditSymbol:
         assert result.id == "BTCUSDTM"
         assert result.exchange_id == "kucoin"
         assert captured["json"] == {"symbol": "BTCUSDTM", "exchange_id": "kucoin"}
+
+
+class TestFetchSession:
+    def test_fetch_reuses_one_keep_alive_connection(self) -> None:
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        api_class = load_binbot_api_class()
+        api = object.__new__(api_class)
+        api._background_tasks = set()
+        peers: list = []
+
+        async def handler(request: web.Request) -> web.Response:
+            assert request.transport is not None
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response({"error": 0})
+
+        async def main() -> None:
+            app = web.Application()
+            app.router.add_get("/ping", handler)
+            server = TestServer(app)
+            await server.start_server()
+            url = str(server.make_url("/ping"))
+            try:
+                async with api:
+                    for _ in range(3):
+                        response = await api.fetch(url=url, authenticate=False)
+                        assert response.status == 200
+                    session = await api.aio_session()
+                assert session.closed
+                assert api._aio_session is None
+            finally:
+                await server.close()
+
+        asyncio.run(main())
+
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+
+    def test_session_is_closed_with_its_event_loop(self, recwarn: Any) -> None:
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        api_class = load_binbot_api_class()
+        api = object.__new__(api_class)
+        api._background_tasks = set()
+        sessions = []
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response({"error": 0})
+
+        async def main() -> None:
+            app = web.Application()
+            app.router.add_get("/ping", handler)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                await api.fetch(url=str(server.make_url("/ping")), authenticate=False)
+                sessions.append(api._aio_session)
+            finally:
+                await server.close()
+
+        # Each asyncio.run closes the session it opened before its loop ends
+        asyncio.run(main())
+        assert sessions[0].closed
+        asyncio.run(main())
+
+        assert sessions[1] is not sessions[0]
+        assert sessions[1].closed
+        gc.collect()
+        assert not [w for w in recwarn if issubclass(w.category, ResourceWarning)]
+
+    def test_aclose_waits_for_background_signals(self) -> None:
+        api_class = load_binbot_api_class()
+        api = object.__new__(api_class)
+        api._background_tasks = set()
+        done: list[str] = []
+
+        async def slow_write() -> None:
+            await asyncio.sleep(0.01)
+            done.append("signal")
+
+        async def main() -> None:
+            task = asyncio.create_task(slow_write())
+            api._background_tasks.add(task)
+            await api.aclose()
+
+        asyncio.run(main())
+
+        assert done == ["signal"]
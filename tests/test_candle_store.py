@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from pybinbot.models.signals import KlineProduceModel
+from pybinbot.shared.candle_store import CandleBuffer, CandleStore
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.indicators import Indicators
+
+BASE_TIME = 1_780_236_900_000
+INTERVAL_MS = 900_000
+
+
+def kucoin_rows(start, count):
+    rows = []
+    for i in range(start, start + count):
+        open_time = BASE_TIME + i * INTERVAL_MS
+        price = 100.0 + i
+        rows.append(
+            [
+                open_time,
+                str(price),
+                str(price + 1),
+                str(price - 1),
+                str(price + 0.5),
+                10.0,
+                open_time + INTERVAL_MS - 1,
+            ]
+        )
+    return rows
+
+
+def candle(i, close=None):
+    open_time = BASE_TIME + i * INTERVAL_MS
+    return {
+        "open_time": open_time,
+        "close_time": open_time + INTERVAL_MS - 1,
+        "open": 1.0,
+        "high": 2.0,
+        "low": 0.5,
+        "close": float(i) if close is None else close,
+        "volume": 10.0,
+    }
+
+
+class TestCandleBuffer:
+    def test_wraps_around_with_time_ordered_views(self):
+        buffer = CandleBuffer(capacity=4)
+        for i in range(10):
+            buffer.append(candle(i))
+
+        columns = buffer.columns()
+
+        assert len(buffer) == 4
+        assert columns["close"].tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert np.shares_memory(columns["close"], buffer._data["close"])
+
+    def test_dedupes_by_open_time(self):
+        buffer = CandleBuffer(capacity=4)
+        buffer.append(candle(0))
+        buffer.append(candle(1))
+
+        assert buffer.append(candle(1, close=42.0))
+        assert not buffer.append(candle(0))
+        assert buffer.columns()["close"].tolist() == [0.0, 42.0]
+
+    def test_extend_merges_overlapping_backfill(self):
+        buffer = CandleBuffer(capacity=5)
+        buffer.append(candle(3))
+        buffer.append(candle(4))
+        backfill = {
+            key: np.array([candle(i)[key] for i in range(5)])
+            for key in candle(0).keys()
+        }
+
+        buffer.extend(backfill)
+
+        assert buffer.columns()["close"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError, match="capacity"):
+            CandleBuffer(capacity=0)
+
+
+class TestCandleStore:
+    def test_rest_backfill_skips_forming_candle(self):
+        store = CandleStore(capacity=100)
+        rows = kucoin_rows(0, 20)
+        now_ms = rows[-1][0] + 1  # last row is still open
+
+        added = store.ingest_rest(ExchangeId.KUCOIN, "BTC-USDT", "15min", rows, now_ms)
+        df = store.frame(ExchangeId.KUCOIN, "BTC-USDT", "15min")
+
+        assert added == 19
+        assert df["open_time"].dtype == np.int64
+        assert df["close"].iloc[-1] == 118.5
+        assert df["quote_asset_volume"].iloc[0] == pytest.approx(1005.0)
+
+    def test_stream_continues_backfill_and_feeds_indicators(self):
+        store = CandleStore(capacity=50)
+        rows = kucoin_rows(0, 30)
+        store.ingest_rest(
+            ExchangeId.KUCOIN, "BTC-USDT", "15min", rows, now_ms=BASE_TIME * 2
+        )
+        kline = KlineProduceModel(
+            symbol="BTC-USDT",
+            open_time=str(BASE_TIME + 30 * INTERVAL_MS),
+            close_time=str(BASE_TIME + 31 * INTERVAL_MS - 1),
+            open_price="130",
+            close_price="130.5",
+            high_price="131",
+            low_price="129",
+            volume=10.0,
+        )
+
+        assert store.ingest_kline(kline.model_dump(), interval="15min")
+        df = Indicators.moving_averages(
+            store.frame(ExchangeId.KUCOIN, "BTC-USDT", "15min"), period=7
+        )
+
+        assert len(df) == 31
+        assert df["ma_7"].iloc[-1] == pytest.approx(np.mean(np.arange(124, 131)) + 0.5)
+
+    def test_binance_event_only_stores_closed_candles(self):
+        store = CandleStore()
+        event = {
+            "e": "kline",
+            "k": {
+                "t": BASE_TIME,
+                "T": BASE_TIME + 59_999,
+                "s": "BTCUSDC",
+                "i": "1m",
+                "o": "1.0",
+                "c": "1.5",
+                "h": "2.0",
+                "l": "0.5",
+                "v": "100",
+                "q": "150",
+                "x": False,
+            },
+        }
+
+        assert not store.ingest_binance_event(event)
+        event["k"]["x"] = True
+        assert store.ingest_binance_event({"stream": "btcusdc@kline_1m", "data": event})
+
+        df = store.frame(ExchangeId.BINANCE, "BTCUSDC", "1m")
+        assert df["close"].tolist() == [1.5]
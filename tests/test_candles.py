@@ -1,3 +1,5 @@
+import numpy as np
+
 from pybinbot import Candles, ExchangeId
 
 
@@ -97,3 +99,85 @@ def test_preprocessed_kucoin_futures_forming_candle_is_not_completed():
     assert [row["open_time"] for row in completed] == [closed[0]]
     assert active is not None
     assert active["open_time"] == current[0]
+
+
+def test_partition_closed_candles_sorted_rows_return_slices():
+    rows = [_binance_row(1_780_236_900_000 + i * 900_000) for i in range(6)]
+    now_ms = rows[4][0] + 1_000
+
+    completed, active = Candles.partition_closed_candles(rows, now_ms=now_ms)
+
+    assert completed == rows[:4]
+    assert active is rows[4]
+
+
+def test_partition_closed_candles_fast_path_matches_robust_path():
+    rows = [_binance_row(1_780_236_900_000 + i * 900_000) for i in range(6)]
+    now_ms = rows[3][0] + 1_000
+    shuffled = [rows[5], rows[1], rows[3], rows[0], rows[4], rows[2]]
+
+    sorted_result = Candles.partition_closed_candles(rows, now_ms=now_ms)
+    unsorted_result = Candles.partition_closed_candles(shuffled, now_ms=now_ms)
+
+    assert sorted_result == unsorted_result
+
+
+def test_split_closed_on_time_arrays():
+    open_times = np.arange(5, dtype=np.int64) * 900_000
+    close_times = open_times + 899_999
+
+    assert Candles.split_closed(open_times, close_times, now_ms=2_000_000) == (2, 2)
+    assert Candles.split_closed(open_times, close_times, now_ms=10**9) == (5, None)
+    assert Candles.split_closed(open_times, close_times, now_ms=-1) == (0, None)
+
+
+def _binance_row(open_time, close="101.5"):
+    return [
+        open_time,
+        "100.0",
+        "102.0",
+        "99.0",
+        close,
+        "12.5",
+        open_time + 899_999,
+        "1268.75",
+        42,
+        "6.0",
+        "609.0",
+        "0",
+    ]
+
+
+def test_parse_raw_klines_builds_typed_columns():
+    rows = [_binance_row(1_780_236_900_000), _binance_row(1_780_237_800_000)]
+
+    columns = Candles.parse_raw_klines(rows, Candles.binance_cols)
+
+    assert list(columns) == Candles.binance_cols
+    assert columns["open_time"].dtype == "int64"
+    assert columns["number_of_trades"].dtype == "int64"
+    assert columns["close"].dtype == "float64"
+    assert columns["close"].tolist() == [101.5, 101.5]
+
+
+def test_parse_raw_klines_normalises_microseconds_and_coerces_bad_values():
+    rows = [
+        _binance_row(1_780_236_900_000_000, close=""),
+        _binance_row(1_780_237_800_000_000, close="101.5"),
+    ]
+
+    columns = Candles.parse_raw_klines(rows, Candles.binance_cols, "float32")
+
+    assert columns["open_time"].tolist() == [1_780_236_900_000, 1_780_237_800_000]
+    assert columns["close"].dtype == "float32"
+    assert columns["close"][0] != columns["close"][0]  # NaN
+    assert columns["close"][1] == 101.5
+
+
+def test_pre_process_binance_strings_without_object_columns():
+    rows = [_binance_row(1_780_236_900_000), _binance_row(1_780_237_800_000)]
+
+    frame = Candles(ExchangeId.BINANCE, rows).pre_process()
+
+    assert frame.select_dtypes(include="object").columns.empty
+    assert frame["close_time"].tolist() == [row[6] for row in rows]
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from pybinbot.shared.extrema import RollingExtrema, rolling_extrema
+
+
+class TestRollingExtrema:
+    def test_batch_matches_pandas_rolling(self):
+        rng = np.random.default_rng(2)
+        values = pd.Series(rng.normal(0, 1, 500))
+        values[rng.uniform(size=500) < 0.05] = np.nan
+
+        highest, lowest = rolling_extrema(values, window=10)
+
+        np.testing.assert_array_equal(highest, values.rolling(10).max())
+        np.testing.assert_array_equal(lowest, values.rolling(10).min())
+
+    def test_one_sided_nans_match_pandas_rolling(self):
+        rng = np.random.default_rng(3)
+        high = pd.Series(rng.normal(1, 1, 300))
+        low = high - rng.uniform(0.1, 1, 300)
+        high[rng.uniform(size=300) < 0.05] = np.nan
+        low[rng.uniform(size=300) < 0.05] = np.nan
+
+        highest, lowest = rolling_extrema(high, low, window=10)
+
+        np.testing.assert_array_equal(highest, high.rolling(10).max())
+        np.testing.assert_array_equal(lowest, low.rolling(10).min())
+
+    def test_streaming_uses_separate_high_and_low(self):
+        engine = RollingExtrema(window=3)
+        candles = [(5.0, 1.0), (7.0, 2.0), (6.0, 3.0), (4.0, 3.5), (3.0, 2.5)]
+        expected = [(np.nan, np.nan)] * 2 + [(7.0, 1.0), (7.0, 2.0), (6.0, 2.5)]
+
+        for (high, low), (highest, lowest) in zip(candles, expected):
+            engine.push(high, low)
+            np.testing.assert_equal((engine.highest, engine.lowest), (highest, lowest))
+
+    def test_min_periods_allows_partial_windows(self):
+        engine = RollingExtrema(window=5, min_periods=1)
+        engine.push(2.0)
+
+        assert engine.highest == engine.lowest == 2.0
@@ -12,6 +12,7 @@ from pybinbot.apis.binance.exceptions import (
     BinanceErrors,
     InvalidSymbol,
     NotEnoughFunds,
+    RateLimited,
 )
 
 
@@ -139,10 +140,11 @@ class TestHandleBinanceErrors:
             "msg": "Too many requests",
         }
 
-        with patch("pybinbot.shared.handlers.sleep") as mock_sleep:
-            result = handle_binance_errors(mock_response)
-            mock_sleep.assert_called_once_with(60)
-            assert result["code"] == -1003
+        with pytest.raises(RateLimited) as exc_info:
+            handle_binance_errors(mock_response)
+
+        assert exc_info.value.code == -1003
+        assert exc_info.value.retry_after == 60
 
     def test_binbot_error_response(self):
         """Test handling Binbot error response"""
@@ -188,29 +190,28 @@ class TestHandleBinanceErrors:
 
         assert "Invalid quantity" in str(exc_info.value)
 
-    def test_rate_limit_prevention_high_weight(self):
-        """Test proactive rate limit prevention when weight > 7000"""
+    def test_high_weight_does_not_block(self):
+        """Weight pressure is left to WeightBudget, the response is returned"""
         mock_response = MagicMock(spec=Response)
         mock_response.status_code = 200
         mock_response.headers = {"x-mbx-used-weight-1m": "7500"}
         mock_response.url = "https://api.binance.com/test"
         mock_response.json.return_value = {"success": True}
 
-        with patch("pybinbot.shared.handlers.sleep") as mock_sleep:
-            with patch("pybinbot.shared.handlers.logging"):
-                handle_binance_errors(mock_response)
-                mock_sleep.assert_called_once_with(120)
+        with patch("pybinbot.shared.handlers.logging"):
+            assert handle_binance_errors(mock_response) == {"success": True}
 
     def test_rate_limit_429_status(self):
         """Test handling 429 status code"""
         mock_response = MagicMock(spec=Response)
         mock_response.status_code = 429
-        mock_response.headers = {}
+        mock_response.headers = {"Retry-After": "30"}
         mock_response.json.return_value = {"success": True}
 
-        with patch("pybinbot.shared.handlers.sleep") as mock_sleep:
+        with pytest.raises(RateLimited) as exc_info:
             handle_binance_errors(mock_response)
-            mock_sleep.assert_called_once_with(3600)
+
+        assert exc_info.value.retry_after == 30
 
     def test_rate_limit_418_status(self):
         """Test handling 418 status code"""
@@ -219,9 +220,10 @@ class TestHandleBinanceErrors:
         mock_response.headers = {}
         mock_response.json.return_value = {"success": True}
 
-        with patch("pybinbot.shared.handlers.sleep") as mock_sleep:
+        with pytest.raises(RateLimited) as exc_info:
             handle_binance_errors(mock_response)
-            mock_sleep.assert_called_once_with(3600)
+
+        assert exc_info.value.retry_after == 3600
 
     def test_binance_error_margin_short(self):
         """Test handling Binance margin short error (-2015)"""
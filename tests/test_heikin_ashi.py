@@ -148,6 +148,20 @@ class TestCandles:
         df = obj.pre_process()
         assert not df.empty
 
+    def test_pre_process_compact_dtypes(self, binance_candles):
+        full = Candles(ExchangeId.BINANCE, binance_candles).pre_process()
+        compact = Candles(ExchangeId.BINANCE, binance_candles, compact=True)
+        df = compact.pre_process()
+
+        assert df.select_dtypes(include="object").columns.empty
+        assert df["open_time"].dtype == np.int64
+        assert df["close_time"].dtype == np.int64
+        assert df["number_of_trades"].dtype == np.int64
+        for col in ("open", "high", "low", "close", "volume", "quote_asset_volume"):
+            assert df[col].dtype == np.float32
+            np.testing.assert_allclose(df[col], full[col].astype(float), rtol=1e-6)
+        assert df.memory_usage().sum() < full.memory_usage(deep=True).sum()
+
     def test_resample_1h_has_ohlc_columns(self, candles_kucoin: Candles):
         df = candles_kucoin.pre_process()
         df_1h = candles_kucoin.resample(df, "1h")
@@ -329,6 +343,49 @@ class TestHeikinAshi:
         assert (result["high"] >= result["close"]).all()
         assert (result["low"] <= result["close"]).all()
 
+    def test_get_heikin_ashi_integer_ohlc_is_not_truncated(
+        self, heikin_ashi: HeikinAshi, sample_ohlc_dataframe: DataFrame
+    ):
+        df = sample_ohlc_dataframe.iloc[:2].copy()
+        for col, values in {
+            "open": [10, 11],
+            "high": [12, 13],
+            "low": [9, 10],
+            "close": [11, 12],
+        }.items():
+            df[col] = np.array(values, dtype=np.int64)
+
+        result = heikin_ashi.get_heikin_ashi(df)
+
+        assert result["open"].dtype == np.float64
+        assert result["open"].tolist() == [10.5, 10.5]
+        assert result["close"].tolist() == [10.5, 11.5]
+
+    def test_get_heikin_ashi_open_matches_recurrence(
+        self, heikin_ashi: HeikinAshi, sample_ohlc_dataframe: DataFrame
+    ):
+        raw = Candles(ExchangeId.KUCOIN, _make_kucoin_candles(500))
+        long_frame = raw._prepare_numeric_ohlcv(
+            raw._build_df_from_raw_candles(raw.exchange, raw.candles)
+        )
+        frames = [sample_ohlc_dataframe, long_frame]
+        for original in frames:
+            result = heikin_ashi.get_heikin_ashi(original.copy())
+            ha_close = (
+                (
+                    original["open"]
+                    + original["high"]
+                    + original["low"]
+                    + original["close"]
+                )
+                / 4.0
+            ).tolist()
+            expected = [(original["open"].iloc[0] + original["close"].iloc[0]) / 2.0]
+            for i in range(1, len(ha_close)):
+                expected.append((expected[i - 1] + ha_close[i - 1]) / 2.0)
+
+            np.testing.assert_allclose(result["open"], expected, rtol=1e-12)
+
     def test_get_heikin_ashi_with_string_values(self, heikin_ashi: HeikinAshi):
         data = {
             "open_time": [1609459200000],
@@ -465,3 +522,12 @@ class TestHeikinAshi:
         ha = HeikinAshi(ExchangeId.KUCOIN, malformed)
         with pytest.raises(ValueError):
             ha.pre_process()
+
+    def test_pre_process_compact(self, kucoin_candles):
+        full = HeikinAshi(ExchangeId.KUCOIN, kucoin_candles).pre_process()
+        df = HeikinAshi(ExchangeId.KUCOIN, kucoin_candles, compact=True).pre_process()
+
+        for col in HeikinAshi.ohlc_cols:
+            assert df[col].dtype == np.float32
+            np.testing.assert_allclose(df[col], full[col], rtol=1e-6)
+        assert df["close_time"].dtype == np.int64
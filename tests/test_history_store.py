@@ -0,0 +1,219 @@
+import numpy as np
+import pytest
+
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.history_store import HistoricalCandleStore, interval_to_ms
+
+# 2026-05-31 00:00 UTC, so ranges can cross into June
+BASE_TIME = 1_780_185_600_000
+INTERVAL_MS = 900_000
+SYMBOL = "BTCUSDC"
+
+
+def binance_rows(start_ms, end_ms):
+    rows = []
+    open_time = start_ms - start_ms % INTERVAL_MS
+    while open_time <= end_ms:
+        price = open_time / INTERVAL_MS % 1000
+        rows.append(
+            [
+                open_time,
+                str(price),
+                str(price + 1),
+                str(price - 1),
+                str(price + 0.5),
+                "10.0",
+                open_time + INTERVAL_MS - 1,
+                "1000.0",
+                5,
+                "1.0",
+                "2.0",
+            ]
+        )
+        open_time += INTERVAL_MS
+    return rows
+
+
+class FakeExchange:
+    def __init__(self, limit=1000):
+        self.limit = limit
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append((start, end))
+        return binance_rows(start, end)[: self.limit]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoricalCandleStore(tmp_path)
+
+
+class TestHistoricalCandleStore:
+    def test_fetches_range_once_then_serves_from_disk(self, store, tmp_path):
+        fetch = FakeExchange(limit=50)
+        start, end = BASE_TIME, BASE_TIME + 200 * INTERVAL_MS
+        now = end + 10 * INTERVAL_MS
+
+        df = store.get_klines(
+            ExchangeId.BINANCE, SYMBOL, "15m", start, end, fetch=fetch, now_ms=now
+        )
+
+        assert len(df) == 200
+        assert len(fetch.calls) == 4  # pages of 50 candles
+        assert np.all(np.diff(df["open_time"].to_numpy()) == INTERVAL_MS)
+        # The range crosses a month boundary
+        segments = sorted(
+            p.name for p in (tmp_path / "binance" / SYMBOL / "15m").iterdir()
+        )
+        assert segments == ["2026-05.npy", "2026-06.npy", "index.json"]
+
+        fetch.calls.clear()
+        cached = store.get_klines(
+            ExchangeId.BINANCE, SYMBOL, "15m", start, end, fetch=fetch, now_ms=now
+        )
+        assert fetch.calls == []
+        assert cached["close"].tolist() == df["close"].tolist()
+
+    def test_only_gaps_are_fetched(self, store):
+        fetch = FakeExchange()
+        now = BASE_TIME + 1000 * INTERVAL_MS
+        store.get_klines(
+            ExchangeId.BINANCE,
+            SYMBOL,
+            "15m",
+            BASE_TIME + 50 * INTERVAL_MS,
+            BASE_TIME + 100 * INTERVAL_MS,
+            fetch=fetch,
+            now_ms=now,
+        )
+        fetch.calls.clear()
+
+        df = store.get_klines(
+            ExchangeId.BINANCE,
+            SYMBOL,
+            "15m",
+            BASE_TIME,
+            BASE_TIME + 150 * INTERVAL_MS,
+            fetch=fetch,
+            now_ms=now,
+        )
+
+        assert len(df) == 150
+        assert [call[0] for call in fetch.calls] == [
+            BASE_TIME,
+            BASE_TIME + 100 * INTERVAL_MS,
+        ]
+        assert store.covered(ExchangeId.BINANCE, SYMBOL, "15m") == [
+            (BASE_TIME, BASE_TIME + 150 * INTERVAL_MS)
+        ]
+
+    def test_forming_candle_is_not_stored(self, store):
+        now = BASE_TIME + 10 * INTERVAL_MS + 1000
+        df = store.get_klines(
+            ExchangeId.BINANCE,
+            SYMBOL,
+            "15m",
+            BASE_TIME,
+            BASE_TIME + 20 * INTERVAL_MS,
+            fetch=FakeExchange(),
+            now_ms=now,
+        )
+
+        assert len(df) == 10
+        assert store.missing(
+            ExchangeId.BINANCE, SYMBOL, "15m", BASE_TIME, BASE_TIME + 20 * INTERVAL_MS
+        ) == [(BASE_TIME + 10 * INTERVAL_MS, BASE_TIME + 20 * INTERVAL_MS)]
+
+    def test_late_candle_is_retried(self, store):
+        now = BASE_TIME + 10 * INTERVAL_MS + 1000
+        end = BASE_TIME + 10 * INTERVAL_MS
+        published = [BASE_TIME + 9 * INTERVAL_MS]
+        calls = []
+
+        def fetch(start, stop):
+            calls.append(start)
+            return binance_rows(start, min(stop, published[0] - 1))
+
+        # The exchange has not published the latest closed candle yet
+        df = store.get_klines(
+            ExchangeId.BINANCE, SYMBOL, "15m", BASE_TIME, end, fetch=fetch, now_ms=now
+        )
+
+        assert len(df) == 9
+        assert store.missing(ExchangeId.BINANCE, SYMBOL, "15m", BASE_TIME, end) == [
+            (BASE_TIME + 9 * INTERVAL_MS, end)
+        ]
+
+        published[0] = end
+        df = store.get_klines(
+            ExchangeId.BINANCE, SYMBOL, "15m", BASE_TIME, end, fetch=fetch, now_ms=now
+        )
+
+        assert len(df) == 10
+        assert calls[-1] == BASE_TIME + 9 * INTERVAL_MS
+
+    def test_empty_history_is_covered_up_to_settled_candles(self, store):
+        now = BASE_TIME + 10 * INTERVAL_MS + 1000
+        end = BASE_TIME + 10 * INTERVAL_MS
+
+        df = store.get_klines(
+            ExchangeId.BINANCE,
+            SYMBOL,
+            "15m",
+            BASE_TIME,
+            end,
+            fetch=lambda start, stop: [],
+            now_ms=now,
+        )
+
+        assert df.empty
+        assert store.missing(ExchangeId.BINANCE, SYMBOL, "15m", BASE_TIME, end) == [
+            (BASE_TIME + 9 * INTERVAL_MS, end)
+        ]
+
+    def test_offline_reads_are_memory_mapped(self, store):
+        store.get_klines(
+            ExchangeId.BINANCE,
+            SYMBOL,
+            "15m",
+            BASE_TIME,
+            BASE_TIME + 20 * INTERVAL_MS,
+            fetch=FakeExchange(),
+            now_ms=BASE_TIME + 100 * INTERVAL_MS,
+        )
+
+        columns = store.read(
+            ExchangeId.BINANCE, SYMBOL, "15m", BASE_TIME, BASE_TIME + 20 * INTERVAL_MS
+        )
+
+        assert isinstance(columns["close"].base, np.memmap)
+        assert len(columns["close"]) == 20
+
+    def test_rewrites_replace_existing_open_times(self, store):
+        rows = binance_rows(BASE_TIME, BASE_TIME + 4 * INTERVAL_MS)
+        columns = {
+            "open_time": np.array([row[0] for row in rows], dtype=np.int64),
+            "close_time": np.array([row[6] for row in rows], dtype=np.int64),
+            "close": np.arange(5.0),
+        }
+        store.write(ExchangeId.KUCOIN, "BTC-USDT", "15min", columns)
+        columns["close"] = columns["close"] + 10
+        store.write(ExchangeId.KUCOIN, "BTC-USDT", "15min", columns)
+
+        stored = store.read(
+            ExchangeId.KUCOIN,
+            "BTC-USDT",
+            "15min",
+            BASE_TIME,
+            BASE_TIME + 5 * INTERVAL_MS,
+        )
+
+        assert stored["close"].tolist() == [10.0, 11.0, 12.0, 13.0, 14.0]
+        assert np.isnan(stored["volume"]).all()
+
+    def test_interval_to_ms(self):
+        assert interval_to_ms("15m") == interval_to_ms("15min") == INTERVAL_MS
+        assert interval_to_ms("1d") == interval_to_ms("1day")
+        with pytest.raises(ValueError):
+            interval_to_ms("1M")
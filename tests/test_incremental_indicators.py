@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybinbot.models.signals import KlineProduceModel
+from pybinbot.shared.incremental import IncrementalIndicators
+from pybinbot.shared.indicators import Indicators
+
+
+def create_sample_df(periods=300, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, periods))
+    open_time = 1_700_000_000_000 + np.arange(periods) * 900_000
+    return pd.DataFrame(
+        {
+            "open_time": open_time,
+            "close_time": open_time + 899_999,
+            "open": close + rng.normal(0, 0.2, periods),
+            "high": close + rng.uniform(0.1, 1.0, periods),
+            "low": close - rng.uniform(0.1, 1.0, periods),
+            "close": close,
+            "volume": rng.uniform(1000, 5000, periods),
+        }
+    )
+
+
+def batch_indicators(df):
+    df = df.copy()
+    for period in (7, 25, 100):
+        df = Indicators.moving_averages(df, period=period)
+    df = Indicators.ema(df, span=9)
+    df = Indicators.macd(df)
+    df = Indicators.rsi(df)
+    df = Indicators.atr(df)
+    df = Indicators.bollinguer_spreads(df)
+    df = Indicators.set_supertrend(df)
+    df = Indicators.donchian(df)
+    df = Indicators.stochastic(df)
+    df = Indicators.williams_r(df)
+    df = Indicators.set_twap(df)
+    df = Indicators.set_vwap(df)
+    return df
+
+
+COLUMNS = [
+    "ma_7",
+    "ma_25",
+    "ma_100",
+    "ema_9",
+    "macd",
+    "macd_signal",
+    "rsi",
+    "ATR",
+    "bb_upper",
+    "bb_mid",
+    "bb_lower",
+    "supertrend",
+    "supertrend_dir",
+    "donchian_upper",
+    "donchian_mid",
+    "donchian_lower",
+    "stoch_k",
+    "stoch_d",
+    "williams_r",
+    "twap",
+    "vwap",
+]
+
+
+class TestIncrementalIndicators:
+    def test_streamed_values_match_batch_columns(self):
+        df = create_sample_df()
+        expected = batch_indicators(df)
+        state = IncrementalIndicators()
+
+        for i, row in enumerate(df.itertuples()):
+            values = state.update(
+                high=row.high,
+                low=row.low,
+                close=row.close,
+                volume=row.volume,
+                open_time=row.open_time,
+                close_time=row.close_time,
+            )
+            for col in COLUMNS:
+                np.testing.assert_allclose(
+                    values[col],
+                    expected[col].iloc[i],
+                    rtol=1e-9,
+                    atol=1e-9,
+                    err_msg=f"{col} at row {i}",
+                )
+
+    def test_nan_gaps_match_batch_columns(self):
+        df = create_sample_df(periods=120)
+        df.loc[[30, 31, 70], "close"] = np.nan
+        expected = Indicators.bollinguer_spreads(Indicators.ema(df.copy(), span=9))
+        state = IncrementalIndicators()
+
+        for i, row in enumerate(df.itertuples()):
+            values = state.update(
+                high=row.high, low=row.low, close=row.close, volume=row.volume
+            )
+            for col in ("ema_9", "bb_upper", "bb_mid", "bb_lower"):
+                np.testing.assert_allclose(
+                    values[col],
+                    expected[col].iloc[i],
+                    rtol=1e-9,
+                    atol=1e-9,
+                    err_msg=f"{col} at row {i}",
+                )
+
+    def test_mfi_matches_latest_batch_value(self):
+        df = create_sample_df(periods=60)
+        state = IncrementalIndicators()
+
+        for i, row in enumerate(df.itertuples()):
+            values = state.update(
+                high=row.high, low=row.low, close=row.close, volume=row.volume
+            )
+            assert values["mfi"] == pytest.approx(
+                Indicators.mfi(df.iloc[: i + 1]), rel=1e-9
+            )
+
+    def test_from_frame_then_update_continues_stream(self):
+        df = create_sample_df()
+        expected = batch_indicators(df)
+
+        state = IncrementalIndicators.from_frame(df.iloc[:-1])
+        last = df.iloc[-1]
+        values = state.update(
+            high=last["high"],
+            low=last["low"],
+            close=last["close"],
+            volume=last["volume"],
+            open_time=int(last["open_time"]),
+        )
+
+        assert values["rsi"] == pytest.approx(expected["rsi"].iloc[-1])
+        assert values["supertrend"] == pytest.approx(expected["supertrend"].iloc[-1])
+
+    def test_duplicate_open_time_is_ignored(self):
+        state = IncrementalIndicators(ma_periods=(2,))
+        state.update(high=2, low=1, close=1.5, volume=10, open_time=1)
+        first = state.update(high=3, low=2, close=2.5, volume=10, open_time=2)
+        repeated = state.update(high=9, low=8, close=8.5, volume=10, open_time=2)
+
+        assert repeated is first
+        assert state.count == 2
+        assert repeated["ma_2"] == pytest.approx(2.0)
+
+    def test_update_from_kline_accepts_websocket_payload(self):
+        kline = KlineProduceModel(
+            symbol="BTCUSDC",
+            open_time="1700000000000",
+            close_time="1700000899999",
+            open_price="100.0",
+            close_price="101.0",
+            high_price="102.0",
+            low_price="99.0",
+            volume=10.0,
+        )
+        state = IncrementalIndicators(ma_periods=(1,))
+
+        values = state.update_from_kline(kline.model_dump())
+
+        assert values["ma_1"] == 101.0
+        assert values["ATR"] != values["ATR"]  # NaN until the window fills
+        assert state.last_open_time == 1_700_000_000_000
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybinbot.shared.indicators import Indicators
+from pybinbot.shared.panel import IndicatorPanel
+
+
+def create_symbol_frames(symbols=("BTCUSDC", "ETHUSDC", "SOLUSDC"), periods=120):
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2024-01-01", periods=periods, freq="15min")
+    frames = {}
+    for symbol in symbols:
+        close = rng.uniform(10, 1000) + np.cumsum(rng.normal(0, 1, periods))
+        frames[symbol] = pd.DataFrame(
+            {
+                "open": close,
+                "high": close + rng.uniform(0.1, 2.0, periods),
+                "low": close - rng.uniform(0.1, 2.0, periods),
+                "close": close,
+                "volume": rng.uniform(100, 500, periods),
+            },
+            index=index,
+        )
+    return frames
+
+
+class TestIndicatorPanel:
+    def test_panel_matches_single_symbol_indicators(self):
+        frames = create_symbol_frames()
+        panel = IndicatorPanel.from_frames(frames)
+        panel.moving_averages(period=25)
+        panel.ema(span=9)
+        panel.rsi()
+        panel.atr()
+        panel.bollinguer_spreads()
+        panel.log_volatility()
+
+        for symbol, df in frames.items():
+            expected = df.copy()
+            expected = Indicators.moving_averages(expected, period=25)
+            expected = Indicators.ema(expected, span=9)
+            expected = Indicators.rsi(expected)
+            expected = Indicators.atr(expected)
+            expected = Indicators.bollinguer_spreads(expected)
+            expected = Indicators.log_volatility(expected)
+
+            result = panel.symbol_frame(symbol)
+            for col in result.columns:
+                np.testing.assert_allclose(
+                    result[col], expected[col], rtol=1e-9, err_msg=col
+                )
+
+    def test_numpy_input_and_latest_snapshot(self):
+        close = np.arange(1.0, 31.0).reshape(10, 3)
+        panel = IndicatorPanel(close, symbols=["A", "B", "C"])
+        panel.moving_averages(period=3)
+
+        latest = panel.latest()
+
+        assert list(latest.index) == ["A", "B", "C"]
+        assert latest.loc["A", "ma_3"] == pytest.approx((22 + 25 + 28) / 3)
+
+    def test_atr_requires_high_low(self):
+        panel = IndicatorPanel(np.ones((5, 2)), symbols=["A", "B"])
+        with pytest.raises(ValueError, match="requires 'high'"):
+            panel.atr()
+
+    def test_from_frames_aligns_different_histories(self):
+        frames = create_symbol_frames(symbols=("A", "B"), periods=30)
+        frames["B"] = frames["B"].iloc[10:]
+
+        panel = IndicatorPanel.from_frames(frames)
+
+        assert panel.close.shape == (30, 2)
+        assert panel.close["B"].iloc[:10].isna().all()
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybinbot.shared.indicators import Indicators
+from pybinbot.shared.pipeline import IndicatorPipeline
+
+
+def create_sample_df(periods=400, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, periods))
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.2, periods),
+            "high": close + rng.uniform(0.1, 1.0, periods),
+            "low": close - rng.uniform(0.1, 1.0, periods),
+            "close": close,
+            "volume": rng.uniform(1000, 5000, periods),
+        }
+    )
+
+
+class TestIndicatorPipeline:
+    def test_pipeline_matches_indicator_functions(self):
+        df = create_sample_df()
+        expected = df.copy()
+        for period in (7, 25, 100):
+            expected = Indicators.moving_averages(expected, period=period)
+        expected = Indicators.ma_spreads(expected)
+        expected = Indicators.bollinguer_spreads(expected)
+        expected = Indicators.log_volatility(expected)
+        expected = Indicators.atr(expected)
+        expected = Indicators.rsi(expected)
+        expected = Indicators.ema(expected, span=9)
+        expected = Indicators.macd(expected)
+
+        pipeline = IndicatorPipeline(
+            [
+                "moving_averages",
+                "ma_spreads",
+                "bollinguer_spreads",
+                "log_volatility",
+                "atr",
+                "rsi",
+                "ema_9",
+                "macd",
+            ]
+        )
+        result = pipeline.run(df)
+
+        assert result is df
+        for column in pipeline.columns:
+            np.testing.assert_allclose(
+                result[column],
+                expected[column],
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=column,
+            )
+
+    def test_shared_intermediates_are_computed_once(self):
+        pipeline = IndicatorPipeline(["ma_20", "bollinguer_spreads", "ATR"])
+
+        assert len(pipeline.plan) == len(set(pipeline.plan))
+        assert pipeline.plan.count(("prefix", "close")) == 1
+        # ma_20 and bb_mid resolve to the same rolling mean
+        assert pipeline.columns["ma_20"] == pipeline.columns["bb_mid"]
+        assert pipeline.plan.index(("prev_close",)) < pipeline.plan.index(
+            ("true_range",)
+        )
+
+    def test_nan_gaps_follow_rolling_min_periods(self):
+        df = create_sample_df(periods=60)
+        df.loc[30, "close"] = np.nan
+        expected = Indicators.bollinguer_spreads(
+            Indicators.moving_averages(df.copy(), period=7)
+        )
+
+        result = IndicatorPipeline(["ma_7", "bollinguer_spreads"]).run(df)
+
+        for column in ("ma_7", "bb_upper", "bb_mid", "bb_lower"):
+            np.testing.assert_allclose(
+                result[column], expected[column], rtol=1e-9, err_msg=column
+            )
+
+    def test_unknown_output(self):
+        with pytest.raises(ValueError, match="Unsupported pipeline output"):
+            IndicatorPipeline(["ichimoku"])
@@ -1,3 +1,4 @@
+import pytest
 import pandas as pd
 import numpy as np
 from pybinbot.shared.indicators import Indicators
@@ -214,6 +215,177 @@ class TestSupertrend:
         valid_dir = result["supertrend_dir"].dropna()
         assert set(valid_dir.unique()).issubset({-1, 0, 1})
 
+    def test_supertrend_matches_reference_loop(self):
+        """Test that the array kernel reproduces the row-by-row band ratchet."""
+        df = create_sample_df(periods=300)
+        df.loc[150:152, "close"] = np.nan
+        df = Indicators.atr(df, window=14, min_periods=14)
+        result = Indicators.set_supertrend(df.copy(), multiplier=3.0)
+
+        hl2 = (df["high"] + df["low"]) / 2
+        upperband = (hl2 + 3.0 * df["ATR"]).tolist()
+        lowerband = (hl2 - 3.0 * df["ATR"]).tolist()
+        close = df["close"].tolist()
+        final_upper = list(upperband)
+        final_lower = list(lowerband)
+        direction = [0] * len(df)
+        supertrend = [np.nan] * len(df)
+        for i in range(1, len(df)):
+            final_upper[i] = (
+                min(upperband[i], final_upper[i - 1])
+                if close[i - 1] <= final_upper[i - 1]
+                else upperband[i]
+            )
+            final_lower[i] = (
+                max(lowerband[i], final_lower[i - 1])
+                if close[i - 1] >= final_lower[i - 1]
+                else lowerband[i]
+            )
+            if close[i] > final_upper[i - 1]:
+                direction[i] = 1
+            elif close[i] < final_lower[i - 1]:
+                direction[i] = -1
+            else:
+                direction[i] = direction[i - 1]
+            supertrend[i] = final_lower[i] if direction[i] == 1 else final_upper[i]
+
+        np.testing.assert_array_equal(result["supertrend_dir"].to_numpy(), direction)
+        np.testing.assert_array_equal(result["supertrend"].to_numpy(), supertrend)
+
+
+class TestChannelIndicators:
+    def test_donchian_matches_rolling_extremes(self):
+        df = create_sample_df(periods=100)
+        result = Indicators.donchian(df.copy(), window=20)
+
+        upper = df["high"].rolling(20).max()
+        lower = df["low"].rolling(20).min()
+        np.testing.assert_allclose(result["donchian_upper"], upper)
+        np.testing.assert_allclose(result["donchian_lower"], lower)
+        np.testing.assert_allclose(result["donchian_mid"], (upper + lower) / 2)
+
+    def test_highest_lowest(self):
+        df = create_sample_df(periods=60)
+        result = Indicators.highest_lowest(df.copy(), window=10)
+
+        np.testing.assert_allclose(result["highest_high"], df["high"].rolling(10).max())
+        np.testing.assert_allclose(result["lowest_low"], df["low"].rolling(10).min())
+
+    def test_stochastic_and_williams_r(self):
+        df = create_sample_df(periods=100)
+        result = Indicators.williams_r(Indicators.stochastic(df.copy()))
+
+        highest = df["high"].rolling(14).max()
+        lowest = df["low"].rolling(14).min()
+        stoch_k = 100 * (df["close"] - lowest) / (highest - lowest)
+        np.testing.assert_allclose(result["stoch_k"], stoch_k)
+        np.testing.assert_allclose(
+            result["stoch_d"], stoch_k.rolling(3).mean(), rtol=1e-9
+        )
+        np.testing.assert_allclose(result["williams_r"], stoch_k - 100, atol=1e-9)
+
+
+class TestTwapVwap:
+    @staticmethod
+    def create_timed_df(periods=200):
+        df = create_sample_df(periods=periods)
+        open_time = 1_700_000_000_000 + np.arange(periods) * 900_000
+        # Drop a few candles so the close-to-close durations are uneven
+        keep = np.ones(periods, dtype=bool)
+        keep[[40, 41, 90]] = False
+        df["open_time"] = open_time
+        df["close_time"] = open_time + 899_999
+        return df[keep].reset_index(drop=True)
+
+    def test_twap_weights_closes_by_elapsed_time(self):
+        df = self.create_timed_df()
+        result = Indicators.set_twap(df.copy(), periods=10)
+
+        durations = df["close_time"].diff()
+        durations.iloc[0] = 900_000
+        expected = (df["close"] * durations).rolling(10).sum() / durations.rolling(
+            10
+        ).sum()
+        np.testing.assert_allclose(result["twap"], expected, rtol=1e-9)
+
+    def test_twap_does_not_depend_on_older_history(self):
+        df = self.create_timed_df()
+        full = Indicators.set_twap(df.copy(), periods=10)
+        recent = Indicators.set_twap(df.iloc[-50:].copy(), periods=10)
+
+        np.testing.assert_allclose(
+            recent["twap"].iloc[-20:], full["twap"].iloc[-20:], rtol=1e-9
+        )
+
+    @pytest.mark.parametrize("with_open_time", [True, False])
+    def test_tail_matches_full_across_gaps(self, with_open_time):
+        df = self.create_timed_df()
+        # A gap right before the rows a tail=3 window reads
+        df = df.drop(index=len(df) - 13).reset_index(drop=True)
+        if not with_open_time:
+            df = df.drop(columns="open_time")
+
+        for tail in (1, 3, 60):
+            full = Indicators.set_twap(df.copy(), periods=10)
+            result = Indicators.set_twap(df.copy(), periods=10, tail=tail)
+            np.testing.assert_allclose(
+                result["twap"].iloc[-tail:], full["twap"].iloc[-tail:], rtol=1e-12
+            )
+            full = Indicators.set_vwap(df.copy(), periods=10)
+            result = Indicators.set_vwap(df.copy(), periods=10, tail=tail)
+            np.testing.assert_allclose(
+                result["vwap"].iloc[-tail:], full["vwap"].iloc[-tail:], rtol=1e-12
+            )
+
+    def test_session_vwap_resets_every_utc_day(self):
+        df = self.create_timed_df()
+        result = Indicators.set_vwap(df.copy())
+
+        typical_price = (df["high"] + df["low"] + df["close"]) / 3
+        day = df["open_time"] // 86_400_000
+        expected = (typical_price * df["volume"]).groupby(day).cumsum() / df[
+            "volume"
+        ].groupby(day).cumsum()
+        np.testing.assert_allclose(result["vwap"], expected, rtol=1e-9)
+
+    def test_rolling_vwap(self):
+        df = self.create_timed_df()
+        result = Indicators.set_vwap(df.copy(), periods=20)
+
+        typical_price = (df["high"] + df["low"] + df["close"]) / 3
+        expected = (typical_price * df["volume"]).rolling(20).sum() / df[
+            "volume"
+        ].rolling(20).sum()
+        np.testing.assert_allclose(result["vwap"], expected, rtol=1e-9)
+
+
+class TestCompactFrames:
+    def test_indicator_columns_follow_float32_input(self):
+        df = create_sample_df(periods=200)
+        compact = df.astype({c: "float32" for c in ("open", "high", "low", "close")})
+
+        full = Indicators.atr(Indicators.rsi(Indicators.macd(df.copy())))
+        result = Indicators.atr(Indicators.rsi(Indicators.macd(compact)))
+
+        for col in ("macd", "macd_signal", "rsi", "ATR"):
+            assert result[col].dtype == np.float32
+            np.testing.assert_allclose(
+                result[col], full[col], rtol=1e-4, atol=1e-4, err_msg=col
+            )
+
+    def test_tail_mode_keeps_float32(self):
+        df = create_sample_df(periods=200)
+        compact = df.astype({c: "float32" for c in ("open", "high", "low", "close")})
+
+        result = Indicators.rsi(compact, tail=1)
+
+        assert result["rsi"].dtype == np.float32
+        assert result["rsi"].iloc[:-1].isna().all()
+
+    def test_float64_frames_are_unchanged(self):
+        df = Indicators.moving_averages(create_sample_df(), period=7)
+        assert df["ma_7"].dtype == np.float64
+
 
 class TestIntegration:
     def test_indicator_chain(self):
@@ -248,3 +420,73 @@ class TestIntegration:
 
         # Check dataframe is not empty
         assert len(df) > 0
+
+
+class TestTailMode:
+    @staticmethod
+    def _assert_tail_matches(full, tail_df, column, tail):
+        np.testing.assert_allclose(
+            tail_df[column].iloc[-tail:], full[column].iloc[-tail:], rtol=1e-8
+        )
+        assert tail_df[column].iloc[:-tail].isna().all()
+
+    def test_rolling_indicators_tail_matches_full(self):
+        df = create_sample_df(periods=1000)
+        cases = [
+            (lambda d, t: Indicators.moving_averages(d, period=25, tail=t), "ma_25"),
+            (lambda d, t: Indicators.rsi(d, tail=t), "rsi"),
+            (lambda d, t: Indicators.standard_rsi(d, tail=t), "rsi"),
+            (lambda d, t: Indicators.atr(d, tail=t), "ATR"),
+            (lambda d, t: Indicators.bollinguer_spreads(d, tail=t), "bb_upper"),
+            (lambda d, t: Indicators.bollinguer_spreads(d, tail=t), "bb_lower"),
+            (lambda d, t: Indicators.log_volatility(d, tail=t), "perc_volatility"),
+            (lambda d, t: Indicators.donchian(d, tail=t), "donchian_mid"),
+            (lambda d, t: Indicators.stochastic(d, tail=t), "stoch_d"),
+            (lambda d, t: Indicators.williams_r(d, tail=t), "williams_r"),
+        ]
+        for compute, column in cases:
+            full = compute(df.copy(), None)
+            for tail in (1, 5):
+                self._assert_tail_matches(full, compute(df.copy(), tail), column, tail)
+
+    def test_ewm_indicators_tail_matches_full(self):
+        df = create_sample_df(periods=1000)
+        full = Indicators.macd(Indicators.ema(df.copy(), span=21))
+        tail = Indicators.macd(Indicators.ema(df.copy(), span=21, tail=3), tail=3)
+
+        for column in ("ema_21", "macd", "macd_signal"):
+            self._assert_tail_matches(full, tail, column, 3)
+
+    def test_supertrend_tail_matches_full(self):
+        df = Indicators.atr(create_sample_df(periods=1000))
+        full = Indicators.set_supertrend(df.copy())
+        tail = Indicators.set_supertrend(df.copy(), tail=2)
+
+        self._assert_tail_matches(full, tail, "supertrend", 2)
+        assert tail["supertrend_dir"].iloc[-2:].tolist() == (
+            full["supertrend_dir"].iloc[-2:].tolist()
+        )
+        assert (tail["supertrend_dir"].iloc[:-2] == 0).all()
+
+    def test_tail_longer_than_frame_computes_everything(self):
+        df = create_sample_df(periods=30)
+        full = Indicators.moving_averages(df.copy(), period=7)
+        tail = Indicators.moving_averages(df.copy(), period=7, tail=100)
+
+        pd.testing.assert_series_equal(full["ma_7"], tail["ma_7"])
+
+    def test_mfi_uses_latest_window(self):
+        df = create_sample_df(periods=500)
+        typical_price = (df["high"] + df["low"] + df["close"]) / 3
+        flow = typical_price * df["volume"]
+        change = typical_price.diff()
+        positive = flow.where(change > 0, 0.0).iloc[-14:].sum()
+        negative = flow.where(change < 0, 0.0).iloc[-14:].sum()
+
+        expected = 100 - 100 / (1 + positive / negative)
+        assert np.isclose(Indicators.mfi(df), expected)
+
+    def test_invalid_tail(self):
+        df = create_sample_df()
+        with pytest.raises(ValueError, match="tail must be a positive"):
+            Indicators.rsi(df, tail=0)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybinbot.shared import kernels
+
+
+def create_close(periods=500, seed=5, gaps=False):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100 + np.cumsum(rng.normal(0, 0.5, periods)))
+    if gaps:
+        close[rng.uniform(size=periods) < 0.03] = np.nan
+    return close
+
+
+def assert_matches(result, expected, rtol=1e-9):
+    np.testing.assert_allclose(result, np.asarray(expected, dtype=float), rtol=rtol)
+
+
+class TestRollingKernels:
+    @pytest.mark.parametrize("gaps", [False, True])
+    def test_rolling_matches_pandas(self, gaps):
+        close = create_close(gaps=gaps)
+
+        assert_matches(kernels.rolling_sum(close, 20), close.rolling(20).sum())
+        assert_matches(kernels.rolling_mean(close, 20), close.rolling(20).mean())
+        assert_matches(kernels.rolling_std(close, 20), close.rolling(20).std())
+        assert_matches(
+            kernels.rolling_mean(close, 20, min_periods=1),
+            close.rolling(20, min_periods=1).mean(),
+        )
+
+    def test_rolling_std_long_history(self):
+        rng = np.random.default_rng(3)
+        periods = 35_000
+        close = np.linspace(60_000, 5_000, periods) + rng.normal(0, 20, periods)
+        flat_ends = []
+        for start in range(1_000, periods - 20, 1_500):
+            close[start : start + 20] = 20_000.0
+            flat_ends.append(start + 19)
+
+        result = kernels.rolling_std(close, 20)
+
+        # Two-pass reference (pandas itself leaves residue on flat windows)
+        windows = np.lib.stride_tricks.sliding_window_view(close, 20)
+        np.testing.assert_allclose(
+            result[19:], windows.std(axis=1, ddof=1), rtol=1e-7, atol=1e-9
+        )
+        assert (result[flat_ends] == 0).all()
+
+    def test_out_buffer_is_filled_in_place(self):
+        close = create_close()
+        out = np.empty(len(close))
+
+        result = kernels.rolling_mean(close, 7, out=out)
+
+        assert result is out
+        assert_matches(out, close.rolling(7).mean())
+
+    def test_out_buffer_shape_is_checked(self):
+        with pytest.raises(ValueError, match="out buffer"):
+            kernels.rolling_mean(np.ones(5), 2, out=np.empty(4))
+
+
+class TestEwmKernel:
+    @pytest.mark.parametrize("adjust", [True, False])
+    @pytest.mark.parametrize("min_periods", [0, 12])
+    def test_matches_pandas(self, adjust, min_periods):
+        close = pd.concat([pd.Series([np.nan] * 3), create_close()], ignore_index=True)
+
+        assert_matches(
+            kernels.ewm_mean(close, 26, adjust=adjust, min_periods=min_periods),
+            close.ewm(span=26, adjust=adjust, min_periods=min_periods).mean(),
+        )
+
+    def test_interior_gaps_fall_back_to_pandas(self):
+        close = create_close(gaps=True)
+
+        assert_matches(
+            kernels.ewm_mean(close, 9, adjust=False),
+            close.ewm(span=9, adjust=False).mean(),
+        )
+
+
+class TestPriceKernels:
+    def test_true_range_skips_missing_previous_close(self):
+        high = np.array([10.0, 12.0, 11.0])
+        low = np.array([8.0, 9.0, 10.5])
+        close = np.array([9.0, 11.5, 10.8])
+
+        result = kernels.true_range(high, low, close)
+
+        np.testing.assert_allclose(result, [2.0, 3.0, 1.0])
+
+    def test_money_flow_index_defaults_to_100_during_warmup(self):
+        close = create_close(periods=30).to_numpy()
+        volume = np.full(len(close), 10.0)
+
+        result = kernels.money_flow_index(close + 1, close - 1, close, volume, 14)
+
+        assert (result[:13] == 100).all()
+        assert ((result >= 0) & (result <= 100)).all()
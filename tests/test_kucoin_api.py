@@ -1,9 +1,12 @@
+from collections import OrderedDict
+from datetime import datetime
 from types import SimpleNamespace
 
 import pytest
 
 from pybinbot.apis.kucoin.base import KucoinApi
 from pybinbot.apis.kucoin.futures import KucoinFutures
+from pybinbot.apis.kucoin.market import KucoinMarket
 
 
 def test_get_ticker_price_raises_clear_error_when_price_is_missing():
@@ -65,3 +68,63 @@ def test_cancel_futures_order_uses_standard_order_cancel_by_id():
 
     assert result is expected
     assert captured["request"].order_id == "entry-order-1"
+
+
+class _FakeNow:
+    now_ms = 1_780_185_600_000
+
+    @classmethod
+    def now(cls):
+        return datetime.fromtimestamp(cls.now_ms / 1000)
+
+
+@pytest.fixture
+def market(monkeypatch):
+    api = object.__new__(KucoinMarket)
+    monkeypatch.setattr(KucoinMarket, "_klines_cache", OrderedDict())
+    monkeypatch.setattr("pybinbot.apis.kucoin.market.datetime", _FakeNow)
+    calls = []
+
+    def fake_request(symbol, interval, start_time, end_time):
+        calls.append((symbol, start_time, end_time))
+        rows = []
+        for open_time in range(start_time, end_time + 1, 900_000):
+            # The candle at end_time is still forming; its close keeps moving
+            rows.append([open_time, "1", "2", "0.5", str(_FakeNow.now_ms), "10"])
+        return rows
+
+    monkeypatch.setattr(api, "_request_klines", fake_request)
+    api.calls = calls
+    return api
+
+
+def test_get_ui_klines_fetches_only_new_candles_after_boundary(market):
+    _FakeNow.now_ms = 1_780_185_600_000
+    first = market.get_ui_klines("BTC-USDT", "15min", limit=4)
+    assert market.get_ui_klines("BTC-USDT", "15min", limit=4) == first
+    assert len(market.calls) == 1
+
+    _FakeNow.now_ms += 900_000
+    second = market.get_ui_klines("BTC-USDT", "15min", limit=4)
+
+    boundary = _FakeNow.now_ms
+    assert market.calls[-1] == ("BTC-USDT", boundary - 900_000, boundary)
+    assert [row[0] for row in second] == [
+        boundary - i * 900_000 for i in range(4, -1, -1)
+    ]
+    # The formerly forming candle was refreshed
+    assert second[-2][4] == str(boundary)
+
+
+def test_get_ui_klines_cache_is_bounded_lru(market, monkeypatch):
+    _FakeNow.now_ms = 1_780_185_600_000
+    monkeypatch.setattr(KucoinMarket, "klines_cache_size", 2)
+    market.get_ui_klines("A-USDT", "15min", limit=4)
+    market.get_ui_klines("B-USDT", "15min", limit=4)
+    market.get_ui_klines("A-USDT", "15min", limit=4)
+    market.get_ui_klines("C-USDT", "15min", limit=4)
+
+    assert list(KucoinMarket._klines_cache) == [
+        ("A-USDT", "15min", 4),
+        ("C-USDT", "15min", 4),
+    ]
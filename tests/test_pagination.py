@@ -0,0 +1,158 @@
+import threading
+from typing import Any
+
+import numpy as np
+import pytest
+
+from pybinbot.apis.binance.base import BinanceApi
+from pybinbot.apis.kucoin.futures import KucoinFutures
+from pybinbot.apis.kucoin.market import KucoinMarket
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.pagination import (
+    fetch_klines_range,
+    interval_to_ms,
+    klines_frame,
+    merge_klines,
+    page_ranges,
+)
+from pybinbot.shared.rate_limit import WeightBudget
+
+BASE_TIME = 1_780_185_600_000
+INTERVAL_MS = 900_000
+
+
+def rows_between(start, end, width=7, limit=None):
+    """Rows for open times in [start, end] (inclusive, like the exchanges)."""
+    rows = []
+    open_time = start - start % INTERVAL_MS
+    while open_time <= end:
+        price = open_time / INTERVAL_MS % 1000
+        row = [open_time, price, price + 1, price - 1, price + 0.5, 10.0]
+        row.append(open_time + INTERVAL_MS - 1)
+        row.extend([1000.0, 5, 1.0, 2.0][: width - 7])
+        rows.append(row)
+        open_time += INTERVAL_MS
+    return rows[:limit]
+
+
+class TestPaginationHelpers:
+    def test_page_ranges(self):
+        pages = page_ranges(
+            BASE_TIME + 5, BASE_TIME + 25 * INTERVAL_MS, INTERVAL_MS, 10
+        )
+
+        assert pages == [
+            (BASE_TIME, BASE_TIME + 10 * INTERVAL_MS),
+            (BASE_TIME + 10 * INTERVAL_MS, BASE_TIME + 20 * INTERVAL_MS),
+            (BASE_TIME + 20 * INTERVAL_MS, BASE_TIME + 25 * INTERVAL_MS),
+        ]
+        assert page_ranges(BASE_TIME, BASE_TIME, INTERVAL_MS, 10) == []
+
+    def test_merge_klines_dedupes_by_open_time(self):
+        first = rows_between(BASE_TIME, BASE_TIME + 2 * INTERVAL_MS)
+        second = rows_between(BASE_TIME + 2 * INTERVAL_MS, BASE_TIME + 3 * INTERVAL_MS)
+        second[0] = [*second[0][:4], 99.0, *second[0][5:]]
+
+        merged = merge_klines([second, first])
+
+        assert [row[0] for row in merged] == [
+            BASE_TIME + i * INTERVAL_MS for i in range(4)
+        ]
+        # The later page wins
+        assert merged[2] is first[2]
+
+    def test_fetch_klines_range_runs_pages_concurrently(self):
+        running = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(3, timeout=2)
+
+        def fetch_page(start, end):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            barrier.wait()
+            with lock:
+                running["now"] -= 1
+            # Overlap the next page by one candle
+            return rows_between(start, end)
+
+        rows = fetch_klines_range(
+            fetch_page, BASE_TIME, BASE_TIME + 30 * INTERVAL_MS, INTERVAL_MS, 10, 3
+        )
+
+        assert running["peak"] == 3
+        assert [row[0] for row in rows] == [
+            BASE_TIME + i * INTERVAL_MS for i in range(30)
+        ]
+
+    def test_klines_frame_is_typed(self):
+        df = klines_frame(
+            ExchangeId.BINANCE, rows_between(BASE_TIME, BASE_TIME, width=11)
+        )
+
+        assert df["open_time"].dtype == np.int64
+        assert df["close"].dtype == np.float64
+        assert df.index.name == "timestamp"
+        assert klines_frame(ExchangeId.KUCOIN, []).empty
+
+    def test_interval_to_ms(self):
+        assert interval_to_ms("15m") == interval_to_ms("15min") == INTERVAL_MS
+        assert interval_to_ms("1w") == 7 * interval_to_ms("1d") == 604_800_000
+        with pytest.raises(ValueError):
+            interval_to_ms("1M")
+
+
+class TestExchangeRanges:
+    def test_binance(self, monkeypatch: Any) -> None:
+        api = BinanceApi("key", "secret")
+        api.weight_budget = WeightBudget()
+        api.klines_page_size = 100
+        calls = []
+
+        def get_ui_klines(symbol, interval, limit=500, start_time=None, end_time=None):
+            calls.append((start_time, end_time))
+            return rows_between(start_time, end_time, width=11, limit=limit)
+
+        monkeypatch.setattr(api, "get_ui_klines", get_ui_klines)
+
+        df = api.get_klines_range(
+            "BTCUSDC", "15m", BASE_TIME, BASE_TIME + 350 * INTERVAL_MS
+        )
+
+        assert len(calls) == 4
+        assert len(df) == 350
+        assert df["open_time"].is_monotonic_increasing
+        assert api.weight_budget.spent == 8
+
+    def test_kucoin_market(self, monkeypatch: Any) -> None:
+        api = object.__new__(KucoinMarket)
+        api.klines_page_size = 100
+        monkeypatch.setattr(
+            api,
+            "_request_klines",
+            lambda symbol, interval, start, end: rows_between(start, end, width=8),
+        )
+
+        df = api.get_klines_range(
+            "BTC-USDT", "15min", BASE_TIME, BASE_TIME + 250 * INTERVAL_MS
+        )
+
+        assert len(df) == 250
+        assert df["quote_asset_volume"].eq(1000.0).all()
+
+    def test_kucoin_futures(self, monkeypatch: Any) -> None:
+        api = object.__new__(KucoinFutures)
+        monkeypatch.setattr(
+            api,
+            "get_klines",
+            lambda symbol, interval, limit, start_time, end_time: rows_between(
+                start_time, end_time, limit=limit
+            ),
+        )
+
+        df = api.get_klines_range(
+            "XBTUSDTM", "15min", BASE_TIME, BASE_TIME + 1200 * INTERVAL_MS
+        )
+
+        assert len(df) == 1200
+        assert df["open_time"].diff().dropna().eq(INTERVAL_MS).all()
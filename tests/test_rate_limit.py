@@ -0,0 +1,154 @@
+import asyncio
+import threading
+
+import pytest
+
+from pybinbot.apis.binance.exceptions import RateLimited
+from pybinbot.shared.rate_limit import WeightBudget, request_cost
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestWeightBudget:
+    def test_acquire_until_capacity(self):
+        budget = WeightBudget(limit=10, headroom=1, clock=FakeClock())
+
+        assert budget.acquire(6)
+        assert not budget.acquire(6, timeout=0)
+        assert budget.acquire(4, timeout=0)
+        assert budget.available == 0
+
+    def test_reported_weight_reduces_budget(self):
+        budget = WeightBudget(limit=100, headroom=0.5, clock=FakeClock())
+
+        budget.observe({"x-mbx-used-weight-1m": "45"})
+
+        assert budget.available == 5
+        assert not budget.acquire(10, timeout=0)
+        budget.observe({})
+        assert budget.used == 45
+
+    def test_spent_weight_counts_without_headers(self):
+        budget = WeightBudget(limit=10, headroom=1, clock=FakeClock())
+
+        for _ in range(5):
+            budget.acquire(2)
+            budget.release(2)
+
+        assert budget.spent == 10
+        assert not budget.acquire(1, timeout=0)
+
+    def test_new_minute_resets_budget(self):
+        clock = FakeClock(59.0)
+        budget = WeightBudget(limit=10, headroom=1, clock=clock)
+        budget.observe({"x-mbx-used-weight-1m": "10"})
+        assert budget.available == 0
+
+        clock.now = 60.5
+
+        assert budget.available == 10
+
+    def test_waits_for_next_window(self):
+        budget = WeightBudget(limit=2, headroom=1, window_s=0.2)
+        budget.acquire(2)
+        budget.release(2)
+        acquired = threading.Event()
+
+        def waiter():
+            budget.acquire(1, timeout=5)
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        thread.join(1)
+
+        assert acquired.is_set()
+        assert budget.spent == 0
+
+    def test_oversized_request(self):
+        with pytest.raises(ValueError):
+            WeightBudget(limit=10, headroom=1).acquire(11)
+
+    def test_try_acquire_returns_wait(self):
+        clock = FakeClock(10.0)
+        budget = WeightBudget(limit=10, headroom=1, clock=clock)
+
+        assert budget.try_acquire(8) == 0
+        assert budget.try_acquire(4) == pytest.approx(50)
+        assert budget.in_flight == 8
+
+    def test_acquire_async(self):
+        budget = WeightBudget(limit=4, headroom=1, poll_s=0.01)
+        budget.acquire(4)
+
+        async def main():
+            waiter = asyncio.ensure_future(budget.acquire_async(2, timeout=5))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            # Spent weight still counts until the window rolls over
+            budget.release(4)
+            budget.spent = 0
+            return await waiter
+
+        assert asyncio.run(main())
+        assert not asyncio.run(budget.acquire_async(4, timeout=0.05))
+
+
+class TestRateLimitChecks:
+    def test_headroom_is_left_to_checked_requests(self):
+        budget = WeightBudget(limit=10, headroom=0.5, clock=FakeClock())
+        budget.observe({"x-mbx-used-weight-1m": "8"})
+
+        # Bulk work waits, a low-weight request still goes out
+        assert not budget.acquire(1, timeout=0)
+        budget.check(2)
+        with pytest.raises(RateLimited) as exc_info:
+            budget.check(3)
+        assert exc_info.value.retry_after == pytest.approx(60)
+
+    def test_ban_blocks_everything_until_retry_after(self):
+        clock = FakeClock(100.0)
+        budget = WeightBudget(clock=clock)
+
+        budget.observe({"Retry-After": "30"}, status_code=429)
+
+        with pytest.raises(RateLimited) as exc_info:
+            budget.check(1)
+        assert exc_info.value.retry_after == pytest.approx(30)
+        assert budget.try_acquire(1) == pytest.approx(30)
+        clock.now = 131.0
+        budget.check(1)
+        assert budget.try_acquire(1) == 0
+
+    def test_order_count(self):
+        clock = FakeClock(5.0)
+        budget = WeightBudget(order_limit=3, clock=clock)
+        budget.observe({"x-mbx-order-count-10s": "3"})
+
+        budget.check(1)
+        with pytest.raises(RateLimited) as exc_info:
+            budget.check(1, orders=1)
+        assert exc_info.value.retry_after == pytest.approx(5)
+        clock.now = 10.0
+        budget.check(1, orders=1)
+
+    def test_request_cost(self):
+        base = "https://api.binance.com"
+
+        assert request_cost("GET", f"{base}/api/v3/exchangeInfo") == (20, 0)
+        assert request_cost("GET", f"{base}/api/v3/ticker/24hr") == (80, 0)
+        assert request_cost(
+            "GET", f"{base}/api/v3/ticker/24hr", {"symbol": "BTCUSDC"}
+        ) == (2, 0)
+        assert request_cost("GET", f"{base}/api/v3/openOrders?symbol=BTCUSDC") == (
+            6,
+            0,
+        )
+        assert request_cost("POST", f"{base}/api/v3/order?symbol=BTCUSDC") == (1, 1)
+        assert request_cost("GET", f"{base}/sapi/v1/margin/isolated/account") == (0, 0)
@@ -0,0 +1,130 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybinbot.models.signals import KlineProduceModel
+from pybinbot.shared.candles import Candles, pandas_interval
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.resampler import MultiTimeframeResampler
+
+BASE_TIME = 1_780_185_600_000  # UTC midnight
+INTERVAL_MS = 900_000
+
+
+def create_candles(count=300, seed=4):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    rows = []
+    for i in range(count):
+        open_time = BASE_TIME + i * INTERVAL_MS
+        rows.append(
+            {
+                "open_time": open_time,
+                "open": close[i] - 0.1,
+                "high": close[i] + rng.uniform(0.1, 1.0),
+                "low": close[i] - rng.uniform(0.1, 1.0),
+                "close": close[i],
+                "volume": rng.uniform(10, 50),
+                "close_time": open_time + INTERVAL_MS - 1,
+                "quote_asset_volume": rng.uniform(1000, 5000),
+            }
+        )
+    return rows
+
+
+def resample_reference(rows, interval):
+    candles = Candles(ExchangeId.BINANCE, [])
+    df = candles._set_time_index(pd.DataFrame(rows))
+    return candles.resample(df, interval)
+
+
+class TestMultiTimeframeResampler:
+    def test_completed_bars_match_candles_resample(self):
+        rows = create_candles()
+        resampler = MultiTimeframeResampler()
+        for row in rows:
+            resampler.update(row)
+
+        for interval in resampler.interval_ms:
+            expected = resample_reference(rows, interval)
+            result = resampler.frame(interval)
+            # The trailing bucket is still open in the stream
+            expected = expected.iloc[: len(result)]
+            assert len(result) >= len(expected) - 1 > 0
+            pd.testing.assert_frame_equal(
+                result, expected[result.columns], check_dtype=False, check_freq=False
+            )
+
+    def test_bar_is_emitted_when_boundary_closes(self):
+        resampler = MultiTimeframeResampler(intervals=("1h",))
+        rows = create_candles(count=5)
+
+        emitted = [resampler.update(row) for row in rows]
+
+        assert [bool(bars) for bars in emitted] == [False, False, False, True, False]
+        bar = emitted[3]["1h"]
+        assert bar["open"] == rows[0]["open"]
+        assert bar["close"] == rows[3]["close"]
+        assert bar["high"] == max(row["high"] for row in rows[:4])
+        assert bar["volume"] == pytest.approx(sum(row["volume"] for row in rows[:4]))
+
+    def test_gap_completes_previous_bucket(self):
+        resampler = MultiTimeframeResampler(intervals=("1h",))
+        rows = create_candles(count=8)
+        resampler.update(rows[0])
+
+        emitted = resampler.update(rows[5])
+
+        assert emitted["1h"]["close"] == rows[0]["close"]
+        assert resampler.partial["1h"]["open"] == rows[5]["open"]
+
+    def test_duplicate_candles_are_ignored(self):
+        resampler = MultiTimeframeResampler(intervals=("1h",))
+        row = create_candles(count=1)[0]
+        resampler.update(row)
+        resampler.update(row)
+
+        assert resampler.partial["1h"]["volume"] == row["volume"]
+
+    def test_update_from_kline(self):
+        resampler = MultiTimeframeResampler(intervals=("30min",))
+        kline = KlineProduceModel(
+            symbol="BTCUSDC",
+            open_time=str(BASE_TIME + INTERVAL_MS),
+            close_time=str(BASE_TIME + 2 * INTERVAL_MS - 1),
+            open_price="1.0",
+            close_price="2.0",
+            high_price="3.0",
+            low_price="0.5",
+            volume=4.0,
+        )
+
+        emitted = resampler.update_from_kline(kline.model_dump())
+
+        assert emitted["30min"]["quote_asset_volume"] == 8.0
+
+    def test_minimum_interval(self):
+        with pytest.raises(ValueError, match="less than the minimum"):
+            MultiTimeframeResampler(intervals=("5min",))
+
+    def test_binance_intervals_map_to_pandas_aliases(self):
+        assert pandas_interval("1d") == "1D"
+        assert pandas_interval("15m") == "15min"
+        assert pandas_interval("30min") == "30min"
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            resampler = MultiTimeframeResampler()
+
+        assert resampler.interval_ms["1d"] == 86_400_000
+
+    def test_ingest_frame_returns_completed_bars(self):
+        rows = create_candles(count=200)
+        resampler = MultiTimeframeResampler(intervals=("4h", "1d"))
+
+        completed = resampler.ingest_frame(pd.DataFrame(rows))
+
+        assert len(completed["4h"]) == 200 // 16
+        assert len(completed["1d"]) == 200 // 96
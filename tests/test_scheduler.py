@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from pybinbot.apis.binance.base import BinanceApi
+from pybinbot.apis.binance.exceptions import RateLimited
+from pybinbot.apis.kucoin.futures import KucoinFutures
+from pybinbot.shared.rate_limit import WeightBudget
+from pybinbot.shared.scheduler import (
+    Priority,
+    RequestScheduler,
+    ScheduledApi,
+    binance_lane,
+    lane,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def occupy(scheduler: RequestScheduler) -> tuple[threading.Event, threading.Thread]:
+    """Hold every slot of *scheduler* until the returned event is set."""
+    release = threading.Event()
+    threads = [
+        threading.Thread(
+            target=scheduler.run,
+            args=(Priority.MARKET_DATA, 1, release.wait),
+        )
+        for _ in range(scheduler.max_concurrent)
+    ]
+    for thread in threads:
+        thread.start()
+    wait_until(lambda: scheduler.running == scheduler.max_concurrent)
+    return release, threads[0]
+
+
+class TestRequestScheduler:
+    def test_critical_skips_the_queue(self) -> None:
+        scheduler = RequestScheduler(WeightBudget(), max_concurrent=1)
+        release, holder = occupy(scheduler)
+
+        started = time.monotonic()
+        assert scheduler.run(Priority.CRITICAL, 1, lambda: "cancelled") == "cancelled"
+        assert time.monotonic() - started < 0.05
+
+        release.set()
+        holder.join()
+        assert scheduler.running == 0
+
+    def test_weighted_fair_queuing(self) -> None:
+        scheduler = RequestScheduler(WeightBudget(), max_concurrent=1, poll_s=0.01)
+        release, holder = occupy(scheduler)
+        order: list[Priority] = []
+        threads = []
+        for priority in [Priority.RESEARCH] * 4 + [Priority.ACCOUNT] * 4:
+            thread = threading.Thread(
+                target=scheduler.run, args=(priority, 1, order.append, priority)
+            )
+            thread.start()
+            threads.append(thread)
+            wait_until(
+                lambda queued=len(threads): sum(scheduler.queued.values()) == queued
+            )
+
+        release.set()
+        for thread in [holder, *threads]:
+            thread.join()
+
+        # Account has 4x the research share, research still gets served
+        assert order[:3] == [Priority.ACCOUNT] * 3
+        assert order[-2:] == [Priority.RESEARCH] * 2
+        assert order.count(Priority.RESEARCH) == 4
+
+    def test_bulk_lanes_are_shed_first(self) -> None:
+        budget = WeightBudget(limit=100, clock=FakeClock())
+        budget.observe({"x-mbx-used-weight-1m": "70"})
+        scheduler = RequestScheduler(budget)
+
+        with pytest.raises(RateLimited) as exc_info:
+            scheduler.run(Priority.RESEARCH, 1, lambda: None)
+        assert exc_info.value.retry_after == pytest.approx(60)
+        assert scheduler.run(Priority.MARKET_DATA, 1, lambda: "ok") == "ok"
+        with pytest.raises(RateLimited):
+            scheduler.run(Priority.MARKET_DATA, 20, lambda: None)
+        assert scheduler.run(Priority.ACCOUNT, 20, lambda: "ok") == "ok"
+        assert scheduler.shed == {Priority.RESEARCH: 1, Priority.MARKET_DATA: 1}
+
+    def test_run_async(self) -> None:
+        scheduler = RequestScheduler(WeightBudget(), max_concurrent=2, poll_s=0.01)
+        state = {"running": 0, "peak": 0}
+
+        async def fetch(value: int) -> int:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+            return value
+
+        async def main() -> list[int]:
+            return await asyncio.gather(
+                *(
+                    scheduler.run_async(Priority.MARKET_DATA, 1, fetch, value)
+                    for value in range(6)
+                )
+            )
+
+        assert asyncio.run(main()) == list(range(6))
+        assert state["peak"] == 2
+        assert scheduler.running == 0
+
+
+class TestLanes:
+    def test_binance_lane(self) -> None:
+        base = BinanceApi.BASE
+
+        assert binance_lane("POST", f"{base}/api/v3/order?signature=x") == (
+            Priority.CRITICAL
+        )
+        assert binance_lane("GET", f"{base}/api/v3/order?signature=x") == (
+            Priority.ACCOUNT
+        )
+        assert binance_lane("GET", f"{base}/sapi/v1/margin/isolated/account") == (
+            Priority.ACCOUNT
+        )
+        assert binance_lane("GET", BinanceApi.candlestick_url) == Priority.MARKET_DATA
+
+    def test_binance_requests_use_lanes(self, monkeypatch: Any) -> None:
+        calls: list[str] = []
+
+        def send(url, method, session, payload, weight, orders, **kwargs):
+            calls.append(method)
+            return {"price": "1"}
+
+        budget = WeightBudget(limit=100, clock=FakeClock())
+        budget.observe({"x-mbx-used-weight-1m": "70"})
+        api = BinanceApi("key", "secret")
+        api.weight_budget = budget
+        api.scheduler = RequestScheduler(budget)
+        monkeypatch.setattr(api, "_send", send)
+
+        assert api.get_ticker_price("BTCUSDC") == 1.0
+        with lane(Priority.RESEARCH):
+            with pytest.raises(RateLimited):
+                api.get_ticker_price("BTCUSDC")
+            # Orders stay critical
+            api.request(f"{api.order_url}?symbol=BTCUSDC", method="DELETE")
+        assert calls == ["GET", "DELETE"]
+
+    def test_kucoin_sdk_calls_are_scheduled(self) -> None:
+        budget = WeightBudget(limit=100, window_s=30, clock=FakeClock())
+        scheduler = RequestScheduler(budget)
+        futures = object.__new__(KucoinFutures)
+        futures.futures_order_api = SimpleNamespace(add_order=lambda req: req)
+        futures.futures_market_api = SimpleNamespace(get_ticker=lambda req: req)
+
+        futures.schedule_apis(scheduler)
+        futures.check_rate_limit("35", "get_klines")
+
+        assert isinstance(futures.futures_order_api, ScheduledApi)
+        assert futures.futures_order_api.add_order("order") == "order"
+        # 65 of 100 used: market data still goes, research is shed
+        assert futures.futures_market_api.get_ticker("ticker") == "ticker"
+        with lane(Priority.RESEARCH), pytest.raises(RateLimited):
+            futures.futures_market_api.get_ticker("ticker")
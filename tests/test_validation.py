@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandera.errors import SchemaErrors
+
+from pybinbot.shared.candles import Candles
+from pybinbot.shared.enums import ExchangeId
+from pybinbot.shared.pipeline import IndicatorPipeline
+from pybinbot.shared import validation
+from pybinbot.shared.validation import (
+    ValidationMode,
+    ValidationPolicy,
+    check_structure,
+    get_validation_policy,
+    set_validation_policy,
+    validate_klines,
+)
+
+
+def create_frame(rows=20, dtype="float64"):
+    close = np.linspace(100, 120, rows)
+    return pd.DataFrame(
+        {
+            "open": close - 0.5,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.full(rows, 10.0),
+        }
+    ).astype(dtype)
+
+
+def raw_rows(count=5):
+    base = 1_780_236_900_000
+    return [
+        [
+            base + i * 900_000,
+            "1.0",
+            "2.0",
+            "0.5",
+            "1.5",
+            "10.0",
+            base + (i + 1) * 900_000 - 1,
+        ]
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def policy():
+    previous = get_validation_policy()
+    yield
+    set_validation_policy(previous)
+
+
+class TestValidationPolicy:
+    def test_first_n_per_key(self):
+        policy = ValidationPolicy(ValidationMode.FIRST_N, first_n=2)
+
+        decisions = [policy.should_validate("BTC") for _ in range(3)]
+
+        assert decisions == [True, True, False]
+        assert policy.should_validate("ETH")
+        policy.reset()
+        assert policy.should_validate("BTC")
+
+    def test_sampled_rate(self):
+        policy = ValidationPolicy(ValidationMode.SAMPLED, rate=0.25, seed=1)
+
+        sampled = sum(policy.should_validate() for _ in range(4000))
+
+        assert 800 < sampled < 1200
+        assert not ValidationPolicy(ValidationMode.SAMPLED, rate=0).should_validate()
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("KLINE_VALIDATION", "first_n:3")
+
+        policy = ValidationPolicy.from_env()
+
+        assert policy.mode == ValidationMode.FIRST_N
+        assert policy.first_n == 3
+        assert ValidationPolicy.from_env("sampled:0.5").rate == 0.5
+        assert ValidationPolicy.from_env("always").mode == ValidationMode.ALWAYS
+
+    @pytest.mark.parametrize("value", ["bogus", "first_n:x", "sampled:2"])
+    def test_bad_env_value_falls_back_to_default(self, monkeypatch, caplog, value):
+        monkeypatch.setenv("KLINE_VALIDATION", value)
+
+        with caplog.at_level("WARNING"):
+            policy = validation._policy_from_env()
+
+        assert policy.mode == ValidationMode.OFF
+        assert "KLINE_VALIDATION" in caplog.text
+
+    def test_default_is_off(self):
+        assert ValidationPolicy().mode == ValidationMode.OFF
+
+
+class TestValidateKlines:
+    def test_structure_check_rejects_missing_and_non_numeric_columns(self):
+        df = create_frame()
+        with pytest.raises(ValueError, match="Missing required OHLC columns"):
+            check_structure(df.drop(columns=["volume"]))
+
+        df["close"] = df["close"].astype(str)
+        with pytest.raises(ValueError, match="non-numeric dtype"):
+            check_structure(df)
+
+    def test_full_validation_only_for_selected_frames(self):
+        df = create_frame()
+        df.loc[3, "close"] = np.nan
+        policy = ValidationPolicy(ValidationMode.FIRST_N, first_n=1)
+
+        with pytest.raises(SchemaErrors):
+            validate_klines(df, key="BTC", policy=policy)
+        # Later frames of the same symbol only get the structural check
+        validate_klines(df, key="BTC", policy=policy)
+
+    def test_off_skips_every_check(self):
+        validate_klines(
+            create_frame().drop(columns=["volume"]), policy=ValidationPolicy()
+        )
+
+    def test_compact_frames_pass_full_validation(self):
+        policy = ValidationPolicy(ValidationMode.ALWAYS)
+
+        validate_klines(create_frame(dtype="float32"), policy=policy)
+
+    def test_entry_points_respect_process_policy(self, policy):
+        set_validation_policy(ValidationPolicy(ValidationMode.ALWAYS))
+
+        df = Candles(ExchangeId.KUCOIN, raw_rows(), symbol="BTC-USDT").pre_process()
+        IndicatorPipeline(["ma_7"]).run(df, key="BTC-USDT")
+
+        with pytest.raises(ValueError, match="Missing required OHLC columns"):
+            IndicatorPipeline(["ma_7"]).run(create_frame().drop(columns=["volume"]))